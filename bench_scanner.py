@@ -0,0 +1,199 @@
+# bench_scanner.py
+"""
+Benchmark offline sus scanner atas korpus lokal (bench_corpus/): waktu per kontrak & per detector (p50/p99),
+peak memory, dan perbandingan temuan + waktu dengan baseline. Tidak ada akses jaringan.
+
+    python bench_scanner.py                      # jalankan & bandingkan dengan bench_corpus/baseline.json
+    python bench_scanner.py --update-baseline    # simpan hasil sekarang sebagai baseline
+Exit code 1 kalau temuan berubah atau p50 kontrak lebih lambat dari baseline x --max-slowdown.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import sus_scanner
+from detector_registry import KIND_SOURCE
+from sol_index import SolidityIndex, _skip_group
+from source_files import project_files
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_corpus")
+ELEMENTARY_PREFIXES = ("address", "bool", "string", "bytes", "uint", "int")
+PARAM_SKIP = {"memory", "calldata", "storage", "payable", "indexed"}
+
+
+# --- KORPUS ---
+def load_corpus(corpus_dir: str) -> Dict[str, Any]:
+    """*.sol = source flattened; *.json = respons explorer ({"SourceCode": ...}) atau standard-JSON langsung."""
+    corpus = {}
+    for name in sorted(os.listdir(corpus_dir)):
+        path = os.path.join(corpus_dir, name)
+        if name.endswith(".sol"):
+            with open(path, encoding="utf-8") as fh: corpus[name] = fh.read()
+        elif name.endswith(".json") and name != "baseline.json":
+            with open(path, encoding="utf-8") as fh: data = json.load(fh)
+            corpus[name] = data.get("SourceCode", data) if isinstance(data, dict) else data
+    return corpus
+
+
+def _abi_type(type_tokens: List[str]) -> str:
+    base = type_tokens[0] if type_tokens else ""
+    suffix = "".join(t for t in type_tokens[1:] if t in ("[", "]") or t.isdigit())
+    if not base.startswith(ELEMENTARY_PREFIXES): base = "address"   # tipe kontrak/interface di ABI = address
+    return base + suffix
+
+
+def derive_abi(source: Any) -> List[Dict]:
+    """ABI perkiraan dari source: function public/external di contract (bukan interface), cukup untuk klasifikasi ABI."""
+    abi = []
+    for f in project_files(source, known=frozenset())[0]:
+        index = SolidityIndex(f.content)
+        interfaces = {c.name for c in index.contracts if c.kind == "interface"}
+        by_start = {t.start: i for i, t in enumerate(index.tokens)}
+        for fn in index.functions:
+            if fn.kind != "function" or fn.visibility not in ("public", "external") or fn.contract in interfaces: continue
+            i = by_start[fn.start] + 2
+            end = _skip_group(index.tokens, i, "(", ")")
+            inputs, current = [], []
+            for t in index.tokens[i + 1:end - 1] + [None]:
+                if t is None or t.text == ",":
+                    words = [x for x in current if x not in PARAM_SKIP]
+                    if words: inputs.append({"type": _abi_type(words[:-1] if len(words) > 1 and words[-1] != "]" else words)})
+                    current = []
+                else: current.append(t.text)
+            abi.append({"type": "function", "name": fn.name, "inputs": inputs})
+    return abi
+
+
+# --- PENGUKURAN ---
+def _timed(bucket: Dict[str, float], name: str, fn: Callable, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    bucket[name] += time.perf_counter() - t0
+    return out
+
+
+def run_stages(abi: List[Dict], source: Any) -> Tuple[List[str], Dict[str, float]]:
+    """Jalur yang sama dengan scan_source, tapi tiap tahap/detector diukur terpisah."""
+    t: Dict[str, float] = defaultdict(float)
+    files, _ = _timed(t, "split", project_files, source)
+    findings = []
+    for f in files:
+        facts = _timed(t, "facts", sus_scanner.collect_facts, f.content)
+        admin_vars = _timed(t, "admin_vars", sus_scanner._admin_vars, facts)
+        critical, fee_tax = [], []
+        if not admin_vars:
+            for d in sus_scanner.DETECTORS.enabled(KIND_SOURCE): _timed(t, d.name, d.func, facts, critical, fee_tax)
+        findings.append(sus_scanner.FileFindings(tuple(sorted(admin_vars)), tuple(critical), tuple(fee_tax)))
+    result = _timed(t, "combine", sus_scanner.combine_findings, abi, findings)
+    for f in files:
+        _timed(t, "extra_patterns", sus_scanner.extra_scan_source_patterns, f.content, [], [])
+    return result, dict(t)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values: return 0.0
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[k]
+
+
+def bench_contract(source: Any, runs: int) -> Dict[str, Any]:
+    abi = derive_abi(source)
+    # Temuan diambil dari API publik, bukan dari run_stages, supaya perubahan di jalur produksi ikut tertangkap
+    findings = sus_scanner.scan_source(abi, source)
+    extra = []
+    for f in project_files(source)[0]: sus_scanner.extra_scan_source_patterns(f.content, extra, [])
+
+    tracemalloc.start()
+    sus_scanner.scan_source(abi, source)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    totals: List[float] = []
+    stages: Dict[str, List[float]] = defaultdict(list)
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        _, stage_times = run_stages(abi, source)
+        totals.append(time.perf_counter() - t0)
+        for name, secs in stage_times.items(): stages[name].append(secs)
+    size = sum(len(f.content) for f in project_files(source)[0])
+    return {
+        "bytes": size,
+        "findings": findings,
+        "extra": extra,
+        "p50_ms": percentile(totals, 50) * 1000,
+        "p99_ms": percentile(totals, 99) * 1000,
+        "peak_kb": peak / 1024,
+        "stages": {name: {"p50_ms": percentile(v, 50) * 1000, "p99_ms": percentile(v, 99) * 1000} for name, v in stages.items()},
+    }
+
+
+# --- LAPORAN ---
+def print_report(results: Dict[str, Dict[str, Any]]):
+    print(f"{'contract':<32} {'bytes':>8} {'p50 ms':>9} {'p99 ms':>9} {'peak KB':>9} {'findings':>8}")
+    for name, r in results.items():
+        print(f"{name:<32} {r['bytes']:>8} {r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f} {r['peak_kb']:>9.0f} {len(r['findings']):>8}")
+    per_stage: Dict[str, List[float]] = defaultdict(list)
+    for r in results.values():
+        for stage, v in r["stages"].items(): per_stage[stage].append(v["p50_ms"])
+    print(f"\n{'detector':<20} {'sum p50 ms':>11} {'max p50 ms':>11}")
+    for stage, v in sorted(per_stage.items(), key=lambda kv: -sum(kv[1])):
+        print(f"{stage:<20} {sum(v):>11.3f} {max(v):>11.3f}")
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], max_slowdown: float) -> List[str]:
+    problems = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if base is None: problems.append(f"{name}: not in baseline"); continue
+        for key in ("findings", "extra"):
+            if r[key] != base.get(key):
+                added = [m for m in r[key] if m not in base.get(key, [])]
+                removed = [m for m in base.get(key, []) if m not in r[key]]
+                problems.append(f"{name}: {key} changed (+{added} -{removed})" if added or removed else f"{name}: {key} order changed")
+        if base.get("p50_ms") and r["p50_ms"] > base["p50_ms"] * max_slowdown:
+            problems.append(f"{name}: p50 {r['p50_ms']:.2f} ms > {max_slowdown:.1f}x baseline {base['p50_ms']:.2f} ms")
+    for name in baseline:
+        if name not in results: problems.append(f"{name}: missing from corpus")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmark for the sus source scanner")
+    parser.add_argument("--corpus", default=CORPUS_DIR)
+    parser.add_argument("--baseline", default=None, help="default: <corpus>/baseline.json")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--max-slowdown", type=float, default=1.5, help="gagal kalau p50 > baseline x faktor ini (waktu tergantung mesin)")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", help="tulis hasil lengkap ke file JSON")
+    args = parser.parse_args(argv)
+
+    baseline_path = args.baseline or os.path.join(args.corpus, "baseline.json")
+    results = {name: bench_contract(source, args.runs) for name, source in load_corpus(args.corpus).items()}
+    print_report(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh: json.dump(results, fh, indent=1, ensure_ascii=False)
+    if args.update_baseline:
+        keep = ("bytes", "findings", "extra", "p50_ms")
+        with open(baseline_path, "w", encoding="utf-8") as fh:
+            json.dump({n: {k: r[k] for k in keep} for n, r in results.items()}, fh, indent=1, ensure_ascii=False)
+            fh.write("\n")
+        print(f"\nBaseline written to {baseline_path}")
+        return 0
+    if not os.path.exists(baseline_path):
+        print(f"\nNo baseline at {baseline_path}; run with --update-baseline first")
+        return 0
+    with open(baseline_path, encoding="utf-8") as fh: baseline = json.load(fh)
+    problems = compare(results, baseline, args.max_slowdown)
+    print("\n" + ("\n".join(f"REGRESSION {p}" for p in problems) if problems else "OK: findings match baseline, no slowdown"))
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
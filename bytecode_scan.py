@@ -0,0 +1,72 @@
+# bytecode_scan.py
+
+from typing import Dict, List, Optional, Tuple
+
+from selector_db import SelectorDB
+from sus_scanner import combine_findings
+
+# --- OPCODE ---
+PUSH1, PUSH4, PUSH32 = 0x60, 0x63, 0x7f
+DUP2 = 0x81
+EQ, GT, LT = 0x14, 0x11, 0x10
+DISPATCH_CMP = {EQ, GT, LT}   # solc: `PUSH4 sel EQ` (match) / `PUSH4 sel GT` (split binary search), kadang diselingi DUP2
+
+SELECTOR_DB = SelectorDB()
+
+
+def _strip_metadata(code: bytes) -> bytes:
+    """Buang CBOR metadata solc di ekor bytecode (2 byte terakhir = panjang metadata)."""
+    if len(code) < 2: return code
+    meta_len = int.from_bytes(code[-2:], "big")
+    if 0 < meta_len + 2 <= len(code) and 0xa1 <= code[-meta_len - 2] <= 0xa5: return code[:-meta_len - 2]
+    return code
+
+
+def extract_selectors(code_hex: str) -> List[bytes]:
+    """Selector dari dispatcher: PUSH4 yang langsung dibandingkan (EQ/GT/LT). Data PUSH dilewati supaya tidak salah baca."""
+    try: code = bytes.fromhex(code_hex[2:] if code_hex.startswith("0x") else code_hex)
+    except (ValueError, AttributeError): return []
+    code = _strip_metadata(code)
+    ops: List[Tuple[int, bytes]] = []
+    i, n = 0, len(code)
+    while i < n:
+        op = code[i]
+        if PUSH1 <= op <= PUSH32:
+            size = op - PUSH1 + 1
+            ops.append((op, code[i + 1:i + 1 + size])); i += 1 + size
+        else:
+            ops.append((op, b"")); i += 1
+    seen: Dict[bytes, None] = {}
+    for k, (op, data) in enumerate(ops):
+        if op != PUSH4 or len(data) != 4 or data in (b"\x00\x00\x00\x00", b"\xff\xff\xff\xff"): continue
+        nxt = ops[k + 1][0] if k + 1 < len(ops) else None
+        if nxt == DUP2 and k + 2 < len(ops): nxt = ops[k + 2][0]
+        if nxt in DISPATCH_CMP: seen.setdefault(data, None)
+    return list(seen)
+
+
+def _abi_entry(signature: str) -> Dict:
+    name, _, params = signature.partition("(")
+    types = [t for t in params.rstrip(")").split(",") if t]
+    return {"type": "function", "name": name, "inputs": [{"type": t} for t in types]}
+
+
+def recover_abi(selectors: List[bytes], db: Optional[SelectorDB] = None) -> Tuple[List[Dict], List[bytes]]:
+    """Return (ABI sintetis dari selector yang dikenal, selector yang tidak dikenal)."""
+    db = SELECTOR_DB if db is None else db
+    abi, unknown = [], []
+    for sel in selectors:
+        sigs = db.lookup(sel)
+        if sigs: abi.extend(_abi_entry(s) for s in sigs)
+        else: unknown.append(sel)
+    return abi, unknown
+
+
+def scan_bytecode(code_hex: str) -> List[str]:
+    """Klasifikasi fee/setter/address-permission dari bytecode (tanpa source/ABI), sama dengan scan ABI terverifikasi."""
+    selectors = extract_selectors(code_hex)
+    if not selectors: return []
+    abi, unknown = recover_abi(selectors)
+    out = [m for m in combine_findings(abi, []) if not m.startswith("🟢 No suspicious")]
+    out.append(f"🟡 Bytecode: {len(selectors)} function selectors, {len(unknown)} unknown")
+    return out
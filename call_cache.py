@@ -0,0 +1,92 @@
+# call_cache.py
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# --- KONFIGURASI CACHE ETH_CALL ---
+CALL_CACHE_BLOCKS = int(os.getenv("CALL_CACHE_BLOCKS", "6"))                  # Hasil dipakai ulang dalam bucket N block (~10s/block)
+CALL_CACHE_TTL = float(os.getenv("CALL_CACHE_TTL", "90"))                     # Batas umur absolut (detik), jaga-jaga kalau block tidak maju
+CALL_CACHE_MAX_ENTRIES = int(os.getenv("CALL_CACHE_MAX_ENTRIES", "20000"))    # LRU: entry paling lama tidak dipakai dibuang duluan
+
+MISS = object()
+Bucket = Tuple[int, int]   # (jumlah reorg yang sudah terdeteksi, block_number // blocks)
+
+
+class CallCache:
+    """
+    Cache hasil eth_call read-only dengan key (contract, calldata, block bucket).
+    - Bucket = (jumlah reorg, block_number // blocks), jadi hasil dipakai ulang selama chain belum maju `blocks` block.
+    - Pindah bucket membuang semua entry bucket lain. Block source (BlockNumberTracker) membandingkan hash block,
+      jadi reorg (termasuk yang tingginya sama) menaikkan `reorgs` dan mem-flush cache, sedangkan node pool yang
+      cuma tertinggal beberapa block (hash sama) tidak.
+    - Tanpa block number (tracker belum pernah berhasil), cache di-bypass.
+    """
+
+    def __init__(self, block_source, blocks: int = CALL_CACHE_BLOCKS, ttl: float = CALL_CACHE_TTL, max_entries: int = CALL_CACHE_MAX_ENTRIES):
+        self.block_source = block_source
+        self.blocks = max(1, blocks)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, bytes, Bucket], Tuple[float, Any]]" = OrderedDict()
+        self._bucket: Optional[Bucket] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reorg_flushes = 0
+
+    # --- Block bucket ---
+    def _observe(self, block_number: Optional[int], reorgs: int = 0) -> Optional[Bucket]:
+        if block_number is None: return None
+        bucket = (reorgs, block_number // self.blocks)
+        with self._lock:
+            if bucket != self._bucket:
+                if self._bucket is not None and reorgs != self._bucket[0]: self.reorg_flushes += 1
+                # Entry dari bucket lain tidak akan pernah hit lagi (atau tidak aman dipakai setelah reorg)
+                for key in [k for k in self._entries if k[2] != bucket]: del self._entries[key]
+                self._bucket = bucket
+        return bucket
+
+    async def current_bucket(self) -> Optional[Bucket]:
+        number = await self.block_source.get()
+        return self._observe(number, self.block_source.reorgs)
+
+    # --- Lookup ---
+    def get(self, target: str, calldata: bytes, bucket: Optional[Bucket]) -> Any:
+        if bucket is None: return MISS
+        key = (target, calldata, bucket)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                if entry is not None: del self._entries[key]
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, target: str, calldata: bytes, bucket: Optional[Bucket], value: Any):
+        # None = call revert / RPC gagal; jangan di-cache supaya dicoba lagi di scan berikutnya
+        if bucket is None or value is None: return
+        with self._lock:
+            if bucket != self._bucket: return
+            self._entries[(target, calldata, bucket)] = (time.monotonic(), value)
+            self._entries.move_to_end((target, calldata, bucket))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "evictions": self.evictions,
+            "reorg_flushes": self.reorg_flushes,
+            "bucket_blocks": self.blocks,
+        }
@@ -0,0 +1,112 @@
+# detector_registry.py
+
+import os
+import time
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# --- KONFIGURASI DETECTOR ---
+# Nama detector dipisah koma, mis. DISABLED_DETECTORS=kill_window,short_revert (lihat /padiscanstats untuk daftar nama)
+DISABLED_DETECTORS = frozenset(n.strip() for n in os.getenv("DISABLED_DETECTORS", "").split(",") if n.strip())
+
+SEVERITIES = ("critical", "warning", "info")
+KIND_SOURCE = "source"   # detector(facts, critical_msgs, fee_tax_msgs), jalan di worker scan_pool per file
+KIND_EXTRA = "extra"     # detector(facts, sus_list, detailed_flags), jalan di extra_scan_source_patterns
+
+
+class Detector:
+    """Satu heuristik scanner + metadata dan counter (dijumlah di proses utama)."""
+
+    __slots__ = ("name", "func", "kind", "severity", "description", "runs", "hits", "total_s", "max_s")
+
+    def __init__(self, name: str, func: Callable, kind: str, severity: str, description: str):
+        self.name = name
+        self.func = func
+        self.kind = kind
+        self.severity = severity
+        self.description = description
+        self.runs = 0
+        self.hits = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def record(self, seconds: float, hits: int):
+        self.runs += 1
+        self.hits += hits
+        self.total_s += seconds
+        if seconds > self.max_s: self.max_s = seconds
+
+    def snapshot(self, enabled: bool) -> Dict[str, Any]:
+        return {
+            "name": self.name, "kind": self.kind, "severity": self.severity, "enabled": enabled,
+            "runs": self.runs, "hits": self.hits,
+            "avg_ms": round(self.total_s / self.runs * 1000, 3) if self.runs else 0.0,
+            "max_ms": round(self.max_s * 1000, 3), "total_ms": round(self.total_s * 1000, 1),
+        }
+
+
+class DetectorRegistry:
+    """
+    Registry heuristik sus scanner. Detector didaftarkan lewat decorator `register`, urutan daftar = urutan
+    pesan di output. `run` mengukur waktu + apakah detector menambah pesan (hit); counter di-update lewat
+    `record` supaya hasil dari worker process (dikirim balik di FileFindings.stats) bisa dijumlah di proses utama.
+    """
+
+    def __init__(self, disabled: Iterable[str] = DISABLED_DETECTORS):
+        self._detectors: Dict[str, Detector] = {}
+        self.disabled = set(disabled)
+
+    def register(self, name: str, severity: str = "critical", kind: str = KIND_SOURCE, description: str = ""):
+        if severity not in SEVERITIES: raise ValueError(f"Unknown severity {severity!r} for detector {name!r}")
+        if name in self._detectors: raise ValueError(f"Detector {name!r} registered twice")
+
+        def decorator(func: Callable) -> Callable:
+            doc = description or (func.__doc__ or "").strip().split("\n")[0]
+            self._detectors[name] = Detector(name, func, kind, severity, doc)
+            return func
+        return decorator
+
+    def get(self, name: str) -> Optional[Detector]:
+        return self._detectors.get(name)
+
+    def detectors(self, kind: Optional[str] = None) -> List[Detector]:
+        return [d for d in self._detectors.values() if kind is None or d.kind == kind]
+
+    def enabled(self, kind: str) -> List[Detector]:
+        return [d for d in self._detectors.values() if d.kind == kind and d.name not in self.disabled]
+
+    def set_enabled(self, name: str, enabled: bool):
+        """Hanya berlaku di proses ini; untuk worker scan_pool pakai env DISABLED_DETECTORS."""
+        if name not in self._detectors: raise KeyError(name)
+        (self.disabled.discard if enabled else self.disabled.add)(name)
+
+    def config_key(self) -> str:
+        """Bagian dari salt cache: hasil scan dengan set detector berbeda tidak boleh tertukar."""
+        return ",".join(sorted(self.disabled & set(self._detectors)))
+
+    @staticmethod
+    def run(detector: Detector, facts, *outputs: list) -> Tuple[float, int]:
+        """Jalankan satu detector; return (detik, 1 kalau detector menambah pesan ke output, selain itu 0)."""
+        before = sum(len(o) for o in outputs if o is not None)
+        t0 = time.perf_counter()
+        try:
+            detector.func(facts, *outputs)
+        except Exception as e:
+            # Satu heuristik yang crash tidak boleh menggagalkan scan; detector lain tetap jalan
+            logging.warning(f"Detector {detector.name} failed: {type(e).__name__}: {e}")
+        return time.perf_counter() - t0, int(sum(len(o) for o in outputs if o is not None) > before)
+
+    def record(self, stats: Iterable[Tuple[str, float, int]]):
+        for name, seconds, hits in stats:
+            d = self._detectors.get(name)
+            if d is not None: d.record(seconds, hits)
+
+    def snapshot(self, top: int = 5) -> Dict[str, Any]:
+        rows = [d.snapshot(d.name not in self.disabled) for d in self._detectors.values()]
+        ran = [r for r in rows if r["runs"]]
+        return {
+            "detectors": rows,
+            "slowest": sorted(ran, key=lambda r: -r["avg_ms"])[:top],
+            "most_hits": sorted((r for r in ran if r["hits"]), key=lambda r: -r["hits"])[:top],
+            "disabled": sorted(self.disabled & set(self._detectors)),
+        }
@@ -0,0 +1,228 @@
+# dexscreener.py
+
+import os
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import httpx
+
+# --- KONFIGURASI DEXSCREENER ---
+DEXSCREENER_BASE_URL = "https://api.dexscreener.com"
+DEXSCREENER_CHAIN_ID = "pulsechain"
+# Limit resmi endpoint pairs/tokens: 300 request/menit. Default di bawahnya supaya burst + refill tetap < 300 per 60 detik
+DEXSCREENER_RATE_PER_MIN = float(os.getenv("DEXSCREENER_RATE_PER_MIN", "270"))
+DEXSCREENER_BURST = int(os.getenv("DEXSCREENER_BURST", "10"))
+DEXSCREENER_MAX_WAIT = float(os.getenv("DEXSCREENER_MAX_WAIT", "5"))           # Detik maksimal antre token; lewat ini lookup gagal (fallback subgraph)
+DEXSCREENER_CACHE_TTL = float(os.getenv("DEXSCREENER_CACHE_TTL", "30"))       # Detik respons (termasuk "tidak ada pair") dipakai ulang
+DEXSCREENER_CACHE_MAX_ENTRIES = int(os.getenv("DEXSCREENER_CACHE_MAX_ENTRIES", "5000"))
+DEXSCREENER_BATCH_WINDOW = float(os.getenv("DEXSCREENER_BATCH_WINDOW", "0.05"))   # Detik lookup token dikumpulkan sebelum dikirim
+DEXSCREENER_MAX_BATCH = 30            # Batas alamat comma-separated per request /tokens/v1
+DEXSCREENER_DEFAULT_RETRY_AFTER = 60.0  # Pause kalau 429 tanpa header Retry-After
+
+ClientGetter = Callable[[str], httpx.AsyncClient]
+
+
+class TokenBucket:
+    """Token bucket async: `rate_per_min` token/menit, maksimal `burst` sekaligus. Waiter dilayani FIFO."""
+
+    def __init__(self, rate_per_min: float = DEXSCREENER_RATE_PER_MIN, burst: int = DEXSCREENER_BURST):
+        self.rate = max(rate_per_min, 1.0) / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self.waits = 0
+        self.rejected = 0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, max_wait: float = DEXSCREENER_MAX_WAIT) -> bool:
+        """Ambil satu token; False kalau token baru tersedia lebih lama dari `max_wait` detik."""
+        if self._lock is None: self._lock = asyncio.Lock()
+        deadline = time.monotonic() + max_wait
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+                if now + wait > deadline:
+                    self.rejected += 1
+                    return False
+                self.waits += 1
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Setelah 429: tidak ada request sampai `seconds` lewat, lalu mulai lagi dari bucket kosong."""
+        now = time.monotonic()
+        self._refill(now)
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = 0.0
+
+    @property
+    def available(self) -> float:
+        self._refill(time.monotonic())
+        return self.tokens
+
+
+def _retry_after(response: httpx.Response) -> float:
+    try: return max(1.0, float(response.headers.get("retry-after", "")))
+    except ValueError: return DEXSCREENER_DEFAULT_RETRY_AFTER
+
+
+class DexscreenerClient:
+    """
+    Client Dexscreener dengan rate limit dan batching:
+    - Semua request lewat satu TokenBucket, jadi saat launch spike bot antre di bawah limit, bukan kena 429.
+      Kalau tetap kena 429, bucket di-pause sesuai Retry-After.
+    - `token_pairs` dari beberapa handler dalam `batch_window` detik digabung jadi satu
+      GET /tokens/v1/{chain}/{a,b,c} (maks 30 alamat); lookup yang sama sedang jalan ikut menunggu hasilnya.
+    - Respons di-cache `cache_ttl` detik per alamat token/pair (list kosong = tidak ada pair, ikut di-cache).
+    Hasil None = request gagal (rate limit, HTTP error); caller pakai fallback, dan None tidak di-cache.
+    """
+
+    def __init__(self, get_client: ClientGetter, base_url: str = DEXSCREENER_BASE_URL, chain_id: str = DEXSCREENER_CHAIN_ID,
+                 bucket: Optional[TokenBucket] = None, cache_ttl: float = DEXSCREENER_CACHE_TTL,
+                 batch_window: float = DEXSCREENER_BATCH_WINDOW, max_batch: int = DEXSCREENER_MAX_BATCH):
+        self.get_client = get_client
+        self.base_url = base_url.rstrip("/")
+        self.chain_id = chain_id
+        self.bucket = bucket or TokenBucket()
+        self.cache_ttl = cache_ttl
+        self.batch_window = batch_window
+        self.max_batch = max(1, min(max_batch, DEXSCREENER_MAX_BATCH))
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._flush_scheduled = False
+        self.requests = 0
+        self.lookups = 0
+        self.cache_hits = 0
+        self.throttled = 0
+        self.failures = 0
+
+    # --- Cache ---
+    def _cache_get(self, key: str) -> Any:
+        entry = self._cache.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.cache_ttl: return None
+        self._cache.move_to_end(key)
+        self.cache_hits += 1
+        return entry[1]
+
+    def _cache_put(self, key: str, value: Any):
+        self._cache[key] = (time.monotonic(), value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > DEXSCREENER_CACHE_MAX_ENTRIES: self._cache.popitem(last=False)
+
+    # --- HTTP ---
+    async def _get_json(self, url: str) -> Any:
+        """GET lewat rate limiter; None kalau tidak dapat slot, 429, atau error lain."""
+        if not await self.bucket.acquire():
+            self.failures += 1
+            logging.warning(f"Dexscreener rate limiter full, skipping {url}")
+            return None
+        self.requests += 1
+        try:
+            r = await self.get_client(url).get(url)
+        except Exception as e:
+            self.failures += 1
+            logging.debug(f"Dexscreener GET error for {url}: {type(e).__name__}: {e}")
+            return None
+        if r.status_code == 429:
+            self.throttled += 1
+            pause = _retry_after(r)
+            self.bucket.pause(pause)
+            logging.warning(f"Dexscreener throttled (429), pausing {pause:.0f}s")
+            return None
+        if r.status_code != 200:
+            self.failures += 1
+            logging.warning(f"Dexscreener failed for {url}: Status {r.status_code}")
+            return None
+        try: return r.json()
+        except ValueError:
+            self.failures += 1
+            return None
+
+    # --- Batch lookup per token ---
+    async def token_pairs(self, token: str) -> Optional[List[Dict[str, Any]]]:
+        """Semua pair Dexscreener untuk `token` (list kosong kalau tidak ada), None kalau request gagal."""
+        token = token.lower()
+        self.lookups += 1
+        cached = self._cache_get(f"token:{token}")
+        if cached is not None: return cached
+        fut = self._inflight.get(token) or self._pending.get(token)
+        if fut is None:
+            loop = asyncio.get_running_loop()
+            fut = loop.create_future()
+            self._pending[token] = fut
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_later(self.batch_window, self._flush)
+        return await asyncio.shield(fut)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        self._inflight.update(pending)
+        tokens = list(pending)
+        for i in range(0, len(tokens), self.max_batch):
+            chunk = tokens[i:i + self.max_batch]
+            asyncio.ensure_future(self._send_tokens(chunk, [pending[t] for t in chunk]))
+
+    async def _send_tokens(self, tokens: List[str], futures: List[asyncio.Future]):
+        result: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        try:
+            data = await self._get_json(f"{self.base_url}/tokens/v1/{self.chain_id}/{','.join(tokens)}")
+            if isinstance(data, list):
+                result = {t: [] for t in tokens}
+                for pair in data:
+                    if not isinstance(pair, dict): continue
+                    if pair.get("pairAddress"): self._cache_put(f"pair:{pair['pairAddress'].lower()}", [pair])
+                    for side in ("baseToken", "quoteToken"):
+                        addr = ((pair.get(side) or {}).get("address") or "").lower()
+                        if addr in result: result[addr].append(pair)
+                for t, pairs in result.items(): self._cache_put(f"token:{t}", pairs)
+        except Exception as e:
+            logging.warning(f"Dexscreener token batch of {len(tokens)} failed: {type(e).__name__}: {e}")
+        finally:
+            for t, fut in zip(tokens, futures):
+                if self._inflight.get(t) is fut: del self._inflight[t]
+                if not fut.done(): fut.set_result(result.get(t) if result is not None else None)
+
+    # --- Lookup per pair ---
+    async def pair(self, pair_address: str, token: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Data satu pair. Kalau `token` diketahui, diambil dari batch /tokens/v1 (pair-nya ikut ter-cache);
+        endpoint /latest/dex/pairs (satu pair per request) hanya dipakai kalau pair tidak ada di situ.
+        """
+        pair_address = pair_address.lower()
+        cached = self._cache_get(f"pair:{pair_address}")
+        if cached is not None: return cached[0] if cached else None
+        if token:
+            pairs = await self.token_pairs(token)
+            for p in pairs or []:
+                if (p.get("pairAddress") or "").lower() == pair_address: return p
+        data = await self._get_json(f"{self.base_url}/latest/dex/pairs/{self.chain_id}/{pair_address}")
+        if not isinstance(data, dict): return None
+        pairs = data.get("pairs") or ([data["pair"]] if data.get("pair") else [])
+        self._cache_put(f"pair:{pair_address}", pairs[:1])
+        return pairs[0] if pairs else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "lookups": self.lookups,
+            "cache_hits": self.cache_hits,
+            "throttled": self.throttled,
+            "failures": self.failures,
+            "rate_waits": self.bucket.waits,
+            "rate_rejected": self.bucket.rejected,
+            "tokens_available": round(self.bucket.available, 1),
+        }
@@ -0,0 +1,156 @@
+# fuzzy_names.py
+
+import os
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# --- KONFIGURASI KORPUS NAMA SCAM ---
+# Satu entry per baris: "<kategori> <nama>" (nama dibandingkan lowercase, tanpa underscore di depan).
+# Nama berawalan "=" hanya cocok persis (isblocked tidak boleh menangkap isLocked).
+SCAM_NAMES_PATH = os.getenv("SCAM_NAMES_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "scam_names.txt"))
+MAX_DISTANCE = 3
+# Kategori yang tidak boleh fuzzy: satu-dua huruf bisa membalik arti (setBalance vs getBalance/resetBalance,
+# increaseSupply vs decreaseSupply). Nama harus sama persis dengan pola, atau pola + sufiks pendek (setBalanceOf, addSupplyTo);
+# sufiks lain (setBalanceThreshold) tidak dihitung.
+PREFIX_ONLY_CATEGORIES = frozenset({"hidden_mint"})
+PREFIX_SUFFIXES = ("", "s", "of", "for", "to")
+
+
+def allowed_distance(pattern: str) -> int:
+    """Toleransi typo per panjang pola: nama pendek harus persis (ddsa, bots), nama panjang boleh beda 3 huruf."""
+    n = len(pattern)
+    if n <= 4: return 0
+    if n <= 7: return 1
+    if n <= 12: return 2
+    return MAX_DISTANCE
+
+
+def normalize_name(name: str) -> str:
+    return name.lstrip("_").lower()
+
+
+def bounded_levenshtein(a: str, b: str, bound: int) -> int:
+    """
+    Edit distance yang hanya menghitung diagonal selebar `bound` (banded DP) dan berhenti begitu
+    seluruh baris > bound. Return nilai persis kalau <= bound, selain itu bound + 1.
+    """
+    if a == b: return 0
+    la, lb = len(a), len(b)
+    if abs(la - lb) > bound: return bound + 1
+    if la > lb: a, b, la, lb = b, a, lb, la
+    over = bound + 1
+    prev = list(range(lb + 1))
+    for i in range(1, la + 1):
+        lo, hi = max(1, i - bound), min(lb, i + bound)
+        curr = [over] * (lb + 1)
+        curr[0] = i
+        row_min = i if lo == 1 else over
+        ca = a[i - 1]
+        for j in range(lo, hi + 1):
+            v = prev[j - 1] + (ca != b[j - 1])
+            if prev[j] + 1 < v: v = prev[j] + 1
+            if curr[j - 1] + 1 < v: v = curr[j - 1] + 1
+            curr[j] = v
+            if v < row_min: row_min = v
+        if row_min > bound: return over
+        prev = curr
+    return prev[lb] if prev[lb] <= bound else over
+
+
+class _Node:
+    __slots__ = ("word", "payloads", "children", "max_edge")
+
+    def __init__(self, word: str, payload):
+        self.word = word
+        self.payloads = [payload]
+        self.children: Dict[int, "_Node"] = {}
+        self.max_edge = 0
+
+
+class BKTree:
+    """BK-tree atas edit distance: query radius k hanya mengunjungi cabang dengan |d(node) - edge| <= k."""
+
+    def __init__(self):
+        self._root: Optional[_Node] = None
+        self.size = 0
+
+    def add(self, word: str, payload=None):
+        self.size += 1
+        if self._root is None: self._root = _Node(word, payload); return
+        node = self._root
+        while True:
+            d = bounded_levenshtein(word, node.word, max(len(word), len(node.word)))
+            if d == 0: node.payloads.append(payload); return
+            child = node.children.get(d)
+            if child is None:
+                node.children[d] = _Node(word, payload)
+                node.max_edge = max(node.max_edge, d)
+                return
+            node = child
+
+    def search(self, word: str, radius: int) -> List[Tuple[int, str, list]]:
+        out = []
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            # Jarak di atas max_edge + radius tidak perlu persis: tidak ada child yang bisa lolos
+            d = bounded_levenshtein(word, node.word, node.max_edge + radius)
+            if d <= radius: out.append((d, node.word, node.payloads))
+            for edge, child in node.children.items():
+                if d - radius <= edge <= d + radius: stack.append(child)
+        out.sort()
+        return out
+
+
+class NameMatch(NamedTuple):
+    category: str
+    pattern: str
+    distance: int
+
+
+class ScamNameIndex:
+    def __init__(self, entries: Iterable[Tuple[str, str]] = ()):
+        self.tree = BKTree()
+        self.prefix_patterns: Dict[str, List[str]] = {}
+        self.exact_names: Dict[str, List[str]] = {}
+        for category, name in entries: self.add(category, name)
+
+    def add(self, category: str, name: str):
+        if name.startswith("="): self.exact_names.setdefault(normalize_name(name[1:]), []).append(category)
+        elif category in PREFIX_ONLY_CATEGORIES: self.prefix_patterns.setdefault(category, []).append(normalize_name(name))
+        else: self.tree.add(normalize_name(name), category)
+
+    def match(self, name: str, categories: Optional[Iterable[str]] = None) -> List[NameMatch]:
+        """Semua pola korpus dalam toleransi masing-masing, terdekat dulu (kategori prefix-only: pola terpanjang dulu)."""
+        wanted = set(categories) if categories is not None else None
+        norm = normalize_name(name)
+        out = [NameMatch(cat, norm, 0) for cat in dict.fromkeys(self.exact_names.get(norm, ())) if wanted is None or cat in wanted]
+        for cat, patterns in self.prefix_patterns.items():
+            if wanted is not None and cat not in wanted: continue
+            hits = sorted((p for p in patterns if norm.startswith(p) and norm[len(p):] in PREFIX_SUFFIXES), key=len, reverse=True)
+            out.extend(NameMatch(cat, p, len(norm) - len(p)) for p in hits)
+        if wanted is not None and wanted <= PREFIX_ONLY_CATEGORIES: return out
+        for d, pattern, cats in self.tree.search(norm, MAX_DISTANCE):
+            if d > allowed_distance(pattern): continue
+            for cat in dict.fromkeys(cats):
+                if wanted is None or cat in wanted: out.append(NameMatch(cat, pattern, d))
+        return out
+
+    def best(self, name: str, category: str) -> Optional[NameMatch]:
+        matches = self.match(name, (category,))
+        return matches[0] if matches else None
+
+
+def load_scam_names(path: str = SCAM_NAMES_PATH) -> ScamNameIndex:
+    entries = []
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                parts = line.split("#", 1)[0].split()
+                if len(parts) >= 2: entries.append((parts[0], parts[1]))
+    except OSError as e:
+        logging.warning(f"Scam name corpus not loaded ({path}): {e}")
+    return ScamNameIndex(entries)
+
+
+SCAM_NAMES = load_scam_names()
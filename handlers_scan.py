@@ -1,7 +1,5 @@
-import re
 import json
 import asyncio
-import httpx
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from telegram import Update
@@ -11,251 +9,105 @@ from web3.exceptions import InvalidAddress
 # Import resources dari utils yang dibersihkan
 from utils import (
     w3,
+    aw3,
+    wait_rpc_ready,
+    get_address_state,
+    HTTP_CLIENTS,
+    CALL_CACHE,
+    RPC_BATCHER,
+    TAX_SIM_CACHE,
+    TAX_SIM_BEST_LP_ONLY,
+    VERIFY_STORE,
+    SCAN_POOL,
+    PRICE_ENGINE,
+    PAIR_INDEX,
+    DEXSCREENER,
     PULSESCAN_API_BASE_URL,
     PULSESCAN_API_KEY,
     SOURCIFY_REPO,
     HONEY_V1_ADDRESS,
     HONEY_V2_ADDRESS,
-    HONEY_ABI_MINIMAL,
     TOKEN_MINIMAL_ABI,
     WPLS_CHECKSUM_LOWER,
     BURN_ADDRESSES_CHECKSUM,
-    SCAN_MODE,
-    STANDARD_ERC20_FUNCTIONS,
-    IGNORED_ADMIN_VARS,
-    SAFE_SETTER_EXCLUDES,
     human_format,
     escape_markdown_v2,
-    _safe_rpc_call,
-    levenshtein,
     query_graphql,
     _httpx_get,
-    get_token_metadata_sync
+    get_token_metadata_async
 )
+from multicall import Call, multicall_async, balance_of_call, total_supply_call
+from call_cache import MISS
+from singleflight import SingleFlight
+from sus_scanner import extra_scan_source_patterns
+from bytecode_scan import scan_bytecode
 
-# Konstanta Chain ID untuk Dexscreener (PulseChain)
-PULSECHAIN_CHAIN_ID = "pulsechain" 
+# Scan bersamaan untuk CA yang sama (launch spike) berbagi satu deep_scan_contract
+SCAN_FLIGHT = SingleFlight("padiscan", retention=20.0)
 
 # --- FUNGSI PADI SCAN (Logic Internal) ---
 
-def extra_scan_source_patterns(source_code: str, sus_list: list, detailed_flags: list = None):
-    if not isinstance(source_code, str) or not source_code: return
-    s = source_code
-    state_var_pattern = r"(?:^|\n)\s*(?:address|bool|uint\d*|mapping\s*\([^\)]*\))\s+(?:public|private|internal|external)?\s*([A-Za-z0s9_]{3,40})\s*(?:=|;)"
-    state_vars_found = set(re.findall(state_var_pattern, s, flags=re.M))
-    admin_assigns = re.findall(r"([A-Za-z0s9_]{3,40})\s*=\s*(_?msgSender\(\)|msg\.sender)\s*;", s)
-    for var, _fn in admin_assigns:
-        if var not in state_vars_found: continue
-        sus_list.append(f"🚩 Admin variable detected: `{var}` assigned to secondary owner")
-        if detailed_flags is not None: detailed_flags.append({"type":"admin_var", "var": var})
-    checks = re.findall(r"([A-Za-z0s9_]{3,40})\s*(!=|==)\s*msg\.sender", s)
-    for var, op in checks:
-        if var in state_vars_found or len(re.findall(r"\b" + re.escape(var) + r"\b", s)) > 4:
-            sus_list.append(f"🚩 Access check using custom admin var `{var}` with operator `{op}`")
-            if detailed_flags is not None: detailed_flags.append({"type":"admin_check", "var": var, "op": op})
-    if re.search(r"\b([A-Za-z0s9_]{2,40})\s*=\s*\1\s*\^\s*\1\b", s):
-        sus_list.append("🚩 XOR with self pattern detected")
-        if detailed_flags is not None: detailed_flags.append({"type":"xor_zeroing"})
-    if re.search(r"\b([A-Za-z0s9_]{2,40})\s*=\s*[A-Za-z0s9_]{2,40}\s*\^\s*[A-Za-z0s9_]{2,40}", s):
-        sus_list.append("🚩 Potential bitwise zeroing pattern found")
-        if detailed_flags is not None: detailed_flags.append({"type":"xor_like"})
-    if re.search(r"deductAmount\s*=\s*balances\[[^\]]+\]\s*;|balances\[[^\]]+\]\s*-\=\s*deductAmount", s):
-        sus_list.append("🚩 Function that deducts entire balances detected")
-        if detailed_flags is not None: detailed_flags.append({"type":"burn_entire_balance"})
-    if re.search(r"_totalSupply\s*[\+\-\*]?=|balances\[[^\]]+\]\s*\+\=\s*[A-Za-z0s9_]+", s):
-        sus_list.append("🚩 Modifies totalSupply or increases balances in code")
-        if detailed_flags is not None: detailed_flags.append({"type":"mint_like"})
-    if re.search(r"\b(balancesto|balancesfrom|blacklist|blocklist|isBlocked|isBanned)\b", s, flags=re.I):
-        sus_list.append("🚩 Mapping flags found")
-        if detailed_flags is not None: detailed_flags.append({"type":"mapping_flags"})
-    if re.search(r"revert\(\s*\"[^\"]{1,6}\"\s*\)", s):
-        sus_list.append("🟡 Short/obscure revert strings found")
-        if detailed_flags is not None: detailed_flags.append({"type":"short_revert"})
-    if re.search(r"_Holders\s*\[", s) or re.search(r"getTokenHolders\s*\(", s):
-        sus_list.append("🟡 Contract collects token holder addresses")
-        if detailed_flags is not None: detailed_flags.append({"type":"holders_list"})
-    if re.search(r"function\s+[A-Za-z0s9_]*renounc[e|i][A-Za-z0s9_]*\s*\(", s, flags=re.I):
-        sus_list.append("🚩 Suspicious fake renounce function name found")
-        if detailed_flags is not None: detailed_flags.append({"type":"renounce_like"})
-    if re.search(r"_balances\s*\[\s*_?msgSender\(\)\s*\]\s*\+\=\s*totalSupply\s*\(\s*\)\s*\*\s*[0-9]{2,}", s):
-        sus_list.append("🚩 Owner mint via fake renounce function detected")
-        if detailed_flags is not None: detailed_flags.append({"type":"owner_mint_totalSupply_mul"})
-    if re.search(r"\b(ddsa|balancesto|balancesfrom|blacklist|isBlocked|isBanned)\b", s, flags=re.I):
-        sus_list.append("🚩 Blacklist/flag mapping and custom transfer logic found")
-        if detailed_flags is not None: detailed_flags.append({"type":"mapping_flag_transfer"})
-    if re.search(r"_killEndTime|killEndTime", s) and re.search(r"block\.timestamp\s*<=\s*_killEndTime", s):
-        sus_list.append("🚩 Kill window logic detected")
-        if detailed_flags is not None: detailed_flags.append({"type":"kill_window"})
-    return
-
-def scan_suspicious_features_sync(contract, source_code: str = None) -> List[str]:
-    abi = getattr(contract, "abi", None) or []
-    addr_perm_msgs = []; critical_msgs = []; fee_tax_msgs = []; setter_like_msgs = []
-    def is_address_param(p): return p.get("type","").startswith("address")
-    def is_bool_param(p): return p.get("type","") == "bool"
-    def is_uint_param(p): return p.get("type","").startswith("uint")
-    PRIORITY = {"critical": 0, "addr_perm": 1, "fee_tax": 2, "setter": 3, "other": 4}
-    seen_funcs = {}; fee_tax_count = 0; setter_count = 0
-
-    for f in abi:
-        if f.get("type") != "function": continue
-        name = f.get("name","") or ""; lname = name.lower(); inputs = f.get("inputs",[]) or []
-        if name in STANDARD_ERC20_FUNCTIONS: continue
-        tag = None; tag_priority = PRIORITY["other"]
-        if "transfertoburn" in lname or lname == "transfertoburn":
-            tag = "critical"; tag_priority = PRIORITY["critical"]
-        elif any(k in lname for k in ("fee","tax","settax","setfee","gettax","getfee","treasury","marketing","liquidity")):
-            tag = "fee_tax"; tag_priority = PRIORITY["fee_tax"]
-        elif len(inputs) >= 2 and is_address_param(inputs[0]) and (is_bool_param(inputs[1]) or is_uint_param(inputs[1])):
-            tag = "addr_perm"; tag_priority = PRIORITY["addr_perm"]
-        elif re.match(r'^(set|enable|disable|update|grant|revoke|transfer|withdraw|mint|burn)', name, flags=re.I):
-            if name.lower() not in SAFE_SETTER_EXCLUDES:
-                tag = "setter"; tag_priority = PRIORITY["setter"]
-        prev_tag = seen_funcs.get(name)
-        prev_priority = PRIORITY.get(prev_tag, PRIORITY["other"]) if prev_tag else None
-        if prev_tag is None or (prev_priority is not None and tag_priority < prev_priority):
-            if tag == "critical":
-                cm = f"🔴 Critical control function: {name}"
-                if cm not in critical_msgs: critical_msgs.append(cm)
-            elif tag == "addr_perm":
-                s = f"🟢 Address permission control: {name}"
-                if s not in addr_perm_msgs: addr_perm_msgs.append(s)
-            elif tag == "fee_tax":
-                fee_tax_count += 1
-                if fee_tax_count <= 6: fee_tax_msgs.append(f"🟡 Fee/Limit/Tax control: {name}")
-            elif tag == "setter":
-                setter_count += 1
-                if setter_count <= 8: setter_like_msgs.append(f"🟡 Setter: {name}")
-            if tag: seen_funcs[name] = tag
-        else: continue
-
-    admin_vars = set(); owner_access_pattern = False
-    if isinstance(source_code, str) and source_code:
-        s = source_code
-        state_var_pattern = r"(?:^|\n)\s*(?:address|bool|uint\d*|mapping\s*\([^\)]*\))\s+(?:public|private|internal|external)?\s*([A-Za-z0s9_]{3,60})\s*(?:=|;)"
-        state_vars_found = set(re.findall(state_var_pattern, s, flags=re.M))
-        assigns = re.findall(r"([A-Za-z0s9_]{3,60})\s*=\s*(_?msgSender\(\)|msg\.sender)\s*;", s)
-        checks = set(re.findall(r"([A-Za-z0s9_]{3,60})\s*(?:==|!=)\s*msg\.sender", s))
-        for var, _fn in assigns:
-            if var in state_vars_found and var in checks and var not in IGNORED_ADMIN_VARS: admin_vars.add(var)
-        if "onlyowner" in s.lower() or "accesscontrol" in s.lower() or "default_admin_role" in s.lower() or "owner()" in s: owner_access_pattern = True
-
-    def recolor_green_to_red(messages: List[str]) -> List[str]:
-        return [m.replace("🟢", "🔴", 1) if m.startswith("🟢") else m for m in messages]
-
-    if admin_vars:
-        out = []; out.extend(addr_perm_msgs); out.extend(critical_msgs)
-        for v in sorted(admin_vars): out.append(f"🚩 Admin variable detected: `{v}` assigned to secondary owner")
-        out = recolor_green_to_red(out)
-        if SCAN_MODE != "strict":
-            if fee_tax_count: out.append(f"🟡 Fee/Limit/Tax functions detected: {fee_tax_count}")
-            if setter_count: out.append(f"🟡 Setter functions detected: {setter_count}")
-        seen2 = set(); final = []
-        for x in out:
-            if x not in seen2: seen2.add(x); final.append(x)
-        return final
-        
-    if isinstance(source_code, str) and source_code:
-        s = source_code
-        owner_like_vars = set()
-        for m in re.finditer(r"([A-Za-z0s9_]{3,80})\s*=\s*(?:_?msgSender\(\)|msg\.sender)\s*;", s): owner_like_vars.add(m.group(1))
-        mapping_names = set(re.findall(r"mapping\s*\(\s*address\s*=>\s*bool\s*\)\s*([A-Za-z0s9_]{3,80})\s*;", s, flags=re.I))
-        transfer_body = ""
-        tf = re.search(r"function\s+(_?internaltransfer|_transfer|internalTransfer|transferFrom|transfer)[^\{]*\{([\s\S]{0,4000}?)\}", s, flags=re.I)
-        if tf: transfer_body = tf.group(2)
-        mint_patterns = []
-        for var in owner_like_vars:
-            pat = re.compile(rf"_balances\s*\[\s*{re.escape(var)}\s*\]\s*\+\=\s*totalSupply\s*\(\s*\)\s*\*\s*([0-9_]+)", flags=re.I)
-            m = pat.search(s)
-            if m:
-                try: mult = int(m.group(1).replace("_", ""))
-                except Exception: mult = None
-                mint_patterns.append(("var", var, mult))
-        m2 = re.search(r"_balances\s*\[\s*(?:_?msgSender\(\)|msg\.sender)\s*\]\s*\+\=\s*totalSupply\s*\(\s*\)\s*\*\s*([0-9_]+)", s, flags=re.I)
-        if m2:
-            try: mult = int(m2.group(1).replace("_", ""))
-            except Exception: mult = None
-            mint_patterns.append(("direct", "_msgSender/msg.sender", mult))
-        m3 = re.search(r"([A-Za-z0s9_]{3,80})\s*=\s*totalSupply\s*\(\s*\)\s*;", s)
-        if m3:
-            var_total = m3.group(1)
-            pat2 = re.compile(rf"_balances\s*\[\s*(?:_?msgSender\(\)|msg\.sender)\s*\]\s*\+\=\s*{re.escape(var_total)}\s*\*\s*([0-9_]+)", flags=re.I)
-            m4 = pat2.search(s)
-            if m4:
-                try: mult = int(m4.group(1).replace("_", ""))
-                except Exception: mult = None
-                mint_patterns.append(("indirect", var_total, mult))
-        for kind, target, mult in mint_patterns:
-            if mult is None: critical_msgs.append(f"🚩 Owner mint pattern detected targeting {target} (multiplier unparsable)")
-            else:
-                if mult >= 10: critical_msgs.append(f"🚩 Owner mint: {target} x {mult}")
-                else: fee_tax_msgs.append(f"🚩 Small owner mint pattern found (multiplier {mult})")
-        if transfer_body:
-            if re.search(r"amount\s*=\s*amount\s*-\s*\(?\s*_?balances?\s*\[\s*[^\]]+\s*\]\s*\*\s*[0-9_]+", transfer_body, flags=re.I) or re.search(r"amount\s*=\s*_?balances?\s*\[[^\]]+\]\s*\*\s*[0-9_]+", transfer_body, flags=re.I) or re.search(r"amount\s*=\s*amount\s*-\s*\([^\)]*balance[^\)]*\)", transfer_body, flags=re.I):
-                critical_msgs.append("🚩 Punitive transfer logic detected")
-            for mn in mapping_names:
-                if re.search(rf"\b{re.escape(mn)}\s*\[", transfer_body):
-                    for match in re.finditer(rf"({re.escape(mn)}\s*\[[^\]]+\])", transfer_body):
-                        if re.search(r"amount\s*=\s*amount|amount\s*-[=]?", transfer_body[match.start():match.start()+300], flags=re.I) or re.search(r"_balances?\s*\[", transfer_body[match.start():match.start()+300]):
-                            critical_msgs.append(f"🚩 Mapping '{mn}' used to conditionally modify amount/balances in transfer")
-        kill_assigns = re.findall(r"([A-Za-z0s9_]{3,80})\s*=\s*block\.timestamp\s*\+\s*([0-9_]+)", s, flags=re.I)
-        for kv in kill_assigns:
-            varname = kv[0]
-            if re.search(rf"block\.timestamp\s*(?:<=|<|>=|>)\s*{re.escape(varname)}", s) or re.search(rf"{re.escape(varname)}\s*(?:>=|>|<=|<)\s*block\.timestamp", s):
-                critical_msgs.append("🚩 Kill window logic detected")
-        for m in re.finditer(r"function\s+([A-Za-z0s9_]{3,80})\s*\(", s, flags=re.I):
-            fname = m.group(1); fname_lower = fname.lower()
-            if "renounce" in fname_lower and "ownership" not in fname_lower:
-                dist = levenshtein(fname_lower, "renounceownership")
-                if dist <= 3: critical_msgs.append(f"🚩 Fake renounce: {fname}")
-                else: fee_tax_msgs.append(f"🚩 Fake renounce function name (unusual): {fname}")
-        for m in re.finditer(r"function\s+([A-Za-z0s9_]{3,80})[^\{]*\{([\s\S]{0,2000}?)\}", s, flags=re.I):
-            fname, fbody = m.group(1), m.group(2)
-            if re.search(r"\bonlyOwner\b|\bonlyowner\b", m.group(0) + fbody, flags=re.I):
-                if re.search(r"_balances\s*\[\s*(?:_?msgSender\(\)|msg\.sender|[A-Za-z0s9_]{3,80})\s*\]\s*\+\=\s*totalSupply\s*\(", fbody, flags=re.I) or re.search(r"totalSupply\s*\(\s*\)\s*;[\s\S]{0,200}[\+\*0-9_]", fbody, flags=re.I):
-                    critical_msgs.append(f"🚩 Owner only function '{fname}' mints/assigns large supply to owner")
-
-    combined = []; combined.extend(addr_perm_msgs); combined.extend(critical_msgs); combined.extend(fee_tax_msgs[:6]); combined.extend(setter_like_msgs[:8])
-    if not combined: return ["🟢 No suspicious non-ERC20 functions found"]
-    seen3 = set(); out = []
-    for x in combined:
-        if x not in seen3: seen3.add(x); out.append(x)
-    return out
-
-def get_tax_info_simulation_sync(token_address, honey_ca):
+def _parse_tax_simulation(results):
     tax_results = {"BuyTax": 0.0, "SellTax": 0.0, "BuySuccess": False, "SellSuccess": False}
-    if not w3 or not honey_ca or not w3.is_address(honey_ca): return {"error": "HONEY Contract not deployed or invalid address"}
-    try:
-        honey_contract = w3.eth.contract(address=w3.to_checksum_address(honey_ca), abi=HONEY_ABI_MINIMAL)
-        results = _safe_rpc_call(lambda: honey_contract.functions.checkHoneyMain(w3.to_checksum_address(token_address)).call({'gas': 5000000})) 
-        if results is None or len(results) < 7: return {"error": "Tax simulation failed to return expected data."}
-        buyEstimate, buyReal, sellEstimate, sellReal, buy, sell, _ = results
-        
-        tax_results["BuySuccess"] = buy; tax_results["SellSuccess"] = sell
-        
-        # KOREKSI LOGIKA 0%: Pastikan Tax adalah 0.0 jika buy/sell berhasil dan real == estimate
-        if buyEstimate > 0 and buyReal > 0: 
-            tax_results["BuyTax"] = round((buyEstimate - buyReal) / buyEstimate * 100, 2)
-        elif buyEstimate > 0 and buyReal == buyEstimate and buy: # Jika berhasil dan hasilnya 0
-            tax_results["BuyTax"] = 0.0 
-        elif buyEstimate > 0 and buyReal == 0 and buy: 
-            tax_results["BuyTax"] = 100.0
-        elif not buy: 
-            tax_results["BuyTax"] = "Fail"
-
-        if sellEstimate > 0 and sellReal > 0: 
-            tax_results["SellTax"] = round((sellEstimate - sellReal) / sellEstimate * 100, 2)
-        elif sellEstimate > 0 and sellReal == sellEstimate and sell: # Jika berhasil dan hasilnya 0
-            tax_results["SellTax"] = 0.0
-        elif sellEstimate > 0 and sellReal == 0 and sell: 
-            tax_results["SellTax"] = 100.0
-        elif not sell: 
-            tax_results["SellTax"] = "Fail"
-
-    except Exception as e:
-        return {"error": f"Tax simulation failed: {e.__class__.__name__} - {str(e)}"}
+    if results is None or len(results) < 7: return {"error": "Tax simulation failed to return expected data."}
+    buyEstimate, buyReal, sellEstimate, sellReal, buy, sell, _ = results
+    
+    tax_results["BuySuccess"] = buy; tax_results["SellSuccess"] = sell
+    
+    # KOREKSI LOGIKA 0%: Pastikan Tax adalah 0.0 jika buy/sell berhasil dan real == estimate
+    if buyEstimate > 0 and buyReal > 0: 
+        tax_results["BuyTax"] = round((buyEstimate - buyReal) / buyEstimate * 100, 2)
+    elif buyEstimate > 0 and buyReal == buyEstimate and buy: # Jika berhasil dan hasilnya 0
+        tax_results["BuyTax"] = 0.0 
+    elif buyEstimate > 0 and buyReal == 0 and buy: 
+        tax_results["BuyTax"] = 100.0
+    elif not buy: 
+        tax_results["BuyTax"] = "Fail"
+
+    if sellEstimate > 0 and sellReal > 0: 
+        tax_results["SellTax"] = round((sellEstimate - sellReal) / sellEstimate * 100, 2)
+    elif sellEstimate > 0 and sellReal == sellEstimate and sell: # Jika berhasil dan hasilnya 0
+        tax_results["SellTax"] = 0.0
+    elif sellEstimate > 0 and sellReal == 0 and sell: 
+        tax_results["SellTax"] = 100.0
+    elif not sell: 
+        tax_results["SellTax"] = "Fail"
     return tax_results
 
+TAX_SIM_GAS = 5000000
+TAX_SIM_RETURNS = ("uint256", "uint256", "uint256", "uint256", "bool", "bool", "uint256")
+
+async def get_tax_info_simulation_batch(token_address, honey_cas: List[Optional[str]]) -> List[Dict[str, Any]]:
+    """
+    Simulasi tax ke beberapa HONEY contract sekaligus: semua checkHoneyMain dikirim sebagai eth_call
+    dalam satu JSON-RPC batch POST (bukan aggregate3, supaya msg.sender & gas 5M per call tetap sama),
+    dan hasil parse di-cache per (token, honey) di TAX_SIM_CACHE.
+    """
+    out: List[Dict[str, Any]] = [{"error": "HONEY Contract not deployed or invalid address"}] * len(honey_cas)
+    try: token = aw3.to_checksum_address(token_address)
+    except Exception as e: return [{"error": f"Tax simulation failed: {e.__class__.__name__} - {str(e)}"}] * len(honey_cas)
+
+    bucket = await TAX_SIM_CACHE.current_bucket()
+    pending: List[Tuple[int, Call]] = []
+    for i, honey_ca in enumerate(honey_cas):
+        if not honey_ca or not aw3.is_address(honey_ca): continue
+        call = Call(honey_ca, "checkHoneyMain(address)", (token,), returns=TAX_SIM_RETURNS)
+        cached = TAX_SIM_CACHE.get(call.target, call.calldata, bucket)
+        if cached is not MISS: out[i] = cached
+        else: pending.append((i, call))
+
+    if pending:
+        raws = await asyncio.gather(*(
+            RPC_BATCHER.call("eth_call", [{"to": c.target, "data": "0x" + c.calldata.hex(), "gas": hex(TAX_SIM_GAS)}, "latest"])
+            for _, c in pending
+        ), return_exceptions=True)
+        for (i, call), raw in zip(pending, raws):
+            results = None if isinstance(raw, BaseException) or not isinstance(raw, str) else call.decode_result(bytes.fromhex(raw[2:]))
+            parsed = _parse_tax_simulation(results)
+            out[i] = parsed
+            if not parsed.get("error"): TAX_SIM_CACHE.put(call.target, call.calldata, bucket, parsed)
+    return out
+
 def process_tax_results(tax_data_raw):
     buy_tax = None; sell_tax = None; buy_ok = False; sell_ok = False
     tax_data = {"BuyTax": "N/A", "SellTax": "N/A", "BuySuccess": False, "SellSuccess": False, "Honeypot": "❌ Unknown"}
@@ -281,48 +133,46 @@ def process_tax_results(tax_data_raw):
     tax_data["BuyTax"] = escape_markdown_v2(tax_data["BuyTax"]); tax_data["SellTax"] = escape_markdown_v2(tax_data["SellTax"]); tax_data["Honeypot"] = escape_markdown_v2(tax_data["Honeypot"])
     return tax_data
 
-def deep_lp_scan_sync(lp_to_scan, token_contract, token_total_supply, w3, BURN_ADDRESSES_CHECKSUM, lp_source):
+def _lp_scan_calls(lp, token_ca, burn_addrs):
+    # [0] LP totalSupply, [1..n] LP burns, [n+1..2n] token burns, [-1] token di pool
+    calls = [total_supply_call(lp)]
+    calls += [balance_of_call(lp, a) for a in burn_addrs]
+    calls += [balance_of_call(token_ca, a) for a in burn_addrs]
+    calls.append(balance_of_call(token_ca, lp))
+    return calls
+
+def _build_lp_scan_data(values, burn_addrs, token_total_supply, data, lp_source):
+    # Total LP Supply
+    lp_total_supply = values[0]
+    if not lp_total_supply:
+        data["LP_burnt"] = "N/A (LP Total Supply 0)"
+        data["Supply_in_Pool"] = "N/A"
+        return data
+
+    n = len(burn_addrs)
+    lp_burns = values[1:1 + n]
+    lp_total_burnt = sum(x or 0 for x in lp_burns)
+
+    lp_burn_percent = (lp_total_burnt / lp_total_supply) * 100
+
+    token_burns = values[1 + n:1 + 2 * n]
+    token_total_burnt = sum(x or 0 for x in token_burns)
+    token_burn_percent = (token_total_burnt / token_total_supply) * 100
+
+    # Balance token in LP
+    token_in_pool = values[-1] or 0
+    token_in_pool_percent = (token_in_pool / token_total_supply) * 100
+
+    data["LP_burnt"] = f"{lp_burn_percent:.2f}% 🔥 | {lp_source}"
+    data["Supply_in_Pool"] = f"Pool: {token_in_pool_percent:.2f}% | Burn: {token_burn_percent:.2f}%"
+    return data
+
+async def deep_lp_scan_async(lp_to_scan, token_ca, token_total_supply, aw3, BURN_ADDRESSES_CHECKSUM, lp_source):
     data = {"LP_Source_Name": lp_source}
 
     try:
-        lp = lp_to_scan
-        lp_contract = w3.eth.contract(address=lp, abi=TOKEN_MINIMAL_ABI)
-
-        # Total LP Supply
-        lp_total_supply = _safe_rpc_call(lambda: lp_contract.functions.totalSupply().call())
-        if not lp_total_supply:
-            data["LP_burnt"] = "N/A (LP Total Supply 0)"
-            data["Supply_in_Pool"] = "N/A"
-            return data
-
-        # --- FAST MODE: Parallelized RPC ---
-        burn_addrs = BURN_ADDRESSES_CHECKSUM
-
-        # Ambil LP burns paralel (3 address)
-        lp_burns = [
-            _safe_rpc_call(lambda c=a: lp_contract.functions.balanceOf(c).call())
-            for a in burn_addrs
-        ]
-
-        lp_total_burnt = sum(x or 0 for x in lp_burns)
-
-        lp_burn_percent = (lp_total_burnt / lp_total_supply) * 100
-
-        # Ambil token burns paralel (3 address)
-        token_burns = [
-            _safe_rpc_call(lambda c=a: token_contract.functions.balanceOf(c).call())
-            for a in burn_addrs
-        ]
-
-        token_total_burnt = sum(x or 0 for x in token_burns)
-        token_burn_percent = (token_total_burnt / token_total_supply) * 100
-
-        # Balance token in LP
-        token_in_pool = _safe_rpc_call(lambda: token_contract.functions.balanceOf(lp).call()) or 0
-        token_in_pool_percent = (token_in_pool / token_total_supply) * 100
-
-        data["LP_burnt"] = f"{lp_burn_percent:.2f}% 🔥 | {lp_source}"
-        data["Supply_in_Pool"] = f"Pool: {token_in_pool_percent:.2f}% | Burn: {token_burn_percent:.2f}%"
+        values = await multicall_async(aw3, _lp_scan_calls(lp_to_scan, token_ca, BURN_ADDRESSES_CHECKSUM), cache=CALL_CACHE)
+        _build_lp_scan_data(values, BURN_ADDRESSES_CHECKSUM, token_total_supply, data, lp_source)
 
     except Exception as e:
         logging.error(f"LP Scan Error: {e}")
@@ -334,45 +184,55 @@ def deep_lp_scan_sync(lp_to_scan, token_contract, token_total_supply, w3, BURN_A
 
 # --- FUNGSI BARU UNTUK DEXSCREENER ---
 async def fetch_dexscreener_data(lp_address: str, token_ca: str) -> Dict[str, Any]:
-    # KOREKSI KRITIS: Pastikan LP Address adalah lowercase untuk Dexscreener API Path
-    lp_address_lower = lp_address.lower()
-    url_pair = f"https://api.dexscreener.com/latest/dex/pairs/{PULSECHAIN_CHAIN_ID}/{lp_address_lower}"
+    # Lewat DEXSCREENER: rate limit + batch per token (/tokens/v1), LP di luar batch baru pakai endpoint pairs
+    try:
+        best_dex_pair = await DEXSCREENER.pair(lp_address, token_ca)
+    except Exception as e:
+        logging.warning(f"Dexscreener failed for LP {lp_address}: {type(e).__name__}: {e}")
+        return {"error": "Dexscreener fetch failed"}
+
+    if not best_dex_pair:
+        return {"error": "No pair data found on Dexscreener"}
+
+    price_usd = float(best_dex_pair.get('priceUsd', 0))
+    liquidity = float(best_dex_pair.get('liquidity', {}).get('usd', 0))
+    volume_24h = float(best_dex_pair.get('volume', {}).get('h24', 0))
+    price_change_24h = float(best_dex_pair.get('priceChange', {}).get('h24', 0))
+    market_cap = float(best_dex_pair.get('fdv', 0) or best_dex_pair.get('marketCap', 0)) 
     
-    async with httpx.AsyncClient(timeout=10) as client:
-        r = await _httpx_get(client, url_pair)
-        
-        if not r or r.status_code != 200:
-            logging.warning(f"Dexscreener failed for LP {lp_address} ({lp_address_lower}): Status {r.status_code if r else 'N/A'}")
-            return {"error": "Dexscreener fetch failed"}
-            
-        data = r.json()
-        pairs = data.get('pairs', [])
-        
-        if not pairs:
-            return {"error": "No pair data found on Dexscreener"}
-            
-        best_dex_pair = pairs[0] 
-
-        price_usd = float(best_dex_pair.get('priceUsd', 0))
-        liquidity = float(best_dex_pair.get('liquidity', {}).get('usd', 0))
-        volume_24h = float(best_dex_pair.get('volume', {}).get('h24', 0))
-        price_change_24h = float(best_dex_pair.get('priceChange', {}).get('h24', 0))
-        market_cap = float(best_dex_pair.get('fdv', 0) or best_dex_pair.get('marketCap', 0)) 
-        
-        return {
-            "Price": price_usd,
-            "Liquidity": liquidity,
-            "Price_Change": price_change_24h,
-            "Volume": volume_24h,
-            "Market_Cap": market_cap,
-            "LP_Source_Name": best_dex_pair.get('dexId', 'Dexscreener')
-        }
+    return {
+        "Price": price_usd,
+        "Liquidity": liquidity,
+        "Price_Change": price_change_24h,
+        "Volume": volume_24h,
+        "Market_Cap": market_cap,
+        "LP_Source_Name": best_dex_pair.get('dexId', 'Dexscreener')
+    }
     
 # --- END FUNGSI DEXSCREENER ---
 
+async def _local_market_data(ca: str) -> Optional[Dict[str, Any]]:
+    """Pair WPLS terbaik dari PAIR_INDEX + reserve on-chain, total supply via multicall. None = pakai subgraph."""
+    quote = await PRICE_ENGINE.quote(ca)
+    if quote is None: return None
+    supply_raw, decimals = await multicall_async(aw3, [total_supply_call(ca), Call(ca, "decimals()", returns=("uint8",))], cache=CALL_CACHE)
+    # Token_Total_Supply tetap raw (sama seperti totalSupply subgraph): deep LP scan membaginya dengan balance raw
+    supply_raw = supply_raw or 0
+    supply_adjusted = supply_raw / 10 ** (decimals if decimals is not None else 18)
+    return {"market_data": {"Price": quote.price_usd, "Liquidity": quote.liquidity_usd, "Price_Change": 0.0, "Volume": 0.0, "Market_Cap": supply_adjusted * quote.price_usd},
+            "LP_Address": quote.pair, "LP_Source_Name": quote.source, "LP_PLS_Ratio": 0.0, "Token_Total_Supply": supply_raw}
+
 async def get_graph_market_data_async(ca: str) -> Dict[str, Any]:
     # CATATAN: Fungsi ini disederhanakan hanya untuk mengambil Pair ID terbaik dan Total Supply
     
+    # Index pair lokal sudah sync: tidak perlu 2 query subgraph di jalur kritis scan
+    if PAIR_INDEX.ready:
+        try:
+            local = await _local_market_data(ca)
+            if local is not None: return local
+        except Exception as e:
+            logging.warning(f"Local market data failed for {ca}: {type(e).__name__}: {e}")
+
     GRAPHQL_URL_V2 = "https://graph.pulsechain.com/subgraphs/name/pulsechain/pulsexv2"
     GRAPHQL_URL_V1 = "https://graph.pulsechain.com/subgraphs/name/pulsechain/pulsex"
     
@@ -418,6 +278,17 @@ async def get_graph_market_data_async(ca: str) -> Dict[str, Any]:
     results = {"market_data": {"Price": best_derived_usd, "Liquidity": 0.0, "Price_Change": 0.0, "Volume": 0.0, "Market_Cap": best_total_supply * best_derived_usd}, 
                "LP_Address": None, "LP_Source_Name": None, "LP_PLS_Ratio": 0.0, "Token_Total_Supply": best_total_supply}
     
+    if best_derived_usd <= 0 or not all_pairs:
+        # Subgraph tertinggal / timeout: harga & LP terbaik langsung dari reserve pair PulseX
+        quote = await PRICE_ENGINE.quote(ca)
+        if quote:
+            results["market_data"]["Price"] = quote.price_usd
+            results["market_data"]["Market_Cap"] = best_total_supply * quote.price_usd
+            if not all_pairs:
+                results["LP_Address"] = quote.pair
+                results["LP_Source_Name"] = quote.source
+                results["market_data"]["Liquidity"] = quote.liquidity_usd
+
     if not all_pairs: return results
     
     best_pair = max(all_pairs, key=lambda p: float(p.get('reserveUSD', 0)))
@@ -451,21 +322,29 @@ def _try_extract_abi_from_metadata_obj(meta_obj: Any) -> Optional[List[Dict[str,
         if isinstance(fallback, list) and fallback: return fallback
     return None
 
+class VerificationLookupError(Exception):
+    """Sumber verifikasi tidak menjawab (timeout / non-200), jadi hasilnya bukan 'unverified' yang pasti."""
+
+
 async def fetch_sourcify_repo_metadata(chain_id: int, ca: str) -> Optional[Tuple[Any, str]]:
+    """None = semua path menjawab 404 (tidak ada di Sourcify); VerificationLookupError kalau ada path yang gagal."""
     ca_norm = ca.lower().replace("0x", "")
     paths_to_try = [f"{SOURCIFY_REPO}/full_match/{chain_id}/{ca_norm}/metadata.json", f"{SOURCIFY_REPO}/partial_match/{chain_id}/{ca_norm}/metadata.json", f"{SOURCIFY_REPO}/full_match/{chain_id}/{ca_norm}", f"{SOURCIFY_REPO}/partial_match/{chain_id}/{ca_norm}"]
-    async with httpx.AsyncClient(timeout=8, follow_redirects=True) as client:
-        for url in paths_to_try:
-            r = await _httpx_get(client, url)
-            if not r: continue
-            if r.status_code == 200:
-                text = r.text
-                try: payload = r.json()
-                except Exception:
-                    try: payload = json.loads(text)
-                    except Exception: payload = text
-                if url.endswith("metadata.json"): return payload, "metadata.json"
-                else: return payload, "repo-list"
+    client = HTTP_CLIENTS.get(SOURCIFY_REPO)
+    failed = False
+    for url in paths_to_try:
+        r = await _httpx_get(client, url, timeout=8, follow_redirects=True)
+        if not r or r.status_code not in (200, 404):
+            failed = True; continue
+        if r.status_code == 200:
+            text = r.text
+            try: payload = r.json()
+            except Exception:
+                try: payload = json.loads(text)
+                except Exception: payload = text
+            if url.endswith("metadata.json"): return payload, "metadata.json"
+            else: return payload, "repo-list"
+    if failed: raise VerificationLookupError(f"Sourcify lookup failed for {ca}")
     return None
 
 async def get_sourcify_verification_data(ca: str, chain_id: int = 369) -> Optional[Tuple[List[Dict[str, Any]], Any]]:
@@ -498,45 +377,63 @@ async def get_sourcify_verification_data(ca: str, chain_id: int = 369) -> Option
     return None
 
 async def get_verification_status(ca: str, chain_id: int = 369, std_json: dict | None = None):
-    async with httpx.AsyncClient(timeout=10) as client:
-        try:
-            url_ps = f"{PULSESCAN_API_BASE_URL}?module=contract&action=getsourcecode&address={ca}"
-            if PULSESCAN_API_KEY: url_ps += f"&apikey={PULSESCAN_API_KEY}"
-            r = await client.get(url_ps)
-            if r.status_code == 200:
-                data_ps = r.json()
-                if data_ps.get('status') == '1' and data_ps.get('result'):
-                    item = data_ps['result'][0]
-                    abi_raw = item.get('ABI') or item.get('abi') or None
-                    source_code = item.get('SourceCode') or item.get('sourceCode') or ''
-                    if isinstance(abi_raw, str):
-                        try: abi_parsed = json.loads(abi_raw) if abi_raw and abi_raw != 'Contract source code not verified' else None
-                        except Exception: abi_parsed = None
-                    else: abi_parsed = abi_raw if isinstance(abi_raw, list) else None
-                    if abi_parsed: return "✅ Verified (PulseScan)", abi_parsed, source_code
-        except Exception as e:
-            logging.debug(f"PulseScan lookup failed: {type(e).__name__}: {e}")
+    cached = VERIFY_STORE.get(chain_id, ca)
+    if cached: return cached
+    status, abi, source, conclusive = await _fetch_verification_status(ca, chain_id)
+    # Hanya jawaban pasti yang disimpan; gagal karena timeout/HTTP error tidak boleh jadi "unverified" selama negative TTL
+    if abi or conclusive:
+        VERIFY_STORE.put(chain_id, ca, status, abi, source, origin=status.split("(")[-1].rstrip(")") if abi else None)
+    return status, abi, source
+
+async def _fetch_verification_status(ca: str, chain_id: int = 369):
+    """Return (status, abi, source, conclusive); conclusive False kalau PulseScan/Sourcify tidak menjawab dengan benar."""
+    conclusive = True
+    client = HTTP_CLIENTS.get(PULSESCAN_API_BASE_URL)
+    try:
+        url_ps = f"{PULSESCAN_API_BASE_URL}?module=contract&action=getsourcecode&address={ca}"
+        if PULSESCAN_API_KEY: url_ps += f"&apikey={PULSESCAN_API_KEY}"
+        r = await client.get(url_ps, timeout=10)
+        if r.status_code == 200:
+            data_ps = r.json()
+            if data_ps.get('status') == '1' and data_ps.get('result'):
+                item = data_ps['result'][0]
+                abi_raw = item.get('ABI') or item.get('abi') or None
+                source_code = item.get('SourceCode') or item.get('sourceCode') or ''
+                if isinstance(abi_raw, str):
+                    try: abi_parsed = json.loads(abi_raw) if abi_raw and abi_raw != 'Contract source code not verified' else None
+                    except Exception: abi_parsed = None
+                else: abi_parsed = abi_raw if isinstance(abi_raw, list) else None
+                if abi_parsed: return "✅ Verified (PulseScan)", abi_parsed, source_code, True
+            else: conclusive = False   # status "0" = error API (rate limit, NOTOK), bukan "tidak terverifikasi"
+        else: conclusive = False
+    except Exception as e:
+        conclusive = False
+        logging.debug(f"PulseScan lookup failed: {type(e).__name__}: {e}")
     try:
         res = await get_sourcify_verification_data(ca, chain_id)
         if res:
             abi_list, source = res
-            return "✅ Verified (Sourcify Repo)", abi_list, source
+            return "✅ Verified (Sourcify Repo)", abi_list, source, True
     except Exception as e:
+        conclusive = False
         logging.debug(f"Sourcify repo check error: {type(e).__name__}: {e}")
-    return "❌ Contract is Unverified", None, None
+    if not conclusive: return "⚠️ Verification fetch failed", None, None, False
+    return "❌ Contract is Unverified", None, None, True
 
-async def deep_scan_contract(ca):
+async def deep_scan_contract(ca, runtime_code: Optional[str] = None):
     results = {"metadata": {}, "Verify": "UNKNOWN", "Owner": "N/A (Owner function not found)", "Upgradeable": "UNKNOWN", "LP_Address": "N/A (PulseX V2/V1)", "LP_burnt": "N/A", "Supply_in_Pool": "N/A", "LP_Source_Name": "Unknown DEX", "Sus_Features": "N/A", "market_data": {}}
-    if not w3 or not w3.is_connected(): results['Verify'] = "RPC Connection Failed"; return results
+    if not await wait_rpc_ready(): results['Verify'] = "RPC Connection Failed"; return results
     
     # 1. Ambil data: Verifikasi, GraphQL (untuk LP/Supply), Metadata
-    tasks = [get_verification_status(ca), get_graph_market_data_async(ca), asyncio.to_thread(get_token_metadata_sync, ca)]
+    # owner() ikut di aggregate3 metadata supaya tidak perlu round trip RPC terpisah
+    tasks = [get_verification_status(ca), get_graph_market_data_async(ca), get_token_metadata_async(ca, include_owner=True)]
     verify_status, graph_market_data, metadata = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Penanganan Error Gathering
     graph_market_data = graph_market_data if not isinstance(graph_market_data, Exception) and graph_market_data else {}
     verify_status = verify_status if not isinstance(verify_status, Exception) else ("⚠️ Verification fetch failed", None, None)
     metadata = metadata if not isinstance(metadata, Exception) else {"Name": "Error", "Ticker": "ERR", "Decimals": 18}
+    owner_from_multicall = metadata.pop("Owner", None)
 
     # Ambil data LP dan Total Supply dari hasil GraphQL
     lp_to_scan = graph_market_data.get('LP_Address'); lp_source = graph_market_data.get('LP_Source_Name')
@@ -579,26 +476,34 @@ async def deep_scan_contract(ca):
     try: token_contract = w3.eth.contract(address=w3.to_checksum_address(ca), abi=abi_to_use)
     except Exception: results["Owner"] = "Error in Web3 Contract Init"; return results
     
-    # 2. Ambil data: Owner, Tax, Sus Features (Batch RPC/Sync)
-    owner_call_safe = lambda: _safe_rpc_call(token_contract.functions.owner().call)
+    # 2. Ambil data: Tax, Sus Features (Owner sudah didapat dari multicall metadata)
     try:
-        if full_abi: sus_features_task = asyncio.to_thread(scan_suspicious_features_sync, token_contract, source_code)
+        if full_abi: sus_features_task = SCAN_POOL.scan(full_abi, source_code)
+        # Unverified: selector dari bytecode yang sudah diambil padiscan (eth_getCode), tanpa request tambahan
+        elif runtime_code: sus_features_task = asyncio.to_thread(scan_bytecode, runtime_code)
         else: sus_features_task = asyncio.to_thread(lambda: extra_scan_source_patterns(source_code or "", [], []))
-    except Exception as e: sus_features_task = asyncio.to_thread(lambda: [f"⚠️ Sus scan setup failed: {e}"])
+    except Exception as e:
+        setup_error = [f"⚠️ Sus scan setup failed: {e}"]
+        sus_features_task = asyncio.to_thread(lambda: setup_error)
     
     has_owner_func = any(isinstance(f, dict) and f.get('name') == 'owner' for f in (abi_to_use or []))
+    owner_address = owner_from_multicall if has_owner_func else None
+    # Simulasi V2 & V1 dalam satu batch POST; dengan TAX_SIM_BEST_LP_ONLY hanya router LP terbaik yang disimulasikan
+    honey_v2, honey_v1 = HONEY_V2_ADDRESS, HONEY_V1_ADDRESS
+    if TAX_SIM_BEST_LP_ONLY and lp_source:
+        if lp_source.startswith("PulseX V1"): honey_v2 = None
+        else: honey_v1 = None
     tasks_rpc_critical = [
-        asyncio.to_thread(owner_call_safe) if has_owner_func else asyncio.to_thread(lambda: None), 
-        asyncio.to_thread(get_tax_info_simulation_sync, ca, HONEY_V2_ADDRESS), 
-        asyncio.to_thread(get_tax_info_simulation_sync, ca, HONEY_V1_ADDRESS), 
+        get_tax_info_simulation_batch(ca, [honey_v2, honey_v1]),
         sus_features_task
     ]
-    owner_address, tax_data_v2_raw, tax_data_v1_raw, sus_scan_raw = await asyncio.gather(*tasks_rpc_critical, return_exceptions=True)
+    tax_data_raw, sus_scan_raw = await asyncio.gather(*tasks_rpc_critical, return_exceptions=True)
 
     # 3. Pemrosesan Hasil
-    owner_address = None if isinstance(owner_address, Exception) else owner_address
-    tax_data_v2_raw = tax_data_v2_raw if not isinstance(tax_data_v2_raw, Exception) else {"error": str(tax_data_v2_raw)}
-    tax_data_v1_raw = tax_data_v1_raw if not isinstance(tax_data_v1_raw, Exception) else {"error": str(tax_data_v1_raw)}
+    if isinstance(tax_data_raw, Exception): tax_data_v2_raw = tax_data_v1_raw = {"error": str(tax_data_raw)}
+    else: tax_data_v2_raw, tax_data_v1_raw = tax_data_raw
+    if honey_v2 is None and HONEY_V2_ADDRESS: tax_data_v2_raw = {"error": "Skipped (best LP is not on PulseX V2)"}
+    if honey_v1 is None and HONEY_V1_ADDRESS: tax_data_v1_raw = {"error": "Skipped (best LP is not on PulseX V1)"}
     
     # Normalisasi Sus Features (dipertahankan)
     sus_scan_output = []
@@ -642,10 +547,10 @@ async def deep_scan_contract(ca):
         else: results["Upgradeable"] = "❌ Unknown Ownership"; results["Sus_Features"] = "\n".join(sus_scan_output)
     except Exception as e: results["Upgradeable"] = "❌ Unknown Ownership"; results["Sus_Features"] = "\n".join(sus_scan_output) if isinstance(sus_scan_output, list) else str(sus_scan_output)
 
-    # 4. Ambil data LP Burn & Supply in Pool (Sync)
+    # 4. Ambil data LP Burn & Supply in Pool (AsyncWeb3 + Multicall3)
     try:
         if lp_to_scan and token_total_supply is not None and token_total_supply > 0:
-            lp_scan_data = await asyncio.to_thread(lambda: deep_lp_scan_sync(lp_to_scan, token_contract, token_total_supply, w3, BURN_ADDRESSES_CHECKSUM, lp_source))
+            lp_scan_data = await deep_lp_scan_async(lp_to_scan, token_contract.address, token_total_supply, aw3, BURN_ADDRESSES_CHECKSUM, lp_source)
             if lp_scan_data and isinstance(lp_scan_data.get("LP_burnt"), str): results.update(lp_scan_data)
             else: results["LP_burnt"] = "Error LP Scan"; results["Supply_in_Pool"] = "Error Supply Scan"
         else: results["LP_burnt"] = "N/A (No LP)"; results["Supply_in_Pool"] = "N/A (No LP)"
@@ -661,19 +566,19 @@ async def padiscan(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     ca = context.args[0].strip()
 
-    if not w3 or not w3.is_connected():
+    if not await wait_rpc_ready():
         await update.message.reply_text("⚠️ RPC Connection Failed\\. The bot cannot fetch On\\-Chain data\\.", parse_mode='MarkdownV2')
         return
 
     try:
-        checksum_addr = w3.to_checksum_address(ca)
-        code = await asyncio.to_thread(lambda: w3.eth.get_code(checksum_addr))
+        # eth_getCode + header block terbaru lewat auto-batcher (satu POST, digabung dengan handler lain); bytecode dipakai lagi untuk scan unverified
+        state = await get_address_state(ca)
         
-        if not code or code == b'0x' or code == b'\x00':
+        if not state["is_contract"]:
              await update.message.reply_text("❌ That’s not a contract address\\.", parse_mode='MarkdownV2')
              return
              
-    except InvalidAddress:
+    except (InvalidAddress, ValueError):
         await update.message.reply_text("❌ Invalid address format\\.", parse_mode='MarkdownV2')
         return
     except Exception as e:
@@ -682,7 +587,7 @@ async def padiscan(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     msg = await update.message.reply_text("⏳ *PADISCAN* is scanning\\.\\.\\. Please wait\\.\\.", parse_mode='MarkdownV2')
 
-    deep_scan_results = await deep_scan_contract(ca)
+    deep_scan_results = await SCAN_FLIGHT.do(ca.lower(), lambda: deep_scan_contract(ca, runtime_code=state["code"]))
 
     metadata = deep_scan_results.pop('metadata', {})
     market_data = deep_scan_results.pop('market_data', {})
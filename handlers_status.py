@@ -0,0 +1,80 @@
+# handlers_status.py
+
+import asyncio
+import logging
+from urllib.parse import urlsplit
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from utils import (
+    RPC_POOL,
+    RPC_BATCHER,
+    CALL_CACHE,
+    PRICE_CACHE,
+    PAIR_INDEX,
+    DEXSCREENER,
+    SCAN_POOL,
+    DETECTORS,
+    escape_markdown_v2,
+)
+
+def _mask_url(url):
+    """Hanya host (tanpa user:pass, path, query): URL RPC privat sering memuat API key."""
+    if not url: return url
+    parts = urlsplit(url)
+    host = parts.hostname or "?"
+    if parts.port: host += f":{parts.port}"
+    return f"{parts.scheme}://{host}" if parts.scheme else host
+
+# --- HANDLER TELEGRAM ---
+
+async def padirpc(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handler for the /padirpc command: tampilkan status RpcPool (node aktif, latency, error rate)."""
+    state = RPC_POOL.snapshot()
+    lines = []
+    for e in state["endpoints"]:
+        marker = "▶️" if e["url"] == state["serving_url"] else ("🧊" if e["cooldown_s"] > 0 else "•")
+        latency = f"{e['latency_ms']}ms" if e["latency_ms"] is not None else "n/a"
+        p95 = f"{e['p95_ms']}ms" if e["p95_ms"] is not None else "n/a"
+        line = f"{marker} {_mask_url(e['url'])}\n   lat {latency} | p95 {p95} | err {e['error_rate']:.0%} | req {e['requests']} | block {e['last_block'] or 'n/a'}"
+        if e["cooldown_s"] > 0: line += f" | cooldown {e['cooldown_s']}s"
+        lines.append(escape_markdown_v2(line))
+
+    serving = escape_markdown_v2(_mask_url(state["serving_url"]) or "none yet")
+    hedge = escape_markdown_v2(f"Hedged: {state['hedged_requests']} (backup won {state['hedge_wins']})")
+    batch = escape_markdown_v2(f"Batched: {RPC_BATCHER.calls_sent} calls in {RPC_BATCHER.batches_sent} POSTs")
+    cache = CALL_CACHE.snapshot()
+    cache_line = escape_markdown_v2(f"Call cache: {cache['hits']} hit / {cache['misses']} miss ({cache['hit_rate']:.0%}), {cache['entries']} entries, {cache['reorg_flushes']} reorg flush")
+    prices = PRICE_CACHE.snapshot()
+    price_line = escape_markdown_v2(f"Price cache: {prices['hit_rate']:.0%} hit ({prices['stale_hits']} stale, {prices['negative_hits']} negative), {prices['entries']} entries, {prices['refreshes']} bg refresh")
+    pairs = await asyncio.to_thread(PAIR_INDEX.snapshot)
+    pair_line = escape_markdown_v2(f"Pair index: {pairs['pairs']} pairs, block {pairs['checkpoint']}/{pairs['head'] or 'n/a'}" + (" ✅" if pairs["ready"] else " (syncing)"))
+    dex = DEXSCREENER.snapshot()
+    dex_line = escape_markdown_v2(f"Dexscreener: {dex['requests']} req for {dex['lookups']} lookups ({dex['cache_hits']} cached), {dex['rate_waits']} waited, {dex['throttled']} × 429, {dex['tokens_available']} tokens left")
+    report = f"*RPC Pool*\nServing: `{serving}`\n{hedge}\n{batch}\n{cache_line}\n{price_line}\n{pair_line}\n{dex_line}\n\n" + "\n".join(lines)
+
+    try:
+        await update.message.reply_text(report, parse_mode='MarkdownV2')
+    except Exception as e:
+        logging.error(f"Error sending message: {e}")
+
+
+async def padiscanstats(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handler for the /padiscanstats command: detector sus scanner paling lambat & paling sering kena."""
+    state = DETECTORS.snapshot(top=5)
+    pool = SCAN_POOL.snapshot()
+    lines = [escape_markdown_v2(f"Pool: {pool['workers']} worker(s) | done {pool['completed']} | timeout {pool['timeouts']} | restart {pool['restarts']}")]
+    lines.append("\n*Slowest \\(avg / max\\)*")
+    for r in state["slowest"]:
+        lines.append(escape_markdown_v2(f"• {r['name']}: {r['avg_ms']:.2f} / {r['max_ms']:.2f} ms ({r['runs']} runs)"))
+    lines.append("\n*Most hits*")
+    for r in state["most_hits"]:
+        lines.append(escape_markdown_v2(f"• {r['name']} [{r['severity']}]: {r['hits']}/{r['runs']}"))
+    if not state["slowest"]: lines.append(escape_markdown_v2("No scans yet"))
+    if state["disabled"]: lines.append(escape_markdown_v2(f"\nDisabled: {', '.join(state['disabled'])}"))
+    report = "*Sus Scanner Detectors*\n" + "\n".join(lines)
+
+    try:
+        await update.message.reply_text(report, parse_mode='MarkdownV2')
+    except Exception as e:
+        logging.error(f"Error sending message: {e}")
@@ -1,15 +1,18 @@
 # handlers_track.py
 
-import asyncio
-import httpx
 import logging
-from typing import List, Dict, Any, Set
+from typing import Set
 from telegram import Update
 from telegram.ext import ContextTypes
 from web3.exceptions import InvalidAddress
+from singleflight import SingleFlight
 
 from utils import (
     w3,
+    aw3,
+    wait_rpc_ready,
+    get_address_state,
+    HTTP_CLIENTS,
     PULSESCAN_API_BASE_URL,
     PULSESCAN_API_KEY,
     WPLS_ADDRESS,
@@ -20,12 +23,15 @@ from utils import (
     get_prices_graphql_batch,   # ✅ harga dari subgraph (V2 → V1)
 )
 
+# /paditrack bersamaan untuk wallet yang sama berbagi satu get_wallet_data_optimized
+TRACK_FLIGHT = SingleFlight("paditrack", retention=15.0)
+
 # --- FUNGSI DATA WALLET ---
 
-async def get_wallet_data_optimized(wallet_address: str):
+async def get_wallet_data_optimized(wallet_address: str, pls_wei: int = None):
     """
     Fungsi utama:
-    1. Ambil saldo PLS.
+    1. Ambil saldo PLS (dilewati kalau `pls_wei` sudah didapat dari batch validasi di paditrack).
     2. Ambil daftar Token via PulseScan.
     3. Ambil Harga Batch via Subgraph (PulseX V2 + V1).
     4. Hitung nilai PLS & token.
@@ -34,7 +40,7 @@ async def get_wallet_data_optimized(wallet_address: str):
     
     # 1. Ambil PLS Balance (Native)
     try:
-        pls_wei = await asyncio.to_thread(lambda: w3.eth.get_balance(checksum_addr))
+        if pls_wei is None: pls_wei = await aw3.eth.get_balance(checksum_addr)
         pls_balance = float(w3.from_wei(pls_wei, 'ether'))
     except Exception:
         pls_balance = 0.0
@@ -46,15 +52,14 @@ async def get_wallet_data_optimized(wallet_address: str):
         url_tokenlist += f"&apikey={PULSESCAN_API_KEY}"
 
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(url_tokenlist)
-            try:
-                data = response.json()
-            except ValueError:
-                logging.warning("PulseScan returned invalid JSON")
-                data = {}
-            if data.get('status') == '1' and isinstance(data.get('result'), list):
-                token_list = data['result']
+        response = await HTTP_CLIENTS.get(url_tokenlist).get(url_tokenlist, timeout=10)
+        try:
+            data = response.json()
+        except ValueError:
+            logging.warning("PulseScan returned invalid JSON")
+            data = {}
+        if data.get('status') == '1' and isinstance(data.get('result'), list):
+            token_list = data['result']
     except Exception:
         logging.warning("PulseScan API Tokenlist fetch failed.")
 
@@ -144,19 +149,18 @@ async def paditrack(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     wallet_address = context.args[0].strip()
 
-    # Cek koneksi
-    if not w3 or not w3.is_connected():
+    # Cek koneksi (menunggu warmup RpcPool kalau bot baru start)
+    if not await wait_rpc_ready():
         await update.message.reply_text("⚠️ RPC Connection Failed\\. Bot cannot fetch data\\.", parse_mode='MarkdownV2')
         return
 
-    # Validasi Address
+    # Validasi Address: eth_getCode + eth_getBalance + header block terbaru dalam satu batch POST
     try:
-        checksum_addr = w3.to_checksum_address(wallet_address)
-        code = await asyncio.to_thread(lambda: w3.eth.get_code(checksum_addr))
-        if code and len(code) > 0:
+        state = await get_address_state(wallet_address, include_balance=True)
+        if state["is_contract"]:
             await update.message.reply_text("❌ That’s a contract, not a wallet\\.", parse_mode='MarkdownV2')
             return
-    except InvalidAddress:
+    except (InvalidAddress, ValueError):
         await update.message.reply_text("❌ Invalid wallet address\\.", parse_mode='MarkdownV2')
         return
     except Exception:
@@ -166,7 +170,7 @@ async def paditrack(update: Update, context: ContextTypes.DEFAULT_TYPE):
     msg = await update.message.reply_text("⏳ *PADISCAN* is tracking wallet\\.\\.\\.", parse_mode='MarkdownV2')
 
     # --- CORE LOGIC ---
-    data = await get_wallet_data_optimized(wallet_address)
+    data = await TRACK_FLIGHT.do(state["address"], lambda: get_wallet_data_optimized(wallet_address, pls_wei=state["balance_wei"]))
     
     # --- FORMATTING ---
     total_net_worth = data['pls_value'] + data['total_token_value']
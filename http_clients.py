@@ -0,0 +1,67 @@
+# http_clients.py
+
+import os
+import logging
+import importlib.util
+from typing import Dict, Iterable
+from urllib.parse import urlsplit
+import httpx
+
+# --- KONFIGURASI HTTP CLIENT ---
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "20"))
+HTTP_MAX_KEEPALIVE_PER_HOST = 10
+HTTP_KEEPALIVE_EXPIRY = 60.0   # Detik koneksi idle dibiarkan terbuka sebelum ditutup
+# HTTP/2 butuh paket `h2` (pip install httpx[http2]); tanpa itu otomatis turun ke HTTP/1.1 keep-alive
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() in ("1", "true", "yes") and importlib.util.find_spec("h2") is not None
+
+
+def build_async_client(timeout: float = HTTP_TIMEOUT, **kwargs) -> httpx.AsyncClient:
+    """httpx.AsyncClient dengan limit koneksi, keep-alive dan HTTP/2 (kalau tersedia)."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout, connect=min(timeout, HTTP_CONNECT_TIMEOUT)),
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_PER_HOST,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        http2=HTTP2_ENABLED,
+        **kwargs,
+    )
+
+
+class HttpClientRegistry:
+    """
+    Satu httpx.AsyncClient per host upstream (subgraph, PulseScan, Dexscreener, Sourcify, CoinGecko),
+    dipakai bersama oleh semua handler. Koneksi TCP+TLS di-reuse antar request, dan limit koneksi
+    berlaku per host. Dibuka dari main.post_init dan ditutup dari main.post_shutdown.
+    """
+
+    def __init__(self, warm_hosts: Iterable[str] = ()):
+        self.warm_hosts = list(warm_hosts)
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        """Client untuk host dari `url` (dibuat lazy kalau host belum terdaftar)."""
+        key = self._host_key(url)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = build_async_client()
+            self._clients[key] = client
+        return client
+
+    async def start(self):
+        for host in self.warm_hosts: self.get(host)
+        logging.info(f"HTTP clients ready for {len(self._clients)} hosts (HTTP/2: {'on' if HTTP2_ENABLED else 'off'}).")
+
+    async def aclose(self):
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try: await client.aclose()
+            except Exception as e: logging.debug(f"HTTP client close failed: {type(e).__name__}: {e}")
@@ -2,16 +2,16 @@
 
 import os
 import logging
-from web3 import Web3
 from dotenv import load_dotenv
 from telegram import Update
 from telegram.ext import CommandHandler, ApplicationBuilder
 
 # --- IMPORTS DARI MODUL SENDIRI ---
-# HANYA impor w3 dan error_handler dari utils.py
-from utils import w3, error_handler 
+# HANYA impor RPC_POOL dan error_handler dari utils.py (import utils tidak menyentuh jaringan)
+from utils import RPC_POOL, HTTP_CLIENTS, VERIFY_STORE, SCAN_CACHE, SCAN_POOL, PRICE_CACHE, PAIR_INDEX, PAIR_INDEX_ENABLED, error_handler 
 from handlers_scan import padiscan
 from handlers_track import paditrack
+from handlers_status import padirpc, padiscanstats
 
 # Konfigurasi Logging
 logging.basicConfig(
@@ -19,6 +19,27 @@ logging.basicConfig(
     level=logging.INFO
 )
 
+async def post_init(application):
+    """
+    Jalan sekali setelah Application siap. Koneksi RPC dibangun di background
+    supaya polling Telegram langsung jalan; handler menunggu lewat wait_rpc_ready().
+    """
+    await HTTP_CLIENTS.start()
+    application.create_task(RPC_POOL.warmup())
+    application.create_task(RPC_POOL.run_health_checks())
+    application.create_task(SCAN_POOL.start())
+    if PAIR_INDEX_ENABLED: application.create_task(PAIR_INDEX.run())
+
+async def post_shutdown(application):
+    """Tutup koneksi keep-alive HTTP (upstream API + RPC), cache lokal, dan worker scanner saat bot berhenti."""
+    await PRICE_CACHE.aclose()
+    await HTTP_CLIENTS.aclose()
+    await RPC_POOL.aclose()
+    VERIFY_STORE.close()
+    SCAN_CACHE.close()
+    SCAN_POOL.shutdown()
+    PAIR_INDEX.close()
+
 def main():
     """Fungsi utama untuk menjalankan bot."""
     
@@ -41,26 +62,18 @@ def main():
     if not HONEY_V2_ADDRESS or not HONEY_V1_ADDRESS:
         print("⚠️ Warning: HONEY_V2_ADDRESS and HONEY_V1_ADDRESS should be set in .env for accurate Tax checks.")
 
-    # 3. Validasi Koneksi Web3
-    # Catatan: w3 diinisialisasi di utils.py, kita cek statusnya di sini
-    if w3 is None:
-        print("❌ Error: Web3 Initialization Failed. Check PULSECHAIN_RPC_URL.")
-        return
-
-    if not w3.is_connected():
-        print("❌ Error: Failed to connect to PulseChain RPC.")
-        print(f"       -> Attempting connection to: {PULSECHAIN_RPC_URL}")
-        return
-        
-    print("✅ Connected to PulseChain RPC. PadiBot (Scanner & Tracker) is running...")
+    # 3. Koneksi Web3 tidak dicek di sini lagi (non-blocking startup, lihat post_init)
+    print("🚀 PadiBot (Scanner & Tracker) is starting... RPC pool connects in the background.")
 
     try:
         # 4. Inisialisasi Bot
-        application = ApplicationBuilder().token(TELEGRAM_TOKEN).build()
+        application = ApplicationBuilder().token(TELEGRAM_TOKEN).post_init(post_init).post_shutdown(post_shutdown).build()
 
         # --- COMMAND HANDLERS ---
         application.add_handler(CommandHandler("padiscan", padiscan))
         application.add_handler(CommandHandler("paditrack", paditrack))
+        application.add_handler(CommandHandler("padirpc", padirpc))
+        application.add_handler(CommandHandler("padiscanstats", padiscanstats))
         
         # Tambahkan error handler
         application.add_error_handler(error_handler)
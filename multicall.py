@@ -0,0 +1,134 @@
+# multicall.py
+
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
+from eth_abi import encode, decode
+from web3 import Web3
+from call_cache import CallCache, Bucket, MISS
+
+# --- KONFIGURASI MULTICALL3 ---
+# Multicall3 ada di alamat yang sama di hampir semua EVM chain. PulseChain adalah fork Ethereum,
+# jadi kontrak ini ikut ter-copy dari state Ethereum.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL_MAX_CALLS = 150  # Batas call per aggregate3 agar tidak kena gas cap eth_call RPC publik
+
+AGGREGATE3_SIGNATURE = "aggregate3((address,bool,bytes)[])"
+
+
+@lru_cache(maxsize=256)
+def function_selector(signature: str) -> bytes:
+    return bytes(Web3.keccak(text=signature)[:4])
+
+
+def _signature_arg_types(signature: str) -> List[str]:
+    inner = signature[signature.index("(") + 1:signature.rindex(")")]
+    return [t.strip() for t in inner.split(",") if t.strip()]
+
+
+class Call:
+    """Satu eth_call read-only (target + signature) yang akan digabung ke aggregate3."""
+    __slots__ = ("target", "signature", "args", "returns", "calldata")
+
+    def __init__(self, target: str, signature: str, args: Sequence[Any] = (), returns: Sequence[str] = ("uint256",)):
+        self.target = Web3.to_checksum_address(target)
+        self.signature = signature
+        self.args = tuple(args)
+        self.returns = tuple(returns)
+        arg_types = _signature_arg_types(signature)
+        self.calldata = function_selector(signature) + (encode(arg_types, list(self.args)) if arg_types else b"")
+
+    def decode_result(self, data: bytes) -> Any:
+        if not data: return None
+        try: values = decode(list(self.returns), bytes(data))
+        except Exception: return None
+        return values[0] if len(values) == 1 else values
+
+
+def encode_aggregate3(calls: Sequence[Call]) -> str:
+    payload = encode(["(address,bool,bytes)[]"], [[(c.target, True, c.calldata) for c in calls]])
+    return "0x" + (function_selector(AGGREGATE3_SIGNATURE) + payload).hex()
+
+
+def decode_aggregate3(calls: Sequence[Call], raw: bytes) -> List[Any]:
+    results: List[Tuple[bool, bytes]] = decode(["(bool,bytes)[]"], bytes(raw))[0]
+    return [c.decode_result(data) if ok else None for c, (ok, data) in zip(calls, results)]
+
+
+def _chunks(calls: Sequence[Call]):
+    for i in range(0, len(calls), MULTICALL_MAX_CALLS):
+        yield calls[i:i + MULTICALL_MAX_CALLS]
+
+
+def _cache_lookup(cache: Optional[CallCache], calls: Sequence[Call], bucket: Optional[Bucket]) -> Tuple[List[Any], List[int]]:
+    out: List[Any] = [None] * len(calls)
+    if cache is None or bucket is None: return out, list(range(len(calls)))
+    missing: List[int] = []
+    for i, c in enumerate(calls):
+        value = cache.get(c.target, c.calldata, bucket)
+        if value is MISS: missing.append(i)
+        else: out[i] = value
+    return out, missing
+
+
+def _cache_store(cache: Optional[CallCache], calls: Sequence[Call], missing: List[int], values: List[Any], bucket: Optional[Bucket], out: List[Any]):
+    for i, value in zip(missing, values):
+        out[i] = value
+        if cache is not None: cache.put(calls[i].target, calls[i].calldata, bucket, value)
+
+
+async def _single_call_async(aw3, call: Call) -> Any:
+    try:
+        raw = await aw3.eth.call({"to": call.target, "data": "0x" + call.calldata.hex()})
+        return call.decode_result(raw)
+    except Exception:
+        return None
+
+
+async def multicall_async(aw3, calls: Sequence[Call], block_identifier: Any = "latest", cache: Optional[CallCache] = None) -> List[Optional[Any]]:
+    """
+    Jalankan banyak eth_call (AsyncWeb3) dalam satu (atau beberapa) aggregate3.
+    - allowFailure=True per call: call yang revert hasilnya None, yang lain tetap jalan.
+    - Kalau aggregate3 sendiri gagal (RPC error), fallback ke eth_call satu per satu.
+    - Dengan `cache` (hanya untuk "latest"), call yang masih segar di block bucket sekarang tidak dikirim lagi.
+    """
+    if not calls: return []
+    calls = list(calls)
+    bucket = await cache.current_bucket() if cache is not None and block_identifier == "latest" else None
+    out, missing = _cache_lookup(cache, calls, bucket)
+    if missing:
+        values = await _multicall_async_uncached(aw3, [calls[i] for i in missing], block_identifier)
+        _cache_store(cache, calls, missing, values, bucket, out)
+    return out
+
+
+async def _multicall_async_uncached(aw3, calls: List[Call], block_identifier: Any) -> List[Optional[Any]]:
+    out: List[Optional[Any]] = []
+    for chunk in _chunks(list(calls)):
+        try:
+            raw = await aw3.eth.call({"to": MULTICALL3_ADDRESS, "data": encode_aggregate3(chunk)}, block_identifier)
+            out.extend(decode_aggregate3(chunk, raw))
+        except Exception as e:
+            logging.warning(f"Multicall3 aggregate3 failed ({type(e).__name__}), falling back to single calls.")
+            out.extend(await asyncio.gather(*(_single_call_async(aw3, c) for c in chunk)))
+    return out
+
+
+# --- CALL BUILDER (ERC20 / LP) ---
+def erc20_metadata_calls(token: str, include_owner: bool = False) -> List[Call]:
+    calls = [
+        Call(token, "name()", returns=("string",)),
+        Call(token, "symbol()", returns=("string",)),
+        Call(token, "decimals()", returns=("uint8",)),
+    ]
+    if include_owner: calls.append(Call(token, "owner()", returns=("address",)))
+    return calls
+
+
+def balance_of_call(token: str, holder: str) -> Call:
+    return Call(token, "balanceOf(address)", (Web3.to_checksum_address(holder),))
+
+
+def total_supply_call(token: str) -> Call:
+    return Call(token, "totalSupply()")
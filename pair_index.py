@@ -0,0 +1,255 @@
+# pair_index.py
+
+import os
+import asyncio
+import sqlite3
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+# --- KONFIGURASI INDEX PAIR PULSEX ---
+PAIR_INDEX_PATH = os.getenv("PAIR_INDEX_PATH", "pair_index.sqlite3")
+PAIR_INDEX_START_BLOCK = int(os.getenv("PAIR_INDEX_START_BLOCK", "17233000"))     # Block fork PulseChain; factory PulseX dibuat sesudahnya
+PAIR_INDEX_BLOCK_RANGE = int(os.getenv("PAIR_INDEX_BLOCK_RANGE", "20000"))        # Span eth_getLogs awal (diperkecil otomatis kalau RPC menolak)
+PAIR_INDEX_CONFIRMATIONS = int(os.getenv("PAIR_INDEX_CONFIRMATIONS", "6"))        # Block terakhir yang belum di-index (jaga-jaga reorg)
+PAIR_INDEX_MAX_LAG = int(os.getenv("PAIR_INDEX_MAX_LAG", "300"))                  # Index dianggap siap kalau tertinggal <= ini dari head
+PAIR_INDEX_POLL_INTERVAL = float(os.getenv("PAIR_INDEX_POLL_INTERVAL", "30"))     # Detik antar sync setelah backfill selesai
+
+# keccak256("PairCreated(address,address,address,uint256)")
+PAIR_CREATED_TOPIC = "0x0d3648bd0f6ba80134a33ba9275ac585d9d315f0ad8355cddefde31afa28d0e9"
+MIN_BLOCK_RANGE = 100
+BLOCK_RANGE_RECOVER_AFTER = 10   # Span getLogs dilipatduakan lagi (maks span awal) setelah sekian range berturut-turut sukses
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS pairs (
+        pair      TEXT    PRIMARY KEY,
+        factory   TEXT    NOT NULL,
+        token0    TEXT    NOT NULL,
+        token1    TEXT    NOT NULL,
+        block     INTEGER NOT NULL,
+        log_index INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS pairs_token0 ON pairs (token0)",
+    "CREATE INDEX IF NOT EXISTS pairs_token1 ON pairs (token1)",
+    "CREATE TABLE IF NOT EXISTS sync_state (name TEXT PRIMARY KEY, last_block INTEGER NOT NULL)",
+)
+
+LogFetcher = Callable[[Dict[str, Any]], Awaitable[List[Dict[str, Any]]]]
+BlockSource = Callable[[], Awaitable[Optional[int]]]
+
+
+class PairRecord(NamedTuple):
+    pair: str
+    factory: str
+    token0: str
+    token1: str
+    block: int
+
+
+def _topic_address(topic: str) -> str:
+    return "0x" + topic[-40:].lower()
+
+
+def _to_int(value: Any) -> int:
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def parse_pair_created(log: Dict[str, Any]) -> Optional[PairRecord]:
+    """Log PairCreated(token0 indexed, token1 indexed, pair, allPairsLength) -> PairRecord."""
+    try:
+        topics, data = log["topics"], log["data"]
+        if len(topics) < 3 or topics[0].lower() != PAIR_CREATED_TOPIC: return None
+        data = data[2:] if data.startswith("0x") else data
+        return PairRecord("0x" + data[24:64].lower(), log["address"].lower(), _topic_address(topics[1]),
+                          _topic_address(topics[2]), _to_int(log["blockNumber"]))
+    except (KeyError, IndexError, TypeError, ValueError, AttributeError):
+        return None
+
+
+class PairIndex:
+    """
+    Index lokal (SQLite) semua pair factory PulseX dari log PairCreated, jadi "semua pair untuk token X"
+    cukup satu SELECT, tanpa subgraph. Sync = backfill dari start_block lalu mengikuti head; checkpoint
+    (block terakhir yang sudah di-index) ditulis di transaksi yang sama dengan pair-nya, jadi restart
+    melanjutkan dari checkpoint tanpa duplikat. Block `confirmations` terakhir tidak di-index.
+    """
+
+    def __init__(self, factories: List[str], get_logs: LogFetcher, get_block_number: BlockSource,
+                 path: str = PAIR_INDEX_PATH, start_block: int = PAIR_INDEX_START_BLOCK, block_range: int = PAIR_INDEX_BLOCK_RANGE,
+                 confirmations: int = PAIR_INDEX_CONFIRMATIONS, max_lag: int = PAIR_INDEX_MAX_LAG):
+        self.factories = sorted(f.lower() for f in factories)
+        self.get_logs = get_logs
+        self.get_block_number = get_block_number
+        self.path = path
+        self.start_block = start_block
+        self.block_range = self.max_block_range = max(MIN_BLOCK_RANGE, block_range)
+        self._range_ok_streak = 0
+        self.confirmations = confirmations
+        self.max_lag = max_lag
+        self._name = ",".join(self.factories)   # Set factory berubah -> checkpoint baru, backfill ulang
+        self._lock = threading.Lock()          # Koneksi tulis (dipakai dari thread sync)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._read_lock = threading.Lock()     # Koneksi baca terpisah: WAL membolehkan SELECT selama transaksi tulis berjalan
+        self._reader: Optional[sqlite3.Connection] = None
+        self._checkpoint: Optional[int] = None   # Salinan memori last_block, supaya `ready` tidak menyentuh SQLite
+        self._stopped = False
+        self.head: Optional[int] = None
+        self.logs_indexed = 0
+        self.sync_errors = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for stmt in _SCHEMA: self._conn.execute(stmt)
+            self._conn.commit()
+        return self._conn
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        if self._reader is None:
+            self._reader = sqlite3.connect(self.path, check_same_thread=False)
+            for stmt in _SCHEMA: self._reader.execute(stmt)   # No-op kalau tabel sudah dibuat koneksi tulis
+            self._reader.commit()
+        return self._reader
+
+    # --- Checkpoint ---
+    def checkpoint(self) -> int:
+        """
+        Block terakhir yang sudah di-index (start_block - 1 kalau belum pernah sync). Dibaca dari SQLite sekali
+        (sync_once memanggilnya lewat asyncio.to_thread), sesudahnya dari memori yang di-update oleh _store.
+        """
+        if self._checkpoint is None:
+            with self._read_lock:
+                row = self._connect_reader().execute("SELECT last_block FROM sync_state WHERE name = ?", (self._name,)).fetchone()
+            self._checkpoint = row[0] if row else self.start_block - 1
+        return self._checkpoint
+
+    def _store(self, records: List[PairRecord], log_indexes: List[int], last_block: int):
+        """Dipanggil lewat asyncio.to_thread: executemany + commit SQLite tidak boleh memblokir event loop."""
+        with self._lock:
+            if self._stopped: return   # close() sudah jalan; jangan buka koneksi lagi
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO pairs (pair, factory, token0, token1, block, log_index) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(r.pair, r.factory, r.token0, r.token1, r.block, li) for r, li in zip(records, log_indexes)],
+                )
+                conn.execute("INSERT OR REPLACE INTO sync_state (name, last_block) VALUES (?, ?)", (self._name, last_block))
+            self._checkpoint = last_block
+
+    @property
+    def ready(self) -> bool:
+        """True kalau index sudah mengejar head (jawaban 'tidak ada pair' bisa dipercaya). Hanya baca memori."""
+        if self.head is None or self._checkpoint is None: return False
+        return self.head - self._checkpoint <= self.max_lag + self.confirmations
+
+    # --- Sync ---
+    async def _fetch_range(self, from_block: int, to_block: int) -> List[Dict[str, Any]]:
+        return await self.get_logs({
+            "address": self.factories, "topics": [PAIR_CREATED_TOPIC],
+            "fromBlock": hex(from_block), "toBlock": hex(to_block),
+        })
+
+    async def sync_once(self, max_ranges: int = 50) -> int:
+        """Index maksimal `max_ranges` span eth_getLogs; return jumlah block yang maju (0 = sudah di head)."""
+        head = await self.get_block_number()
+        if head is None: return 0
+        self.head = head
+        target = head - self.confirmations
+        start = cursor = await asyncio.to_thread(self.checkpoint) + 1
+        for _ in range(max_ranges):
+            if cursor > target or self._stopped: break
+            to_block = min(target, cursor + self.block_range - 1)
+            try:
+                logs = await self._fetch_range(cursor, to_block)
+            except Exception as e:
+                # RPC publik membatasi span/jumlah hasil getLogs: perkecil span lalu coba lagi
+                self.sync_errors += 1
+                self._range_ok_streak = 0
+                if self.block_range > MIN_BLOCK_RANGE:
+                    self.block_range = max(MIN_BLOCK_RANGE, self.block_range // 2)
+                    logging.info(f"Pair index: getLogs {cursor}-{to_block} failed ({type(e).__name__}), range -> {self.block_range}")
+                    continue
+                logging.warning(f"Pair index sync failed at block {cursor}: {type(e).__name__}: {e}")
+                break
+            if self._stopped: break
+            records, log_indexes = [], []
+            for log in logs:
+                rec = parse_pair_created(log)
+                if rec is None or rec.factory not in self.factories: continue
+                records.append(rec); log_indexes.append(_to_int(log.get("logIndex", 0)))
+            await asyncio.to_thread(self._store, records, log_indexes, to_block)
+            self.logs_indexed += len(records)
+            cursor = to_block + 1
+            # Error getLogs bisa cuma sesaat: kalau span kecil terus sukses, naikkan lagi supaya backfill tidak lambat selamanya
+            self._range_ok_streak += 1
+            if self.block_range < self.max_block_range and self._range_ok_streak >= BLOCK_RANGE_RECOVER_AFTER:
+                self.block_range = min(self.max_block_range, self.block_range * 2)
+                self._range_ok_streak = 0
+        return cursor - start
+
+    async def run(self, poll_interval: float = PAIR_INDEX_POLL_INTERVAL):
+        """Loop background: backfill secepatnya, lalu poll head tiap `poll_interval` detik."""
+        while not self._stopped:
+            try:
+                advanced = await self.sync_once()
+            except Exception as e:
+                self.sync_errors += 1
+                logging.warning(f"Pair index sync error: {type(e).__name__}: {e}")
+                advanced = 0
+            if advanced == 0 or self.ready:
+                await asyncio.sleep(poll_interval)
+            else:
+                await asyncio.sleep(0)
+        logging.info("Pair index sync stopped")
+
+    # --- Query ---
+    def pairs_for(self, token: str, other: Optional[str] = None) -> List[PairRecord]:
+        """
+        Semua pair yang memuat `token` (opsional: hanya pasangan dengan `other`), pair terlama dulu.
+        SELECT sinkron lewat koneksi baca; dari kode async panggil via asyncio.to_thread.
+        """
+        token = token.lower()
+        sql = "SELECT pair, factory, token0, token1, block FROM pairs WHERE (token0 = ? OR token1 = ?)"
+        args: List[Any] = [token, token]
+        if other is not None:
+            other = other.lower()
+            sql += " AND (token0 = ? OR token1 = ?)"
+            args += [other, other]
+        try:
+            with self._read_lock:
+                rows = self._connect_reader().execute(sql + " ORDER BY block, log_index", args).fetchall()
+        except sqlite3.Error as e:
+            logging.warning(f"Pair index read failed: {e}")
+            return []
+        return [PairRecord(*row) for row in rows]
+
+    def pair_for(self, factory: str, token: str, other: str) -> Optional[str]:
+        factory = factory.lower()
+        for rec in self.pairs_for(token, other):
+            if rec.factory == factory: return rec.pair
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """COUNT(*) sinkron; dari kode async panggil via asyncio.to_thread."""
+        try:
+            with self._read_lock:
+                count = self._connect_reader().execute("SELECT COUNT(*) FROM pairs").fetchone()[0]
+            checkpoint = self.checkpoint()
+        except sqlite3.Error:
+            count, checkpoint = 0, None
+        return {"pairs": count, "checkpoint": checkpoint, "head": self.head, "ready": self.ready,
+                "block_range": self.block_range, "errors": self.sync_errors}
+
+    def close(self):
+        self._stopped = True
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        with self._read_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
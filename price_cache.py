@@ -0,0 +1,111 @@
+# price_cache.py
+
+import os
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Set, Tuple
+
+# --- KONFIGURASI CACHE HARGA TOKEN ---
+PRICE_CACHE_TTL = float(os.getenv("PRICE_CACHE_TTL", "60"))                    # Detik harga dianggap fresh
+PRICE_CACHE_STALE_TTL = float(os.getenv("PRICE_CACHE_STALE_TTL", "900"))       # Lewat TTL tapi di bawah ini: dipakai langsung + refresh di background
+PRICE_CACHE_NEGATIVE_TTL = float(os.getenv("PRICE_CACHE_NEGATIVE_TTL", "600")) # Alamat tanpa harga di subgraph tidak di-query ulang selama ini
+PRICE_CACHE_MAX_ENTRIES = int(os.getenv("PRICE_CACHE_MAX_ENTRIES", "10000"))   # LRU: entry paling lama tidak dipakai dibuang duluan
+
+PriceFetcher = Callable[[List[str]], Awaitable[Dict[str, float]]]
+
+
+class PriceLookup(NamedTuple):
+    prices: Dict[str, float]   # Harga fresh + stale (entry negatif tidak dimasukkan)
+    missing: List[str]         # Tidak ada / terlalu tua: harus di-fetch sebelum menjawab
+    stale: List[str]           # Sudah dijawab dari cache, tapi perlu di-refresh
+
+
+class PriceCache:
+    """
+    Cache harga USD per alamat token (lowercase) di depan get_prices_graphql_batch.
+    - Umur <= ttl: fresh. Umur <= stale_ttl: tetap dipakai, alamatnya di-refresh di background (stale-while-revalidate).
+    - Harga 0.0 = entry negatif (subgraph menjawab tapi token tidak punya harga), berlaku negative_ttl.
+    - Fetcher mengembalikan {alamat: harga}; alamat yang tidak ada di hasil (mis. subgraph error) tidak di-cache.
+    """
+
+    def __init__(self, ttl: float = PRICE_CACHE_TTL, stale_ttl: float = PRICE_CACHE_STALE_TTL,
+                 negative_ttl: float = PRICE_CACHE_NEGATIVE_TTL, max_entries: int = PRICE_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.stale_ttl = max(ttl, stale_ttl)
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    def lookup(self, addresses: Iterable[str]) -> PriceLookup:
+        now = time.monotonic()
+        prices: Dict[str, float] = {}
+        missing: List[str] = []
+        stale: List[str] = []
+        for addr in dict.fromkeys(addresses):
+            entry = self._entries.get(addr)
+            if entry is None: self.misses += 1; missing.append(addr); continue
+            age, price = now - entry[0], entry[1]
+            if price <= 0:
+                if age <= self.negative_ttl: self.negative_hits += 1; self._entries.move_to_end(addr); continue
+                self.misses += 1; missing.append(addr); continue
+            if age > self.stale_ttl: self.misses += 1; missing.append(addr); continue
+            self._entries.move_to_end(addr)
+            prices[addr] = price
+            if age <= self.ttl: self.hits += 1
+            else: self.stale_hits += 1; stale.append(addr)
+        return PriceLookup(prices, missing, stale)
+
+    def put(self, prices: Dict[str, float]):
+        now = time.monotonic()
+        for addr, price in prices.items():
+            self._entries[addr] = (now, price if price > 0 else 0.0)
+            self._entries.move_to_end(addr)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def refresh(self, addresses: Iterable[str], fetch: PriceFetcher):
+        """Refresh di background; alamat yang sedang di-refresh tidak di-fetch dobel."""
+        todo = [a for a in dict.fromkeys(addresses) if a not in self._refreshing]
+        if not todo: return
+        self._refreshing.update(todo)
+        self.refreshes += 1
+
+        async def run():
+            try:
+                self.put(await fetch(todo))
+            except Exception as e:
+                logging.warning(f"Background price refresh failed ({len(todo)} token(s)): {type(e).__name__}: {e}")
+            finally:
+                self._refreshing.difference_update(todo)
+
+        task = asyncio.ensure_future(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def aclose(self):
+        for task in list(self._tasks): task.cancel()
+        if self._tasks: await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = self.hits + self.stale_hits + self.negative_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": ((total - self.misses) / total) if total else 0.0,
+            "refreshes": self.refreshes,
+            "evictions": self.evictions,
+        }
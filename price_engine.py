@@ -0,0 +1,169 @@
+# price_engine.py
+
+import os
+import time
+import asyncio
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from web3 import Web3
+
+from multicall import Call, multicall_async
+from call_cache import CallCache
+
+# --- KONFIGURASI PRICE ENGINE ON-CHAIN ---
+PULSEX_V1_FACTORY = os.getenv("PULSEX_V1_FACTORY", "0x1715a3E4A142d8b698131108995174F37aEBA10D")
+PULSEX_V2_FACTORY = os.getenv("PULSEX_V2_FACTORY", "0x29eA7545DEf87022BAdc76323F373EA1e707C523")
+PULSEX_FACTORIES = {PULSEX_V2_FACTORY: "PulseX V2", PULSEX_V1_FACTORY: "PulseX V1"}
+# Anchor USD: pair WPLS/stablecoin bridge (DAI, USDC, USDT dari Ethereum); pair dengan WPLS terbanyak yang dipakai
+PRICE_ENGINE_STABLECOINS = [a.strip() for a in os.getenv(
+    "PRICE_ENGINE_STABLECOINS",
+    "0xefD766cCb38EaF1dfd701853BFCe31359239F305,0x15D38573d2feeb82e7ad5187aB8c1D52810B1f07,0x0Cb6F5a34ad42ec934882A05265A7d5F59b51A2f",
+).split(",") if a.strip()]
+PRICE_ENGINE_MIN_WPLS_RESERVE = float(os.getenv("PRICE_ENGINE_MIN_WPLS_RESERVE", "1000000"))   # Pair dengan WPLS lebih sedikit dari ini diabaikan (harga mudah dimanipulasi)
+PRICE_ENGINE_MAX_KNOWN = int(os.getenv("PRICE_ENGINE_MAX_KNOWN", "50000"))                     # Batas memo pair/token0/decimals (immutable) sebelum dikosongkan
+PRICE_ENGINE_NO_PAIR_RECHECK = float(os.getenv("PRICE_ENGINE_NO_PAIR_RECHECK", "600"))         # Detik sebelum "belum ada pair" dicek ulang lewat getPair
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+class PairQuote(NamedTuple):
+    token: str            # lowercase
+    pair: str             # checksum
+    source: str           # "PulseX V1" / "PulseX V2"
+    price_usd: float
+    liquidity_usd: float  # 2 x nilai sisi WPLS
+
+
+class OnchainPriceEngine:
+    """
+    Harga USD langsung dari reserve pair PulseX (tanpa subgraph/indexer):
+      token -> pair token/WPLS (V1 & V2, pilih yang WPLS-nya paling banyak) -> WPLS -> pair WPLS/stablecoin.
+    Satu batch = 2 multicall: getPair untuk pasangan yang belum dikenal (hasilnya immutable, disimpan di memory),
+    lalu getReserves (+ token0/decimals yang belum dikenal) lewat CALL_CACHE, jadi harga segar per block bucket.
+    Kalau `pair_index` (PairIndex lokal) sudah mengejar head, pair dibaca dari situ dan getPair dilewati.
+    """
+
+    def __init__(self, aw3, wpls: str, cache: Optional[CallCache] = None, factories: Dict[str, str] = PULSEX_FACTORIES,
+                 stablecoins: Iterable[str] = PRICE_ENGINE_STABLECOINS, min_wpls_reserve: float = PRICE_ENGINE_MIN_WPLS_RESERVE,
+                 pair_index=None):
+        self.aw3 = aw3
+        self.cache = cache
+        self.wpls = wpls.lower()
+        self.factories = dict(factories)
+        self.stablecoins = [s.lower() for s in stablecoins]
+        self.min_wpls_raw = int(min_wpls_reserve * 10 ** 18)
+        self.pair_index = pair_index
+        self._pairs: Dict[Tuple[str, str], Optional[str]] = {}   # (factory, token) -> pair token/WPLS, None = tidak ada
+        self._no_pair_at: Dict[Tuple[str, str], float] = {}      # Kapan getPair menjawab "tidak ada" (pair bisa dibuat belakangan)
+        self._token0: Dict[str, str] = {}
+        self._decimals: Dict[str, int] = {}
+        self.batches = 0
+
+    def _trim(self):
+        for memo in (self._pairs, self._no_pair_at, self._token0, self._decimals):
+            if len(memo) > PRICE_ENGINE_MAX_KNOWN: memo.clear()
+
+    def _resolve_from_index(self, tokens: List[str]):
+        for t in tokens:
+            found = {rec.factory: rec.pair for rec in self.pair_index.pairs_for(t, self.wpls)}
+            for f in self.factories:
+                pair = found.get(f.lower())
+                self._pairs[(f, t)] = Web3.to_checksum_address(pair) if pair else None
+
+    async def _resolve_pairs(self, tokens: List[str]):
+        if self.pair_index is not None and self.pair_index.ready:
+            await asyncio.to_thread(self._resolve_from_index, tokens); return
+        now = time.monotonic()
+        todo = [(f, t) for t in tokens for f in self.factories
+                if (f, t) not in self._pairs or (self._pairs[(f, t)] is None and now - self._no_pair_at.get((f, t), 0.0) > PRICE_ENGINE_NO_PAIR_RECHECK)]
+        if not todo: return
+        calls = [Call(f, "getPair(address,address)", (Web3.to_checksum_address(t), Web3.to_checksum_address(self.wpls)), returns=("address",)) for f, t in todo]
+        values = await multicall_async(self.aw3, calls)
+        for key, pair in zip(todo, values):
+            # None = call gagal, jangan di-memo supaya dicoba lagi di batch berikutnya
+            if pair is None: continue
+            self._pairs[key] = None if pair.lower() == ZERO_ADDRESS else Web3.to_checksum_address(pair)
+            if self._pairs[key] is None: self._no_pair_at[key] = now
+
+    async def _pair_state(self, pairs: List[str], tokens: List[str]) -> Dict[str, Tuple[int, int]]:
+        """Return {pair: (reserve token lain, reserve WPLS)}; decimals yang belum dikenal ikut diisi ke memo."""
+        new_t0 = [p for p in pairs if p not in self._token0]
+        new_dec = [t for t in tokens if t not in self._decimals]
+        calls = [Call(p, "getReserves()", returns=("uint112", "uint112", "uint32")) for p in pairs]
+        calls += [Call(p, "token0()", returns=("address",)) for p in new_t0]
+        calls += [Call(t, "decimals()", returns=("uint8",)) for t in new_dec]
+        values = await multicall_async(self.aw3, calls, cache=self.cache)
+        n, m = len(pairs), len(new_t0)
+        for p, t0 in zip(new_t0, values[n:n + m]):
+            if t0 is not None: self._token0[p] = t0.lower()
+        for t, dec in zip(new_dec, values[n + m:]):
+            if dec is not None and 0 <= dec <= 36: self._decimals[t] = dec
+        state = {}
+        for p, res in zip(pairs, values[:n]):
+            t0 = self._token0.get(p)
+            if res is None or t0 is None: continue
+            r0, r1 = int(res[0]), int(res[1])
+            state[p] = (r1, r0) if t0 == self.wpls else (r0, r1)
+        return state
+
+    def _best(self, token: str, state: Dict[str, Tuple[int, int]]) -> Optional[Tuple[str, str, int, int]]:
+        best = None
+        for f, source in self.factories.items():
+            pair = self._pairs.get((f, token))
+            if not pair or pair not in state: continue
+            r_token, r_wpls = state[pair]
+            if r_token <= 0 or r_wpls < self.min_wpls_raw: continue
+            if best is None or r_wpls > best[3]: best = (pair, source, r_token, r_wpls)
+        return best
+
+    def _answered(self, token: str) -> bool:
+        return all((f, token) in self._pairs for f in self.factories)
+
+    async def quotes(self, addresses: Iterable[str]) -> Dict[str, Optional[PairQuote]]:
+        """
+        {token: PairQuote} untuk token yang punya pair WPLS cukup likuid, {token: None} kalau tidak punya;
+        token yang lookup-nya gagal (RPC error) tidak ada di hasil. Kosong kalau anchor WPLS/USD gagal.
+        """
+        tokens = list(dict.fromkeys(a.lower() for a in addresses if a))
+        if not tokens or self.aw3 is None: return {}
+        self._trim()
+        self.batches += 1
+        lookup = [t for t in dict.fromkeys(tokens + self.stablecoins) if t != self.wpls]
+        try:
+            await self._resolve_pairs(lookup)
+            pairs = list(dict.fromkeys(p for t in lookup for f in self.factories for p in [self._pairs.get((f, t))] if p))
+            state = await self._pair_state(pairs, lookup)
+        except Exception as e:
+            logging.warning(f"On-chain price batch failed: {type(e).__name__}: {e}")
+            return {}
+
+        # --- Anchor: WPLS/USD dari pair stablecoin paling likuid ---
+        anchor = None
+        for s in self.stablecoins:
+            best = self._best(s, state)
+            if best and s in self._decimals and (anchor is None or best[3] > anchor[1][3]): anchor = (s, best)
+        if anchor is None:
+            logging.warning("On-chain price engine: no liquid WPLS/stablecoin pair, cannot anchor USD")
+            return {}
+        stable, (a_pair, a_source, r_stable, r_wpls) = anchor
+        wpls_usd = (r_stable / 10 ** self._decimals[stable]) / (r_wpls / 10 ** 18)
+
+        out: Dict[str, Optional[PairQuote]] = {}
+        for t in tokens:
+            if t == self.wpls:
+                out[t] = PairQuote(t, a_pair, a_source, wpls_usd, 2 * r_wpls / 10 ** 18 * wpls_usd); continue
+            best = self._best(t, state)
+            if best is None or t not in self._decimals:
+                if self._answered(t) and best is None: out[t] = None
+                continue
+            pair, source, r_token, r_w = best
+            price = (r_w / 10 ** 18) / (r_token / 10 ** self._decimals[t]) * wpls_usd
+            out[t] = PairQuote(t, pair, source, price, 2 * r_w / 10 ** 18 * wpls_usd)
+        return out
+
+    async def get_prices(self, addresses: Iterable[str]) -> Dict[str, float]:
+        """Format sama dengan fetch_token_prices: harga > 0, 0.0 = tidak ada pair likuid, tidak ada = gagal."""
+        return {t: (q.price_usd if q else 0.0) for t, q in (await self.quotes(addresses)).items()}
+
+    async def quote(self, token: str) -> Optional[PairQuote]:
+        return (await self.quotes([token])).get(token.lower())
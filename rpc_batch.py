@@ -0,0 +1,134 @@
+# rpc_batch.py
+
+import json
+import time
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from rpc_pool import RpcPool, HEDGEABLE_METHODS
+
+# --- KONFIGURASI BATCH ---
+MAX_BATCH_SIZE = 50          # Banyak RPC publik menolak batch JSON-RPC yang terlalu besar
+BLOCK_NUMBER_TTL = 3.0       # Block time PulseChain ~10s, jadi cukup refresh beberapa detik sekali
+BLOCK_HASH_HISTORY = 64      # Hash block terakhir yang diingat untuk membedakan node tertinggal (hash sama) dari reorg (hash beda)
+
+
+class RpcBatchError(Exception):
+    """Error JSON-RPC untuk satu item di dalam batch (item lain tetap valid)."""
+
+    def __init__(self, method: str, error: Any):
+        super().__init__(f"{method}: {error}")
+        self.method = method
+        self.error = error
+
+
+async def batch_request(pool: RpcPool, calls: Sequence[Tuple[str, List[Any]]]) -> List[Any]:
+    """
+    Kirim beberapa call JSON-RPC dalam SATU HTTP POST (array request).
+    Return list sejajar dengan `calls`: nilai "result" mentah, atau RpcBatchError per item.
+    """
+    if not calls: return []
+    payload = [{"jsonrpc": "2.0", "id": i, "method": m, "params": list(p or [])} for i, (m, p) in enumerate(calls)]
+    hedge = all(m in HEDGEABLE_METHODS for m, _ in calls)
+    raw = await pool.send_async(json.dumps(payload).encode(), hedge=hedge)
+    responses = json.loads(raw)
+    if isinstance(responses, dict):
+        # Node yang tidak support batch biasanya balas satu objek error
+        return [RpcBatchError(m, responses.get("error") or responses) for m, _ in calls]
+    by_id: Dict[int, Dict[str, Any]] = {r.get("id"): r for r in responses if isinstance(r, dict)}
+    out: List[Any] = []
+    for i, (method, _) in enumerate(calls):
+        r = by_id.get(i)
+        if r is None: out.append(RpcBatchError(method, "missing response"))
+        elif "error" in r: out.append(RpcBatchError(method, r["error"]))
+        else: out.append(r.get("result"))
+    return out
+
+
+class RpcAutoBatcher:
+    """
+    Menggabungkan call JSON-RPC yang dipanggil di tick event loop yang sama (dari handler mana pun)
+    menjadi satu batch POST. Pemakaian: `await RPC_BATCHER.call("eth_getCode", [addr, "latest"])`.
+    """
+
+    def __init__(self, pool: RpcPool, max_batch_size: int = MAX_BATCH_SIZE):
+        self.pool = pool
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[str, List[Any], asyncio.Future]] = []
+        self._flush_scheduled = False
+        self.batches_sent = 0
+        self.calls_sent = 0
+
+    async def call(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._pending.append((method, list(params or []), fut))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return await fut
+
+    def _flush(self):
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        for i in range(0, len(pending), self.max_batch_size):
+            asyncio.ensure_future(self._send(pending[i:i + self.max_batch_size]))
+
+    async def _send(self, items: List[Tuple[str, List[Any], asyncio.Future]]):
+        self.batches_sent += 1
+        self.calls_sent += len(items)
+        try:
+            results = await batch_request(self.pool, [(m, p) for m, p, _ in items])
+        except Exception as e:
+            logging.warning(f"RPC batch of {len(items)} failed: {type(e).__name__}: {e}")
+            results = [e] * len(items)
+        for (_, _, fut), res in zip(items, results):
+            if fut.done(): continue
+            if isinstance(res, BaseException): fut.set_exception(res)
+            else: fut.set_result(res)
+
+
+class BlockNumberTracker:
+    """
+    Header block terbaru (eth_getBlockByNumber("latest") lewat auto-batcher), di-memo beberapa detik untuk cache key.
+    Hash `history` block terakhir (plus parentHash tiap header) disimpan, jadi:
+    - header dengan hash yang sama dengan yang diingat = node pool yang tertinggal, block tertinggi tetap dipakai;
+    - hash berbeda di tinggi yang sama, atau parentHash tidak cocok = reorg: `reorgs` naik (CallCache flush)
+      dan head ikut pindah ke fork baru, walaupun tingginya sama atau lebih rendah.
+    Header lebih rendah yang hash-nya tidak dikenal (lebih tua dari history) dianggap lag.
+    """
+
+    def __init__(self, batcher: RpcAutoBatcher, ttl: float = BLOCK_NUMBER_TTL, history: int = BLOCK_HASH_HISTORY):
+        self.batcher = batcher
+        self.ttl = ttl
+        self.history = max(2, history)
+        self.number: Optional[int] = None
+        self.hashes: Dict[int, str] = {}
+        self.reorgs = 0
+        self.updated_at = 0.0
+
+    def note(self, header: Any):
+        try:
+            n = int(header["number"], 16) if isinstance(header["number"], str) else int(header["number"])
+            block_hash, parent = str(header["hash"]).lower(), str(header["parentHash"]).lower()
+        except (KeyError, TypeError, ValueError): return
+        known, known_parent = self.hashes.get(n), self.hashes.get(n - 1)
+        if (known is not None and known != block_hash) or (known_parent is not None and known_parent != parent):
+            self.reorgs += 1
+            fork = n if known_parent is None or known_parent == parent else n - 1
+            for k in [k for k in self.hashes if k >= fork]: del self.hashes[k]
+            logging.info(f"Reorg detected at block {fork} (head {self.number} -> {n})")
+            self.number = n
+        elif self.number is None or n > self.number:
+            self.number = n
+        self.hashes[n - 1] = parent
+        self.hashes[n] = block_hash
+        while len(self.hashes) > self.history: del self.hashes[min(self.hashes)]
+        self.updated_at = time.monotonic()
+
+    async def get(self) -> Optional[int]:
+        if self.number is not None and time.monotonic() - self.updated_at < self.ttl: return self.number
+        try: self.note(await self.batcher.call("eth_getBlockByNumber", ["latest", False]))
+        except Exception as e: logging.debug(f"eth_getBlockByNumber failed: {e}")
+        return self.number
@@ -0,0 +1,324 @@
+# rpc_pool.py
+
+import time
+import json
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+import httpx
+from web3.exceptions import ProviderConnectionError
+from web3.providers.base import JSONBaseProvider
+from web3.providers.async_base import AsyncJSONBaseProvider
+from http_clients import build_async_client
+
+# --- KONFIGURASI POOL ---
+RPC_TIMEOUT = 10
+DEFAULT_LATENCY = 1.0        # Asumsi latency (detik) untuk node yang belum pernah dipakai
+EWMA_ALPHA = 0.3             # Bobot sample terbaru untuk latency & error rate
+ERROR_PENALTY = 4.0          # score = latency * (1 + ERROR_PENALTY * error_rate)
+COOLDOWN_AFTER_FAILURES = 3  # Gagal berturut-turut sebelum node "diistirahatkan"
+COOLDOWN_BASE = 5.0
+COOLDOWN_MAX = 120.0
+HEDGE_MIN_DELAY = 0.25
+HEDGE_MAX_DELAY = 2.0
+HEALTH_CHECK_INTERVAL = 30
+WARMUP_RETRY_MAX = 30        # Backoff maksimum (detik) saat semua node gagal waktu startup
+
+# Method read-only yang aman di-hedge (dikirim ulang ke node kedua)
+HEDGEABLE_METHODS = {
+    "eth_call", "eth_getBalance", "eth_getCode", "eth_blockNumber", "eth_chainId", "eth_getLogs",
+    "eth_getStorageAt", "eth_getBlockByNumber", "eth_getTransactionCount", "net_version", "web3_clientVersion",
+}
+
+
+class RpcEndpoint:
+    """Statistik kesehatan satu node RPC (diupdate setiap request)."""
+
+    def __init__(self, url: str, priority: int):
+        self.url = url
+        self.priority = priority
+        self.ewma_latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.latencies = deque(maxlen=100)
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self.last_error: Optional[str] = None
+        self.last_block: Optional[int] = None
+
+    def p95(self) -> Optional[float]:
+        if len(self.latencies) < 5: return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def in_cooldown(self, now: float) -> bool:
+        return now < self.cooldown_until
+
+    def score(self) -> float:
+        latency = self.ewma_latency if self.ewma_latency is not None else DEFAULT_LATENCY
+        return latency * (1 + ERROR_PENALTY * self.error_rate)
+
+    def record_success(self, latency: float):
+        self.requests += 1
+        self.latencies.append(latency)
+        self.ewma_latency = latency if self.ewma_latency is None else (EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * self.ewma_latency)
+        self.error_rate = (1 - EWMA_ALPHA) * self.error_rate
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+
+    def record_failure(self, error: BaseException):
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.error_rate = EWMA_ALPHA + (1 - EWMA_ALPHA) * self.error_rate
+        self.last_error = f"{type(error).__name__}: {error}"[:200]
+        if self.consecutive_failures >= COOLDOWN_AFTER_FAILURES:
+            backoff = COOLDOWN_BASE * (2 ** (self.consecutive_failures - COOLDOWN_AFTER_FAILURES))
+            self.cooldown_until = time.monotonic() + min(COOLDOWN_MAX, backoff)
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        p95 = self.p95()
+        return {
+            "url": self.url,
+            "score": round(self.score(), 4),
+            "latency_ms": round(self.ewma_latency * 1000, 1) if self.ewma_latency is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "requests": self.requests,
+            "failures": self.failures,
+            "cooldown_s": round(max(0.0, self.cooldown_until - now), 1),
+            "last_block": self.last_block,
+            "last_error": self.last_error,
+        }
+
+
+class RpcPool:
+    """
+    Pool RPC dengan health score per node:
+    - Setiap request diarahkan ke node dengan score terbaik (latency EWMA x error rate).
+    - Node yang gagal berturut-turut masuk cooldown, request otomatis failover ke node berikutnya.
+    - Read call (HEDGEABLE_METHODS) bisa di-hedge: kalau node utama lebih lambat dari p95-nya,
+      node kedua ikut dikirimi request yang sama dan hasil tercepat yang dipakai.
+    """
+
+    def __init__(self, urls: List[str], timeout: float = RPC_TIMEOUT, hedge: bool = True):
+        self.endpoints = [RpcEndpoint(url, i) for i, url in enumerate(urls)]
+        self.timeout = timeout
+        self.hedge = hedge
+        self.serving_url: Optional[str] = None
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+        self._sync_client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Siap = minimal satu node pernah menjawab. Dibuat di sini tapi baru terikat ke loop saat dipakai.
+        self.ready = False
+        self._ready_event = asyncio.Event()
+
+    # --- Routing ---
+    def ranked(self) -> List[RpcEndpoint]:
+        now = time.monotonic()
+        with self._lock:
+            healthy = [e for e in self.endpoints if not e.in_cooldown(now)]
+            cooling = [e for e in self.endpoints if e.in_cooldown(now)]
+        healthy.sort(key=lambda e: (e.score(), e.priority))
+        cooling.sort(key=lambda e: e.cooldown_until)
+        # Node yang cooldown tetap dicoba paling akhir (lebih baik lambat daripada mati total)
+        return healthy + cooling
+
+    def _hedge_delay(self, endpoint: RpcEndpoint) -> float:
+        p95 = endpoint.p95()
+        if p95 is None: return HEDGE_MAX_DELAY
+        return min(HEDGE_MAX_DELAY, max(HEDGE_MIN_DELAY, p95))
+
+    def _record(self, endpoint: RpcEndpoint, started: float, error: Optional[BaseException] = None):
+        with self._lock:
+            if error is None:
+                endpoint.record_success(time.monotonic() - started)
+                self.serving_url = endpoint.url
+            else:
+                endpoint.record_failure(error)
+
+    # --- Transport Sync ---
+    def _get_sync_client(self) -> httpx.Client:
+        if self._sync_client is None:
+            self._sync_client = httpx.Client(timeout=self.timeout)
+        return self._sync_client
+
+    def _post_sync(self, endpoint: RpcEndpoint, body: bytes) -> bytes:
+        started = time.monotonic()
+        try:
+            r = self._get_sync_client().post(endpoint.url, content=body, headers={"Content-Type": "application/json"})
+            r.raise_for_status()
+        except Exception as e:
+            self._record(endpoint, started, e)
+            raise
+        self._record(endpoint, started)
+        return r.content
+
+    def send_sync(self, body: bytes) -> bytes:
+        last_exc: Optional[BaseException] = None
+        for endpoint in self.ranked():
+            try: return self._post_sync(endpoint, body)
+            except Exception as e:
+                last_exc = e
+                logging.warning(f"RPC {endpoint.url} failed ({type(e).__name__}), failing over...")
+        raise ProviderConnectionError(f"All RPC endpoints failed: {last_exc}")
+
+    # --- Transport Async ---
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = build_async_client(self.timeout)
+        return self._async_client
+
+    async def aclose(self):
+        client, self._async_client = self._async_client, None
+        if client is not None: await client.aclose()
+        sync_client, self._sync_client = self._sync_client, None
+        if sync_client is not None: sync_client.close()
+
+    async def _post_async(self, endpoint: RpcEndpoint, body: bytes) -> bytes:
+        started = time.monotonic()
+        try:
+            r = await self._get_async_client().post(endpoint.url, content=body, headers={"Content-Type": "application/json"})
+            r.raise_for_status()
+        except asyncio.CancelledError:
+            # Request yang kalah hedge dibatalkan, bukan kegagalan node
+            raise
+        except Exception as e:
+            self._record(endpoint, started, e)
+            raise
+        self._record(endpoint, started)
+        self._mark_ready()
+        return r.content
+
+    async def _send_hedged(self, primary: RpcEndpoint, backup: RpcEndpoint, body: bytes) -> bytes:
+        first = asyncio.ensure_future(self._post_async(primary, body))
+        done, _ = await asyncio.wait({first}, timeout=self._hedge_delay(primary))
+        if done and not first.exception(): return first.result()
+
+        self.hedged_requests += 1
+        second = asyncio.ensure_future(self._post_async(backup, body))
+        pending = {second} if done else {first, second}
+        last_exc: Optional[BaseException] = first.exception() if done else None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second: self.hedge_wins += 1
+                        return task.result()
+                    last_exc = task.exception()
+        finally:
+            for task in pending: task.cancel()
+        raise last_exc or ProviderConnectionError("Hedged RPC request failed")
+
+    async def send_async(self, body: bytes, hedge: bool = False) -> bytes:
+        candidates = self.ranked()
+        last_exc: Optional[BaseException] = None
+        i = 0
+        while i < len(candidates):
+            primary = candidates[i]
+            if hedge and self.hedge and i + 1 < len(candidates):
+                backup = candidates[i + 1]; i += 2
+                try: return await self._send_hedged(primary, backup, body)
+                except Exception as e: last_exc = e
+            else:
+                i += 1
+                try: return await self._post_async(primary, body)
+                except Exception as e: last_exc = e
+            logging.warning(f"RPC {primary.url} failed ({type(last_exc).__name__}), failing over...")
+        raise ProviderConnectionError(f"All RPC endpoints failed: {last_exc}")
+
+    # --- Readiness (startup non-blocking) ---
+    def _mark_ready(self):
+        if not self.ready:
+            self.ready = True
+            self._ready_event.set()
+
+    async def wait_ready(self, timeout: float) -> bool:
+        """Tunggu sampai pool punya minimal satu node sehat (dipanggil handler sebelum akses chain)."""
+        if self.ready: return True
+        try:
+            await asyncio.wait_for(self._ready_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def warmup(self):
+        """Probe semua node secara paralel di background; ulangi dengan backoff sampai ada yang hidup."""
+        delay = 1.0
+        while True:
+            started = time.monotonic()
+            alive = await self.probe_all()
+            if alive:
+                logging.info(f"✅ RPC pool ready: {alive}/{len(self.endpoints)} nodes alive in {time.monotonic() - started:.2f}s, best: {self.ranked()[0].url}")
+                return
+            logging.error(f"❌ All RPC connections failed. Retrying in {delay:.0f}s...")
+            await asyncio.sleep(delay)
+            delay = min(WARMUP_RETRY_MAX, delay * 2)
+
+    # --- Health Check ---
+    @staticmethod
+    def _probe_body() -> bytes:
+        return json.dumps({"jsonrpc": "2.0", "method": "eth_blockNumber", "params": [], "id": 0}).encode()
+
+    def _apply_probe(self, endpoint: RpcEndpoint, raw: bytes):
+        try: endpoint.last_block = int(json.loads(raw)["result"], 16)
+        except Exception: pass
+
+    async def probe_all(self) -> int:
+        async def probe(endpoint):
+            try:
+                self._apply_probe(endpoint, await self._post_async(endpoint, self._probe_body()))
+                return True
+            except Exception:
+                return False
+        results = await asyncio.gather(*(probe(e) for e in self.endpoints))
+        return sum(results)
+
+    async def run_health_checks(self, interval: float = HEALTH_CHECK_INTERVAL):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.probe_all()
+                logging.info(f"RPC pool serving via {self.serving_url}")
+            except Exception as e:
+                logging.warning(f"RPC health check error: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "serving_url": self.serving_url,
+            "hedged_requests": self.hedged_requests,
+            "hedge_wins": self.hedge_wins,
+            "endpoints": [e.snapshot() for e in self.ranked()],
+        }
+
+
+# --- PROVIDER WEB3 DI ATAS POOL ---
+class PooledHTTPProvider(JSONBaseProvider):
+    """Provider sync untuk Web3 yang mengirim setiap request lewat RpcPool."""
+
+    def __init__(self, pool: RpcPool, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.pool = pool
+
+    def make_request(self, method, params):
+        raw = self.pool.send_sync(self.encode_rpc_request(method, params))
+        return self.decode_rpc_response(raw)
+
+
+class PooledAsyncHTTPProvider(AsyncJSONBaseProvider):
+    """Provider AsyncWeb3 di atas RpcPool (dengan hedging untuk read call)."""
+
+    def __init__(self, pool: RpcPool, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.pool = pool
+
+    async def make_request(self, method, params):
+        raw = await self.pool.send_async(self.encode_rpc_request(method, params), hedge=method in HEDGEABLE_METHODS)
+        return self.decode_rpc_response(raw)
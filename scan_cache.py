@@ -0,0 +1,112 @@
+# scan_cache.py
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from sol_index import Token
+
+# --- KONFIGURASI CACHE HASIL SCAN ---
+SCAN_CACHE_MAX_ENTRIES = int(os.getenv("SCAN_CACHE_MAX_ENTRIES", "2000"))   # LRU in-memory
+# File SQLite dipakai bersama semua worker scan_pool + proses utama, dan tetap hangat setelah restart. Kosong = in-memory saja
+SCAN_CACHE_PATH = os.getenv("SCAN_CACHE_PATH", "scan_cache.sqlite3")
+
+
+def abi_signatures(abi: Optional[Iterable[Dict]]) -> List[str]:
+    """Signature function ABI (`name(type,...)`) terurut; hanya bagian ABI yang dibaca scanner."""
+    sigs = set()
+    for f in abi or []:
+        if not isinstance(f, dict) or f.get("type") != "function": continue
+        types = ",".join(str(p.get("type", "")) for p in (f.get("inputs") or []) if isinstance(p, dict))
+        sigs.add(f"{f.get('name', '')}({types})")
+    return sorted(sigs)
+
+
+def scan_cache_key(abi: Optional[Iterable[Dict]], toks: List[Token], salt: str = "") -> str:
+    """
+    Hash source ternormalisasi + signature ABI. Token stream sudah bebas whitespace/komentar;
+    string literal (nama, simbol, pesan revert) diganti placeholder supaya token clone dapat key yang sama.
+    """
+    h = hashlib.sha256(salt.encode())
+    h.update(b"\x00abi\x00")
+    h.update("\n".join(abi_signatures(abi)).encode())
+    h.update(b"\x00src\x00")
+    h.update("\x00".join('""' if t.kind == "str" else t.text for t in toks).encode("utf-8", "surrogatepass"))
+    return h.hexdigest()
+
+
+class ScanResultCache:
+    """
+    Memo hasil scan per key konten. LRU in-memory per proses di depan file SQLite (`SCAN_CACHE_PATH`) yang
+    dipakai bersama semua proses, jadi hasil dari satu worker bisa dipakai worker lain dan setelah restart.
+    Error SQLite (termasuk "database is locked" saat worker menulis bersamaan) diperlakukan sebagai miss.
+    """
+
+    def __init__(self, max_entries: int = SCAN_CACHE_MAX_ENTRIES, path: str = SCAN_CACHE_PATH):
+        self.max_entries = max(1, max_entries)
+        self.path = path
+        self._entries: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if not self.path: return None
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS scan_results (key TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL)")
+            self._conn.commit()
+        return self._conn
+
+    def _remember(self, key: str, result: List[str]):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries: self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[List[str]]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(result)
+            try:
+                conn = self._connect()
+                row = conn.execute("SELECT result FROM scan_results WHERE key = ?", (key,)).fetchone() if conn else None
+            except sqlite3.Error as e:
+                logging.warning(f"Scan cache read failed: {e}")
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            result = json.loads(row[0])
+            self._remember(key, result)
+            self.hits += 1
+            return list(result)
+
+    def put(self, key: str, result: Any):
+        if not isinstance(result, list): return
+        result = list(result)
+        with self._lock:
+            self._remember(key, result)
+            try:
+                conn = self._connect()
+                if conn:
+                    conn.execute("INSERT OR REPLACE INTO scan_results (key, result, created_at) VALUES (?, ?, ?)", (key, json.dumps(result), time.time()))
+                    conn.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logging.warning(f"Scan cache write failed: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
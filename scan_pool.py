@@ -0,0 +1,146 @@
+# scan_pool.py
+
+import os
+import time
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+
+from source_files import project_files, budget_files
+
+# --- KONFIGURASI PROCESS POOL SCANNER ---
+SCAN_POOL_WORKERS = int(os.getenv("SCAN_POOL_WORKERS", str(max(1, min(4, (os.cpu_count() or 2) - 1)))))   # 0 = scan di thread (tanpa pool)
+SCAN_POOL_TIMEOUT = float(os.getenv("SCAN_POOL_TIMEOUT", "20"))            # Detik; lewat dari ini hasil ditandai partial
+SCAN_POOL_MAX_PENDING = int(os.getenv("SCAN_POOL_MAX_PENDING", "0")) or SCAN_POOL_WORKERS * 4   # Antrian maksimum sebelum request menunggu slot
+SCAN_POOL_START_METHOD = os.getenv("SCAN_POOL_START_METHOD", "spawn")      # spawn: aman walau proses utama punya thread + event loop
+
+PARTIAL_MARKER = "⚠️ Partial analysis: source scan timed out, some files were not scanned"
+
+
+# --- FUNGSI WORKER (top-level supaya bisa di-pickle) ---
+def _warm_worker() -> int:
+    # Import modul scanner (regex di-compile saat import) sekali di tiap worker
+    import sus_scanner  # noqa: F401
+    time.sleep(0.2)   # Tahan sebentar supaya warmup lain jatuh ke worker berbeda
+    return os.getpid()
+
+
+def _scan_file_job(source_code: str):
+    from sus_scanner import scan_file_cached
+    return scan_file_cached(source_code)
+
+
+def _combine(abi: Optional[List[Dict]], findings: list, partial: bool = False, notes: Optional[List[str]] = None) -> List[str]:
+    from sus_scanner import combine_findings
+    out = combine_findings(abi, findings, notes)
+    if partial:
+        out = [m for m in out if not m.startswith("🟢 No suspicious")]
+        out.append(PARTIAL_MARKER)
+    return out
+
+
+class ScanProcessPool:
+    """
+    Process pool khusus untuk sus scan (CPU-bound, regex/lexer) supaya tidak berebut GIL dengan event loop.
+    Source dipecah per file (library dikenal dilewati) dan tiap file jadi satu job, jadi satu kontrak multi-file
+    ikut terbagi ke beberapa core. Cache hasil (SCAN_CACHE) = LRU di tiap worker di depan file SQLite
+    SCAN_CACHE_PATH yang dipakai bersama semua worker (dan proses utama saat fallback ke thread).
+    """
+
+    def __init__(self, workers: int = SCAN_POOL_WORKERS, timeout: float = SCAN_POOL_TIMEOUT,
+                 max_pending: int = SCAN_POOL_MAX_PENDING, start_method: str = SCAN_POOL_START_METHOD):
+        self.workers = max(0, workers)
+        self.timeout = timeout
+        self.max_pending = max(1, max_pending)
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.completed = 0
+        self.timeouts = 0
+        self.restarts = 0
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(self.start_method))
+        return self._executor
+
+    def _reset_executor(self):
+        executor, self._executor = self._executor, None
+        if executor is not None: executor.shutdown(wait=False, cancel_futures=True)
+        self.restarts += 1
+
+    async def start(self):
+        """Spawn + import scanner di semua worker saat startup, bukan pada scan pertama."""
+        if not self.workers: return
+        loop = asyncio.get_running_loop()
+        executor = self._ensure_executor()
+        try:
+            pids = await asyncio.gather(*(loop.run_in_executor(executor, _warm_worker) for _ in range(self.workers)))
+            logging.info(f"Scan pool ready: {len(set(pids))} worker(s)")
+        except Exception as e:
+            logging.warning(f"Scan pool warmup failed: {e}")
+
+    async def _scan_in_threads(self, abi: Optional[List[Dict]], files: list, notes: Optional[List[str]] = None) -> List[str]:
+        # Thread tidak bisa dihentikan; scan_file berhenti sendiri lewat SCAN_BUDGET_SECONDS, timeout ini hanya jaring pengaman
+        tasks = [asyncio.ensure_future(asyncio.to_thread(_scan_file_job, f.content)) for f in files]
+        return await self._gather_findings(abi, tasks, notes)
+
+    async def scan(self, abi: Optional[List[Dict]], source_code: Any) -> List[str]:
+        files, skipped = project_files(source_code)
+        if skipped: logging.info(f"Sus scan: {len(files)} project file(s), {len(skipped)} known library file(s) skipped")
+        files, notes = budget_files(files)
+        if not self.workers: return await self._scan_in_threads(abi, files, notes)
+        if self._slots is None: self._slots = asyncio.Semaphore(self.max_pending)
+        loop = asyncio.get_running_loop()
+        executor = self._ensure_executor()
+
+        async def run(content: str):
+            await self._slots.acquire()
+            try:
+                job = executor.submit(_scan_file_job, content)
+            except BaseException:
+                self._slots.release()
+                raise
+            # Slot baru dilepas saat job di worker benar-benar selesai (bukan saat request timeout), jadi job
+            # yang masih jalan di background tetap dihitung dan request baru tidak menumpuk di belakangnya
+            job.add_done_callback(lambda _: loop.is_closed() or loop.call_soon_threadsafe(self._slots.release))
+            return await asyncio.wrap_future(job)
+
+        # Timeout mencakup waktu antri slot; job yang sudah jalan di worker tetap selesai di background
+        tasks = [asyncio.ensure_future(run(f.content)) for f in files]
+        return await self._gather_findings(abi, tasks, notes, files)
+
+    async def _gather_findings(self, abi: Optional[List[Dict]], tasks: list, notes: Optional[List[str]], pool_files: Optional[list] = None) -> List[str]:
+        """Tunggu job sampai self.timeout; yang belum selesai/gagal membuat hasil ditandai partial. `pool_files` = job jalan di pool."""
+        done, pending = await asyncio.wait(tasks, timeout=self.timeout) if tasks else (set(), set())
+        for t in pending: t.cancel()
+        if pool_files is not None and any(isinstance(t.exception(), BrokenProcessPool) for t in done):
+            # Worker mati (OOM/segfault): pool dibuat ulang untuk request berikutnya, request ini dijalankan di thread
+            logging.error("Scan pool broken, restarting")
+            self._reset_executor()
+            return await self._scan_in_threads(abi, pool_files, notes)
+        findings = []; failed = 0
+        for t in tasks:
+            if t not in done: continue
+            if t.exception() is not None:
+                failed += 1
+                logging.warning(f"Source scan job failed: {type(t.exception()).__name__}: {t.exception()}")
+                continue
+            findings.append(t.result())
+        if pending:
+            self.timeouts += 1
+            logging.warning(f"Source scan exceeded {self.timeout:.0f}s ({len(pending)}/{len(tasks)} file(s) unfinished), returning partial analysis")
+        else:
+            self.completed += 1
+        return _combine(abi, findings, partial=bool(pending) or failed > 0, notes=notes)
+
+    def snapshot(self) -> Dict[str, int]:
+        return {"workers": self.workers, "completed": self.completed, "timeouts": self.timeouts, "restarts": self.restarts}
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,17 @@
+# scanner_config.py
+
+# Konfigurasi + singleton sus scanner. Sengaja tanpa import web3/telegram/httpx: modul ini di-import
+# oleh worker scan_pool dan bench_scanner, yang tidak boleh ikut membangun RpcPool, HTTP client, dsb.
+from scan_cache import ScanResultCache
+from detector_registry import DetectorRegistry
+
+# --- KONFIGURASI SCANNER ---
+SCAN_MODE = "balanced"
+STANDARD_ERC20_FUNCTIONS = {
+    'totalSupply', 'balanceOf', 'transfer', 'transferFrom', 'approve', 'allowance', 'name', 'symbol', 'decimals', 'owner', 'increaseAllowance', 'decreaseAllowance', 'getTokenHolders', 'burn', 'burnFrom' 
+}
+IGNORED_ADMIN_VARS = {"owner", "_owner", "spender", "msgSender", "burnAddress", "recipient", "to", "from", "getFees"}
+SAFE_SETTER_EXCLUDES = {"transferownership", "_transferownership"}
+
+SCAN_CACHE = ScanResultCache()   # Memo hasil sus scan per konten source (token clone)
+DETECTORS = DetectorRegistry()    # Heuristik sus scanner (didaftarkan di sus_scanner.py) + counter waktu/hit
@@ -0,0 +1,108 @@
+# selector_db.py
+
+import os
+import sys
+import mmap
+import struct
+import logging
+from typing import Dict, Iterable, List, Optional
+
+# --- KONFIGURASI DATABASE 4-BYTE ---
+# signatures.txt = daftar signature (sumber, bisa diedit); signatures.bin = hasil build (di-mmap saat runtime).
+# Build ulang setelah mengedit: python selector_db.py signatures.txt signatures.bin
+SELECTOR_DB_PATH = os.getenv("SELECTOR_DB_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "signatures.bin"))
+
+_MAGIC = b"SELDB1\x00\x00"
+_HEADER = struct.Struct("<8sI")    # magic, jumlah record
+_RECORD = struct.Struct("<4sI")    # selector, offset signature (dari awal blob)
+
+
+class SelectorDB:
+    """
+    Lookup selector -> signature dari file biner yang di-mmap (tidak di-load ke memory Python).
+    Layout: header | record (selector, offset) terurut per selector | blob signature (1 byte panjang + utf-8).
+    Lookup = binary search atas record; satu selector bisa punya beberapa signature (collision).
+    """
+
+    def __init__(self, path: str = SELECTOR_DB_PATH):
+        self.path = path
+        self._mm: Optional[mmap.mmap] = None
+        self.count = 0
+        self._blob_start = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Selector database not loaded ({self.path}): {e}")
+            return
+        magic, count = _HEADER.unpack_from(mm, 0) if len(mm) >= _HEADER.size else (None, 0)
+        if magic != _MAGIC:
+            logging.warning(f"Selector database {self.path} has an unknown format")
+            mm.close()
+            return
+        self._mm, self.count = mm, count
+        self._blob_start = _HEADER.size + count * _RECORD.size
+
+    def _selector_at(self, i: int) -> bytes:
+        pos = _HEADER.size + i * _RECORD.size
+        return self._mm[pos:pos + 4]
+
+    def _signature_at(self, i: int) -> str:
+        _, offset = _RECORD.unpack_from(self._mm, _HEADER.size + i * _RECORD.size)
+        pos = self._blob_start + offset
+        length = self._mm[pos]
+        return self._mm[pos + 1:pos + 1 + length].decode("utf-8")
+
+    def lookup(self, selector: bytes) -> List[str]:
+        if self._mm is None or len(selector) != 4: return []
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._selector_at(mid) < selector: lo = mid + 1
+            else: hi = mid
+        out = []
+        while lo < self.count and self._selector_at(lo) == selector:
+            out.append(self._signature_at(lo)); lo += 1
+        return out
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+
+# --- BUILD (tidak dipakai saat runtime) ---
+def function_selector(signature: str) -> bytes:
+    # eth_utils selalu ada (dependency wajib web3); import di sini supaya lookup runtime tidak ikut memuatnya
+    from eth_utils import keccak
+    return keccak(text=signature)[:4]
+
+
+def build_database(signatures: Iterable[str], path: str) -> int:
+    entries: Dict[bytes, List[str]] = {}
+    for sig in signatures:
+        sig = sig.strip()
+        if not sig or sig.startswith("#"): continue
+        bucket = entries.setdefault(function_selector(sig), [])
+        if sig not in bucket: bucket.append(sig)
+    records = []; blob = bytearray()
+    for selector in sorted(entries):
+        for sig in entries[selector]:
+            raw = sig.encode()[:255]
+            records.append(_RECORD.pack(selector, len(blob)))
+            blob += bytes([len(raw)]) + raw
+    with open(path, "wb") as fh:
+        fh.write(_HEADER.pack(_MAGIC, len(records)))
+        fh.write(b"".join(records))
+        fh.write(blob)
+    return len(records)
+
+
+if __name__ == "__main__":
+    src, dst = (sys.argv[1:3] + [None, None])[:2]
+    with open(src or "signatures.txt", encoding="utf-8") as fh:
+        n = build_database(fh, dst or SELECTOR_DB_PATH)
+    print(f"{n} signature(s) written")
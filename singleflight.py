@@ -0,0 +1,57 @@
+# singleflight.py
+
+import copy
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+# --- KONFIGURASI SINGLE-FLIGHT ---
+DEFAULT_RETENTION = 15.0   # Detik hasil selesai masih dibagikan ke request berikutnya untuk key yang sama
+
+
+class SingleFlight:
+    """
+    Coalescing request async per key: panggilan bersamaan untuk key yang sama menunggu SATU komputasi
+    yang sedang jalan, lalu hasilnya disimpan `retention` detik untuk request susulan.
+    Tiap pemanggil dapat deep copy hasilnya (handler boleh pop/ubah dict tanpa mengganggu yang lain).
+    Exception tidak di-retain: semua yang sedang menunggu ikut menerima error, request berikutnya mulai ulang.
+    """
+
+    def __init__(self, name: str, retention: float = DEFAULT_RETENTION):
+        self.name = name
+        self.retention = retention
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._recent: Dict[Hashable, Tuple[float, Any]] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self.retained_hits = 0
+
+    def _prune(self, now: float):
+        for key in [k for k, (ts, _) in self._recent.items() if now - ts >= self.retention]: del self._recent[key]
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task: del self._inflight[key]
+        if not task.cancelled() and task.exception() is None and self.retention > 0:
+            self._recent[key] = (time.monotonic(), task.result())
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        now = time.monotonic()
+        self._prune(now)
+        recent = self._recent.get(key)
+        if recent is not None:
+            self.retained_hits += 1
+            return copy.deepcopy(recent[1])
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+        else:
+            self.coalesced += 1
+            logging.info(f"[{self.name}] joining in-flight request for {key}")
+        # shield: kalau satu handler dibatalkan, komputasi bersama tetap jalan untuk waiter lain
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result)
@@ -0,0 +1,232 @@
+# sol_index.py
+
+import re
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# --- LEXER ---
+# Satu regex master, di-compile sekali saat import. Komentar & whitespace dibuang, string literal jadi satu token,
+# jadi detector tidak salah tangkap kata di dalam komentar dan tidak perlu scan ulang full text.
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<str>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<id>[A-Za-z_$][A-Za-z0-9_$]*)
+  | (?P<num>0[xX][0-9a-fA-F_]+|[0-9][0-9_]*(?:\.[0-9_]+)?(?:[eE][0-9]+)?)
+  | (?P<op><<=|>>=|\+\+|--|\+=|-=|\*=|/=|%=|\^=|&=|\|=|==|!=|<=|>=|=>|&&|\|\||<<|>>|\*\*|.)
+""", re.X | re.S)
+
+
+class Token(NamedTuple):
+    kind: str    # "id" | "num" | "str" | "op"
+    text: str
+    start: int
+
+
+DEADLINE_CHECK_EVERY = 4096   # Jumlah token/match antar cek deadline (time.perf_counter tidak gratis)
+
+
+class ScanDeadlineExceeded(Exception):
+    """Budget waktu scan habis di tengah lex / pengumpulan fakta."""
+
+
+def tokenize(source: str, deadline: Optional[float] = None) -> List[Token]:
+    if deadline is None:
+        return [Token(m.lastgroup, m.group(), m.start()) for m in _TOKEN_RE.finditer(source) if m.lastgroup not in ("ws", "comment")]
+    out = []
+    for k, m in enumerate(_TOKEN_RE.finditer(source)):
+        if k % DEADLINE_CHECK_EVERY == 0 and time.perf_counter() > deadline: raise ScanDeadlineExceeded("tokenize")
+        if m.lastgroup not in ("ws", "comment"): out.append(Token(m.lastgroup, m.group(), m.start()))
+    return out
+
+
+# --- HELPER TOKEN ---
+def _is(toks: List[Token], i: int, *texts: str) -> bool:
+    if i < 0 or i + len(texts) > len(toks): return False
+    return all(toks[i + k].text == t for k, t in enumerate(texts))
+
+
+def _skip_group(toks: List[Token], i: int, open_: str, close: str) -> int:
+    """i menunjuk `open_`; return index setelah pasangan `close`-nya (atau len(toks))."""
+    depth = 0
+    for j in range(i, len(toks)):
+        if toks[j].text == open_: depth += 1
+        elif toks[j].text == close:
+            depth -= 1
+            if depth == 0: return j + 1
+    return len(toks)
+
+
+# --- INDEX ---
+CONTRACT_KINDS = {"contract", "interface", "library"}
+CALLABLE_KINDS = {"function", "modifier", "constructor", "fallback", "receive"}
+SKIPPED_MEMBERS = {"event", "error", "using", "pragma", "import"}
+TYPE_DEF_MEMBERS = {"struct", "enum"}
+FUNCTION_KEYWORDS = {
+    "public", "private", "internal", "external", "view", "pure", "payable", "nonpayable",
+    "virtual", "override", "returns",
+}
+VAR_QUALIFIERS = {"public", "private", "internal", "external", "constant", "immutable", "override", "transient"}
+
+
+class ContractInfo(NamedTuple):
+    name: str
+    kind: str                   # contract | interface | library
+    bases: Tuple[str, ...]
+    body: Tuple[int, int]       # range token di dalam { } (eksklusif)
+
+
+class FunctionInfo(NamedTuple):
+    name: str
+    kind: str                   # function | modifier | constructor | fallback | receive
+    contract: Optional[str]
+    modifiers: Tuple[str, ...]  # modifier custom (onlyOwner, lockTheSwap, ...), tanpa keyword visibility/mutability
+    visibility: Optional[str]
+    body: Optional[Tuple[int, int]]   # range token body PERSIS (brace-balanced), None kalau tanpa body
+    start: int                  # offset karakter deklarasi
+
+
+class StateVar(NamedTuple):
+    name: str
+    type: str                   # teks tipe, mis. "address", "mapping(address=>bool)", "uint256[]"
+    contract: Optional[str]
+    visibility: Optional[str]
+    constant: bool              # constant / immutable
+    key_type: Optional[str]     # hanya untuk mapping
+    value_type: Optional[str]
+
+
+class SolidityIndex:
+    """
+    Index ringan hasil satu kali lex: contract, function (modifier + body persis), state variable, mapping.
+    Bukan parser lengkap; cukup untuk heuristik scanner dan toleran terhadap source yang tidak valid.
+    """
+
+    def __init__(self, source: str, toks: Optional[List[Token]] = None):
+        self.source = source
+        self.tokens = tokenize(source) if toks is None else toks
+        self.contracts: List[ContractInfo] = []
+        self.functions: List[FunctionInfo] = []
+        self.state_vars: Dict[str, StateVar] = {}
+        self._build()
+
+    # --- Akses ---
+    def body_tokens(self, fn: FunctionInfo) -> List[Token]:
+        return self.tokens[fn.body[0]:fn.body[1]] if fn.body else []
+
+    def body_text(self, fn: FunctionInfo) -> str:
+        if not fn.body or fn.body[0] >= fn.body[1]: return ""
+        lo, hi = fn.body
+        return self.source[self.tokens[lo].start:self.tokens[hi].start if hi < len(self.tokens) else len(self.source)]
+
+    def mappings(self, key_type: Optional[str] = None, value_type: Optional[str] = None) -> List[StateVar]:
+        return [v for v in self.state_vars.values() if v.key_type is not None
+                and (key_type is None or v.key_type == key_type) and (value_type is None or v.value_type == value_type)]
+
+    # --- Build ---
+    def _build(self):
+        toks = self.tokens
+        i, n = 0, len(toks)
+        while i < n:
+            t = toks[i]
+            if t.text in CONTRACT_KINDS and i + 1 < n and toks[i + 1].kind == "id":
+                i = self._parse_contract(i)
+            elif t.text == "function":
+                i = self._parse_callable(i, None)
+            else:
+                i += 1
+
+    def _parse_contract(self, i: int) -> int:
+        toks = self.tokens
+        kind, name = toks[i].text, toks[i + 1].text
+        j = i + 2
+        bases: List[str] = []
+        while j < len(toks) and toks[j].text not in ("{", ";"):
+            if toks[j].kind == "id" and toks[j].text != "is" and (toks[j - 1].text in ("is", ",")): bases.append(toks[j].text)
+            if toks[j].text == "(": j = _skip_group(toks, j, "(", ")"); continue
+            j += 1
+        if j >= len(toks) or toks[j].text == ";": return j + 1
+        end = _skip_group(toks, j, "{", "}")
+        body = (j + 1, end - 1)
+        self.contracts.append(ContractInfo(name, kind, tuple(bases), body))
+        self._parse_members(name, *body)
+        return end
+
+    def _parse_members(self, contract: str, lo: int, hi: int):
+        toks = self.tokens
+        i = lo
+        while i < hi:
+            text = toks[i].text
+            if text in CALLABLE_KINDS:
+                i = self._parse_callable(i, contract, hi)
+            elif text in TYPE_DEF_MEMBERS:
+                j = i
+                while j < hi and toks[j].text != "{": j += 1
+                i = _skip_group(toks, j, "{", "}") if j < hi else hi
+            elif text in SKIPPED_MEMBERS or text in (";", "}"):
+                while i < hi and toks[i].text != ";": i += 1
+                i += 1
+            else:
+                i = self._parse_state_var(i, contract, hi)
+
+    def _parse_callable(self, i: int, contract: Optional[str], hi: Optional[int] = None) -> int:
+        toks = self.tokens
+        hi = len(toks) if hi is None else hi
+        kind = toks[i].text
+        j = i + 1
+        name = kind
+        if kind in ("function", "modifier") and j < hi and toks[j].kind == "id":
+            name = toks[j].text; j += 1
+        if j < hi and toks[j].text == "(": j = _skip_group(toks, j, "(", ")")
+        modifiers: List[str] = []; visibility = None
+        while j < hi and toks[j].text not in ("{", ";"):
+            tk = toks[j]
+            if tk.text == "returns":
+                j = _skip_group(toks, j + 1, "(", ")") if _is(toks, j + 1, "(") else j + 1
+                continue
+            if tk.text in ("public", "private", "internal", "external"): visibility = tk.text
+            elif tk.kind == "id" and tk.text not in FUNCTION_KEYWORDS: modifiers.append(tk.text)
+            if tk.text == "(": j = _skip_group(toks, j, "(", ")"); continue
+            j += 1
+        body = None; end = j + 1
+        if j < hi and toks[j].text == "{":
+            end = _skip_group(toks, j, "{", "}")
+            body = (j + 1, end - 1)
+        self.functions.append(FunctionInfo(name, kind, contract, tuple(modifiers), visibility, body, toks[i].start))
+        return end
+
+    def _parse_state_var(self, i: int, contract: str, hi: int) -> int:
+        toks = self.tokens
+        j = i
+        key_type = value_type = None
+        if toks[j].text == "mapping" and _is(toks, j + 1, "("):
+            end = _skip_group(toks, j + 1, "(", ")")
+            inner = [t.text for t in toks[j + 2:end - 1]]
+            if "=>" in inner:
+                k = inner.index("=>")
+                key_type = inner[0] if k else None
+                value_type = "".join(inner[k + 1:])
+            type_text = "mapping(" + "".join(inner) + ")"
+            j = end
+        else:
+            start = j
+            while j < hi and (toks[j].kind == "id" or toks[j].text in (".", "[", "]")) and toks[j].text not in VAR_QUALIFIERS:
+                if j > start and toks[j].kind == "id" and toks[j - 1].kind == "id" and not (toks[j].text == "payable" and toks[j - 1].text == "address"): break
+                j += 1
+            type_text = "".join((" " if k > start and toks[k - 1].kind == "id" and toks[k].kind == "id" else "") + toks[k].text for k in range(start, j))
+        visibility = None; constant = False
+        while j < hi and toks[j].text in VAR_QUALIFIERS:
+            if toks[j].text in ("constant", "immutable"): constant = True
+            elif toks[j].text in ("public", "private", "internal", "external"): visibility = toks[j].text
+            if _is(toks, j + 1, "("): j = _skip_group(toks, j + 1, "(", ")")
+            else: j += 1
+        name = toks[j].text if j < hi and toks[j].kind == "id" else None
+        # Lompat ke akhir statement (initializer bisa berisi kurung/brace)
+        k = j
+        while k < hi and toks[k].text != ";":
+            if toks[k].text in ("(", "[", "{"):
+                k = _skip_group(toks, k, toks[k].text, {"(": ")", "[": "]", "{": "}"}[toks[k].text]); continue
+            k += 1
+        if name and type_text and k > j and j + 1 < len(toks) and toks[j + 1].text in ("=", ";"):
+            self.state_vars[name] = StateVar(name, type_text, contract, visibility, constant, key_type, value_type)
+        return max(k + 1, i + 1)
@@ -0,0 +1,145 @@
+# source_files.py
+
+import os
+import sys
+import json
+import hashlib
+import logging
+from typing import Any, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+# --- KONFIGURASI LIBRARY DIKENAL ---
+# File berisi sha256 file library (OpenZeppelin, Uniswap, ...) yang tidak dimodifikasi, satu per baris: "<sha256>  <path>".
+# Generate dari checkout library resmi: python source_files.py node_modules/@openzeppelin/contracts >> known_libraries.txt
+KNOWN_LIBRARIES_PATH = os.getenv("KNOWN_LIBRARIES_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "known_libraries.txt"))
+FLATTENED_PATH = "<flattened>"
+
+# --- BATAS UKURAN SCAN ---
+SCAN_MAX_FILE_CHARS = int(os.getenv("SCAN_MAX_FILE_CHARS", "262144"))     # File lebih besar dipotong di akhir contract terakhir yang muat
+SCAN_MAX_TOTAL_CHARS = int(os.getenv("SCAN_MAX_TOTAL_CHARS", "1048576"))  # Total per scan; file sesudahnya tidak di-scan
+LIBRARY_PATH_PREFIXES = ("@", "lib/", "node_modules/")
+
+
+class SourceFile(NamedTuple):
+    path: str
+    content: str
+
+
+def content_fingerprint(content: str) -> str:
+    """sha256 isi file; line ending & whitespace tepi dinormalisasi (explorer kadang menyimpan CRLF)."""
+    return hashlib.sha256(content.replace("\r\n", "\n").strip().encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def load_known_libraries(path: str = KNOWN_LIBRARIES_PATH) -> FrozenSet[str]:
+    hashes = set()
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line or line.startswith("#"): continue
+                hashes.add(line.split()[0].lower())
+    except OSError as e:
+        logging.warning(f"Known library list not loaded ({path}): {e}")
+    return frozenset(hashes)
+
+
+KNOWN_LIBRARY_HASHES = load_known_libraries()
+
+
+# --- SPLIT SOURCE ---
+def _parse_standard_json(text: str) -> Optional[Any]:
+    # PulseScan/Etherscan membungkus standard-JSON input dengan kurung kurawal ganda: "{{ ... }}"
+    if text.startswith("{{") and text.endswith("}}"): text = text[1:-1]
+    if not text.startswith("{"): return None
+    try: return json.loads(text)
+    except ValueError: return None
+
+
+def _file_content(value: Any) -> Optional[str]:
+    if isinstance(value, str): return value
+    if isinstance(value, dict) and isinstance(value.get("content"), str): return value["content"]
+    return None
+
+
+def split_source_files(source: Any) -> List[SourceFile]:
+    """
+    Pecah source hasil PulseScan/Sourcify jadi daftar file:
+    - string biasa (flattened) -> satu file
+    - standard-JSON (string "{{...}}"/"{...}" atau dict dengan key "sources") -> per entry sources
+    - dict path -> content / {"content": ...} (Sourcify `sources`) dan list {"name"/"path", "content"} (Sourcify `files`)
+    Entry tanpa isi (mis. metadata Sourcify yang hanya memuat keccak256/urls) dilewati.
+    """
+    if isinstance(source, str):
+        text = source.strip()
+        if not text: return []
+        parsed = _parse_standard_json(text)
+        if parsed is None: return [SourceFile(FLATTENED_PATH, source)]
+        source = parsed
+    if isinstance(source, dict):
+        if isinstance(source.get("sources"), dict): source = source["sources"]
+        files = []
+        for path, value in source.items():
+            content = _file_content(value)
+            if content: files.append(SourceFile(str(path), content))
+        return files
+    if isinstance(source, list):
+        files = []
+        for item in source:
+            if not isinstance(item, dict): continue
+            content = _file_content(item)
+            if content: files.append(SourceFile(str(item.get("path") or item.get("name") or f"file{len(files)}"), content))
+        return files
+    return []
+
+
+def project_files(source: Any, known: Optional[FrozenSet[str]] = None) -> Tuple[List[SourceFile], List[SourceFile]]:
+    """Return (file yang perlu di-scan, file library dikenal yang dilewati)."""
+    known = KNOWN_LIBRARY_HASHES if known is None else known
+    scan, skipped = [], []
+    for f in split_source_files(source):
+        (skipped if f.path != FLATTENED_PATH and content_fingerprint(f.content) in known else scan).append(f)
+    return scan, skipped
+
+
+def truncate_source(content: str, limit: int = SCAN_MAX_FILE_CHARS) -> Tuple[str, bool]:
+    """Potong di `}` penutup top-level terakhir sebelum limit (contract utuh), fallback potong di limit."""
+    if len(content) <= limit: return content, False
+    cut = content.rfind("\n}", 0, limit - 1)
+    return (content[:cut + 2] if cut > 0 else content[:limit]), True
+
+
+def budget_files(files: List[SourceFile], max_file: int = SCAN_MAX_FILE_CHARS, max_total: int = SCAN_MAX_TOTAL_CHARS) -> Tuple[List[SourceFile], List[str]]:
+    """
+    Terapkan batas ukuran supaya waktu scan terbatas berapa pun besar source-nya. Urutan tetap: file project
+    (path bukan @.../lib/...) dulu, lalu sisanya, masing-masing sesuai urutan source. Return (file, catatan partial).
+    """
+    ordered = [f for f in files if not f.path.startswith(LIBRARY_PATH_PREFIXES)] + [f for f in files if f.path.startswith(LIBRARY_PATH_PREFIXES)]
+    kept, notes, total, dropped = [], [], 0, 0
+    for f in ordered:
+        if total >= max_total: dropped += 1; continue
+        content, truncated = truncate_source(f.content, min(max_file, max_total - total))
+        if truncated: notes.append(f"⚠️ Partial analysis: {f.path} truncated to {len(content) // 1024} KB")
+        kept.append(SourceFile(f.path, content)); total += len(content)
+    if dropped: notes.append(f"⚠️ Partial analysis: {dropped} file(s) over the {max_total // 1024} KB size limit not scanned")
+    return kept, notes
+
+
+# --- CLI: generate fingerprint dari checkout library ---
+def _iter_sol_files(root: str) -> Iterable[Tuple[str, str]]:
+    if os.path.isfile(root):
+        with open(root, encoding="utf-8") as fh: text = fh.read()
+        if root.endswith(".json"):
+            for f in split_source_files(text): yield f.path, f.content
+        else:
+            yield root, text
+        return
+    for dirpath, _, filenames in os.walk(root):
+        for name in sorted(filenames):
+            if not name.endswith(".sol"): continue
+            full = os.path.join(dirpath, name)
+            with open(full, encoding="utf-8") as fh: yield os.path.relpath(full, root), fh.read()
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:]:
+        for path, content in _iter_sol_files(arg):
+            print(f"{content_fingerprint(content)}  {path}")
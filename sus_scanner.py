@@ -0,0 +1,598 @@
+# sus_scanner.py
+
+import os
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from scanner_config import SCAN_MODE, STANDARD_ERC20_FUNCTIONS, IGNORED_ADMIN_VARS, SAFE_SETTER_EXCLUDES, SCAN_CACHE, DETECTORS
+from detector_registry import KIND_SOURCE, KIND_EXTRA
+from sol_index import SolidityIndex, FunctionInfo, Token, ScanDeadlineExceeded, DEADLINE_CHECK_EVERY, tokenize, _is, _skip_group
+from scan_cache import scan_cache_key
+from source_files import project_files, budget_files, truncate_source
+from fuzzy_names import SCAM_NAMES
+
+# --- POLA (semua di-compile sekali) ---
+_SETTER_NAME_RE = re.compile(r"^(set|enable|disable|update|grant|revoke|transfer|withdraw|mint|burn)", re.I)
+_PUNITIVE_RES = (
+    re.compile(r"amount\s*=\s*amount\s*-\s*\(?\s*_?balances?\s*\[[^\]]+\]\s*\*\s*[0-9_]+", re.I),
+    re.compile(r"amount\s*=\s*_?balances?\s*\[[^\]]+\]\s*\*\s*[0-9_]+", re.I),
+    re.compile(r"amount\s*=\s*amount\s*-\s*\([^\)]*balance[^\)]*\)", re.I),
+)
+
+SENDER_CALLS = {"_msgSender", "msgSender"}
+TIMESTAMP_CMP_OPS = {"<=", "<", ">=", ">"}
+TRANSFER_FUNCTIONS = {"_internaltransfer", "internaltransfer", "_transfer", "transferfrom", "transfer"}
+MAPPING_FLAG_NAMES = {"balancesto", "balancesfrom", "blacklist", "blocklist", "isblocked", "isbanned"}
+MAPPING_FLAG_TRANSFER_NAMES = {"ddsa", "balancesto", "balancesfrom", "blacklist", "isblocked", "isbanned"}
+# Mapping pengecualian fee/limit (_isExcludedFromFee, isTxLimitExempt, ...) ada di hampir semua token ber-tax, bukan sinyal scam
+_EXEMPTION_MAPPING_RE = re.compile(r"exclud|exempt|whitelist|maxtx|maxwallet|limit|pair|marketmaker", re.I)
+AMOUNT_ASSIGN_OPS = {"=", "-=", "+=", "*=", "/="}
+FEE_TAX_KEYWORDS = ("fee", "tax", "settax", "setfee", "gettax", "getfee", "treasury", "marketing", "liquidity")
+
+SCANNER_VERSION = "8"         # Naikkan kalau output detector berubah, supaya hasil lama di SCAN_CACHE tidak terpakai
+TOTAL_SUPPLY_TAIL_WINDOW = 200
+BRACKET_LOOKBACK = 64         # Token maksimal yang dicari mundur untuk '[' pasangan `] +=` (index mapping tidak sepanjang ini)
+REGEX_MAX_CHARS = 16384       # Body fungsi yang dilewatkan ke regex dipotong segini (regex tidak punya timeout)
+SCAN_BUDGET_SECONDS = float(os.getenv("SCAN_BUDGET_SECONDS", "3"))   # Per file; detector yang belum jalan saat budget habis dilewati
+
+
+# --- HELPER TOKEN ---
+def _sender_end(toks: List[Token], i: int) -> int:
+    """Index setelah `msg.sender` / `_msgSender()` / `msgSender()` yang mulai di i, atau -1."""
+    if _is(toks, i, "msg", ".", "sender"): return i + 3
+    if i < len(toks) and toks[i].text in SENDER_CALLS and _is(toks, i + 1, "(", ")"): return i + 3
+    return -1
+
+
+def _bracket_owner(toks: List[Token], close_idx: int) -> Tuple[Optional[str], int]:
+    """
+    toks[close_idx] == ']': return (identifier sebelum '[' pasangannya, index '[').
+    Pencarian berhenti di batas statement (; { }) dan setelah BRACKET_LOOKBACK token, supaya `]` tanpa pasangan
+    yang diulang ribuan kali tidak membuat collect_facts kuadratik.
+    """
+    depth = 0
+    for j in range(close_idx, max(-1, close_idx - BRACKET_LOOKBACK), -1):
+        text = toks[j].text
+        if text in (";", "{", "}"): break
+        if text == "]": depth += 1
+        elif text == "[":
+            depth -= 1
+            if depth == 0:
+                return (toks[j - 1].text if j > 0 and toks[j - 1].kind == "id" else None), j
+    return None, -1
+
+
+def _until(toks: List[Token], i: int, stop: str = ";", limit: int = 64) -> List[Token]:
+    out = []
+    for j in range(i, min(len(toks), i + limit)):
+        if toks[j].text == stop: break
+        out.append(toks[j])
+    return out
+
+
+# --- FAKTA SOURCE (dikumpulkan dalam SATU pass atas token stream) ---
+class BalanceAdd(NamedTuple):
+    key: str            # isi index _balances[...] (token digabung tanpa spasi)
+    rhs: Tuple[str, ...]
+    start: int          # offset karakter di source
+
+
+class SourceFacts:
+    """Semua fakta yang dibutuhkan detector: struktur dari SolidityIndex + pola dari satu kali jalan atas token."""
+
+    def __init__(self, index: SolidityIndex):
+        self.index = index
+        self.source = index.source
+        self.tokens = index.tokens
+        self.ident_counts: Counter = Counter()
+        self.idents_lower: Set[str] = set()
+        self.state_vars: Set[str] = set(index.state_vars)
+        self.bool_mappings: List[str] = [v.name for v in index.mappings("address", "bool")]   # urutan source
+        self.sender_assigns: List[str] = []
+        self.sender_checks: List[Tuple[str, str]] = []
+        self.functions: List[FunctionInfo] = [fn for fn in index.functions if fn.kind == "function"]
+        self.balance_adds: List[BalanceAdd] = []
+        self.total_supply_vars: List[str] = []
+        self.timestamp_assigns: List[str] = []
+        self.timestamp_compared: Set[str] = set()
+        self.xor_self = False
+        self.xor_like = False
+        self.deducts_entire_balance = False
+        self.mint_like = False
+        self.short_revert = False
+        self.holders_list = False
+        self.kill_window_cmp = False
+
+
+def collect_facts(source: str, toks: Optional[List[Token]] = None, deadline: Optional[float] = None) -> SourceFacts:
+    """Satu pass atas token; raise ScanDeadlineExceeded kalau `deadline` (time.perf_counter) lewat."""
+    if toks is None: toks = tokenize(source, deadline)
+    f = SourceFacts(SolidityIndex(source, toks))
+    n = len(toks)
+    for i, t in enumerate(toks):
+        if deadline is not None and i % DEADLINE_CHECK_EVERY == 0 and time.perf_counter() > deadline: raise ScanDeadlineExceeded("collect_facts")
+        text = t.text
+        if t.kind == "id":
+            f.ident_counts[text] += 1
+            low = text.lower()
+            f.idents_lower.add(low)
+            if text == "revert" and _is(toks, i + 1, "(") and i + 3 < n and toks[i + 2].kind == "str" and toks[i + 3].text == ")":
+                lit = toks[i + 2].text
+                if lit.startswith('"') and 1 <= len(lit) - 2 <= 6: f.short_revert = True
+            elif text.endswith("_Holders") and _is(toks, i + 1, "["): f.holders_list = True
+            elif text.endswith("getTokenHolders") and _is(toks, i + 1, "("): f.holders_list = True
+            continue
+
+        if t.kind != "op": continue
+        prev = toks[i - 1] if i > 0 else None
+        lhs = prev.text if prev is not None and prev.kind == "id" else None
+
+        if text == "=":
+            if lhs is None: continue
+            end = _sender_end(toks, i + 1)
+            if end != -1 and _is(toks, end, ";"): f.sender_assigns.append(lhs)
+            if i + 3 < n and toks[i + 1].kind == "id" and toks[i + 2].text == "^" and toks[i + 3].kind == "id":
+                a, b = toks[i + 1].text, toks[i + 3].text
+                if len(lhs) >= 2 and len(a) >= 2 and len(b) >= 2:
+                    f.xor_like = True
+                    if lhs == a == b: f.xor_self = True
+            if lhs == "deductAmount" and _is(toks, i + 1, "balances", "["): f.deducts_entire_balance = True
+            if lhs.endswith("_totalSupply"): f.mint_like = True
+            if _is(toks, i + 1, "totalSupply", "(", ")", ";"): f.total_supply_vars.append(lhs)
+            if _is(toks, i + 1, "block", ".", "timestamp", "+") and i + 5 < n and toks[i + 5].kind == "num": f.timestamp_assigns.append(lhs)
+
+        elif text in ("+=", "-=", "*="):
+            if lhs is not None and lhs.endswith("_totalSupply"): f.mint_like = True
+            if prev is None or prev.text != "]": continue
+            owner, open_idx = _bracket_owner(toks, i - 1)
+            if not owner: continue
+            low = owner.lower()
+            if text == "+=" and low.endswith("balances") and i + 1 < n and toks[i + 1].kind in ("id", "num"): f.mint_like = True
+            if text == "+=" and low.endswith("_balances"):
+                key = "".join(x.text for x in toks[open_idx + 1:i - 1])
+                f.balance_adds.append(BalanceAdd(key, tuple(x.text for x in _until(toks, i + 1)), toks[open_idx].start))
+            if text == "-=" and low.endswith("balances") and _is(toks, i + 1, "deductAmount"): f.deducts_entire_balance = True
+
+        elif text in ("==", "!="):
+            if lhs is not None and _is(toks, i + 1, "msg", ".", "sender"): f.sender_checks.append((lhs, text))
+
+        elif text in TIMESTAMP_CMP_OPS:
+            if _is(toks, i - 3, "block", ".", "timestamp") and i + 1 < n and toks[i + 1].kind == "id":
+                f.timestamp_compared.add(toks[i + 1].text)
+                if text == "<=" and toks[i + 1].text.startswith("_killEndTime"): f.kill_window_cmp = True
+            elif lhs is not None and _is(toks, i + 1, "block", ".", "timestamp"):
+                f.timestamp_compared.add(lhs)
+    return f
+
+
+# --- DETECTOR: pola source tambahan (extra_scan_source_patterns) ---
+def _flag(sus_list: list, detailed_flags: Optional[list], message: str, flag: Dict):
+    sus_list.append(message)
+    if detailed_flags is not None: detailed_flags.append(flag)
+
+
+def _is_sender_key(key: str) -> bool:
+    return key in ("msg.sender", "_msgSender()", "msgSender()")
+
+
+def _total_supply_mult(rhs: Tuple[str, ...], base: Tuple[str, ...] = ("totalSupply", "(", ")")) -> Tuple[bool, Optional[int]]:
+    """Cocokkan `<base> * N` di awal rhs; return (cocok, N atau None kalau N tidak bisa di-parse)."""
+    k = len(base)
+    if rhs[:k] != base or len(rhs) <= k + 1 or rhs[k] != "*": return False, None
+    digits = rhs[k + 1].replace("_", "")
+    if not rhs[k + 1][:1].isdigit(): return False, None
+    try: return True, int(digits)
+    except ValueError: return True, None
+
+
+# Tiap pola = satu detector KIND_EXTRA di registry (urutan daftar = urutan pesan)
+@DETECTORS.register("admin_var", kind=KIND_EXTRA, description="State var di-assign msg.sender (owner kedua)")
+def _extra_admin_var(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    for var in f.sender_assigns:
+        if 3 <= len(var) <= 40 and var in f.state_vars:
+            _flag(sus_list, detailed_flags, f"🚩 Admin variable detected: `{var}` assigned to secondary owner", {"type": "admin_var", "var": var})
+
+
+@DETECTORS.register("admin_check", kind=KIND_EXTRA, description="Akses dicek dengan var custom == msg.sender")
+def _extra_admin_check(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    for var, op in f.sender_checks:
+        if 3 <= len(var) <= 40 and (var in f.state_vars or f.ident_counts[var] > 4):
+            _flag(sus_list, detailed_flags, f"🚩 Access check using custom admin var `{var}` with operator `{op}`", {"type": "admin_check", "var": var, "op": op})
+
+
+@DETECTORS.register("xor_zeroing", kind=KIND_EXTRA, description="x = x ^ x")
+def _extra_xor_zeroing(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    if f.xor_self: _flag(sus_list, detailed_flags, "🚩 XOR with self pattern detected", {"type": "xor_zeroing"})
+
+
+@DETECTORS.register("xor_like", kind=KIND_EXTRA, description="Assignment a = b ^ c")
+def _extra_xor_like(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    if f.xor_like: _flag(sus_list, detailed_flags, "🚩 Potential bitwise zeroing pattern found", {"type": "xor_like"})
+
+
+@DETECTORS.register("burn_entire_balance", kind=KIND_EXTRA, description="Balance dikurangi seluruhnya (deductAmount)")
+def _extra_burn_entire_balance(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    if f.deducts_entire_balance: _flag(sus_list, detailed_flags, "🚩 Function that deducts entire balances detected", {"type": "burn_entire_balance"})
+
+
+@DETECTORS.register("mint_like", kind=KIND_EXTRA, description="_totalSupply / balances bertambah di luar mint standar")
+def _extra_mint_like(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    if f.mint_like: _flag(sus_list, detailed_flags, "🚩 Modifies totalSupply or increases balances in code", {"type": "mint_like"})
+
+
+@DETECTORS.register("mapping_flags", kind=KIND_EXTRA, description="Nama mapping blacklist/flag dikenal")
+def _extra_mapping_flags(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    if f.idents_lower & MAPPING_FLAG_NAMES: _flag(sus_list, detailed_flags, "🚩 Mapping flags found", {"type": "mapping_flags"})
+
+
+@DETECTORS.register("short_revert", severity="warning", kind=KIND_EXTRA, description="revert(\"...\") <= 6 karakter")
+def _extra_short_revert(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    if f.short_revert: _flag(sus_list, detailed_flags, "🟡 Short/obscure revert strings found", {"type": "short_revert"})
+
+
+@DETECTORS.register("holders_list", severity="warning", kind=KIND_EXTRA, description="Kontrak menyimpan daftar holder")
+def _extra_holders_list(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    if f.holders_list: _flag(sus_list, detailed_flags, "🟡 Contract collects token holder addresses", {"type": "holders_list"})
+
+
+@DETECTORS.register("renounce_like", kind=KIND_EXTRA, description="Nama fungsi mengandung renounc")
+def _extra_renounce_like(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    if any("renounc" in fn.name.lower() for fn in f.functions):
+        _flag(sus_list, detailed_flags, "🚩 Suspicious fake renounce function name found", {"type": "renounce_like"})
+
+
+@DETECTORS.register("owner_mint_totalSupply_mul", kind=KIND_EXTRA, description="_balances[msgSender] += totalSupply() * N")
+def _extra_owner_mint_mul(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    for add in f.balance_adds:
+        matched, mult = _total_supply_mult(add.rhs)
+        if add.key in ("_msgSender()", "msgSender()") and matched and mult is not None and mult >= 10:
+            _flag(sus_list, detailed_flags, "🚩 Owner mint via fake renounce function detected", {"type": "owner_mint_totalSupply_mul"}); break
+
+
+@DETECTORS.register("mapping_flag_transfer", kind=KIND_EXTRA, description="Mapping flag yang dipakai logic transfer")
+def _extra_mapping_flag_transfer(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    if f.idents_lower & MAPPING_FLAG_TRANSFER_NAMES: _flag(sus_list, detailed_flags, "🚩 Blacklist/flag mapping and custom transfer logic found", {"type": "mapping_flag_transfer"})
+
+
+@DETECTORS.register("kill_end_time", kind=KIND_EXTRA, description="block.timestamp <= _killEndTime")
+def _extra_kill_end_time(f: SourceFacts, sus_list: list, detailed_flags: Optional[list]):
+    if f.kill_window_cmp and any("killEndTime" in name for name in f.ident_counts):
+        _flag(sus_list, detailed_flags, "🚩 Kill window logic detected", {"type": "kill_window"})
+
+
+def scan_extra_patterns(f: SourceFacts, sus_list: list, detailed_flags: Optional[list] = None):
+    stats = []
+    for d in DETECTORS.enabled(KIND_EXTRA):
+        secs, hit = DETECTORS.run(d, f, sus_list, detailed_flags)
+        stats.append((d.name, secs, hit))
+    DETECTORS.record(stats)
+
+
+def extra_scan_source_patterns(source_code: str, sus_list: list, detailed_flags: list = None):
+    if not isinstance(source_code, str) or not source_code: return
+    source_code, _ = truncate_source(source_code)
+    scan_extra_patterns(collect_facts(source_code), sus_list, detailed_flags)
+    return
+
+
+# --- DETECTOR: ABI ---
+def _classify_abi(abi: List[Dict]) -> Tuple[List[str], List[str], List[str], List[str], int, int]:
+    addr_perm_msgs = []; critical_msgs = []; fee_tax_msgs = []; setter_like_msgs = []
+    def is_address_param(p): return p.get("type","").startswith("address")
+    def is_bool_param(p): return p.get("type","") == "bool"
+    def is_uint_param(p): return p.get("type","").startswith("uint")
+    PRIORITY = {"critical": 0, "addr_perm": 1, "fee_tax": 2, "setter": 3, "other": 4}
+    seen_funcs = {}; fee_tax_count = 0; setter_count = 0
+
+    for f in abi:
+        if f.get("type") != "function": continue
+        name = f.get("name","") or ""; lname = name.lower(); inputs = f.get("inputs",[]) or []
+        if name in STANDARD_ERC20_FUNCTIONS: continue
+        tag = None; tag_priority = PRIORITY["other"]
+        if "transfertoburn" in lname:
+            tag = "critical"; tag_priority = PRIORITY["critical"]
+        elif any(k in lname for k in FEE_TAX_KEYWORDS):
+            tag = "fee_tax"; tag_priority = PRIORITY["fee_tax"]
+        elif len(inputs) >= 2 and is_address_param(inputs[0]) and (is_bool_param(inputs[1]) or is_uint_param(inputs[1])):
+            tag = "addr_perm"; tag_priority = PRIORITY["addr_perm"]
+        elif _SETTER_NAME_RE.match(name):
+            if lname not in SAFE_SETTER_EXCLUDES:
+                tag = "setter"; tag_priority = PRIORITY["setter"]
+        prev_tag = seen_funcs.get(name)
+        prev_priority = PRIORITY.get(prev_tag, PRIORITY["other"]) if prev_tag else None
+        if prev_tag is None or (prev_priority is not None and tag_priority < prev_priority):
+            if tag == "critical":
+                cm = f"🔴 Critical control function: {name}"
+                if cm not in critical_msgs: critical_msgs.append(cm)
+            elif tag == "addr_perm":
+                s = f"🟢 Address permission control: {name}"
+                if s not in addr_perm_msgs: addr_perm_msgs.append(s)
+            elif tag == "fee_tax":
+                fee_tax_count += 1
+                if fee_tax_count <= 6: fee_tax_msgs.append(f"🟡 Fee/Limit/Tax control: {name}")
+            elif tag == "setter":
+                setter_count += 1
+                if setter_count <= 8: setter_like_msgs.append(f"🟡 Setter: {name}")
+            if tag: seen_funcs[name] = tag
+    return addr_perm_msgs, critical_msgs, fee_tax_msgs, setter_like_msgs, fee_tax_count, setter_count
+
+
+# --- DETECTOR: source (owner mint, transfer, kill window, fake renounce) ---
+def _admin_vars(f: SourceFacts) -> Set[str]:
+    checks = {var for var, _ in f.sender_checks}
+    return {v for v in f.sender_assigns if 3 <= len(v) <= 60 and v in f.state_vars and v in checks and v not in IGNORED_ADMIN_VARS}
+
+
+@DETECTORS.register("owner_mints", description="_balances[owner] += totalSupply() * N")
+def _detect_owner_mints(f: SourceFacts, critical_msgs: List[str], fee_tax_msgs: List[str]):
+    owner_like_vars = {v for v in f.sender_assigns if 3 <= len(v) <= 80}
+    mint_patterns = []
+    for var in owner_like_vars:
+        for add in f.balance_adds:
+            matched, mult = _total_supply_mult(add.rhs)
+            if add.key == var and matched: mint_patterns.append(("var", var, mult)); break
+    for add in f.balance_adds:
+        matched, mult = _total_supply_mult(add.rhs)
+        if _is_sender_key(add.key) and matched: mint_patterns.append(("direct", "_msgSender/msg.sender", mult)); break
+    if f.total_supply_vars:
+        var_total = f.total_supply_vars[0]
+        for add in f.balance_adds:
+            matched, mult = _total_supply_mult(add.rhs, (var_total,))
+            if _is_sender_key(add.key) and matched: mint_patterns.append(("indirect", var_total, mult)); break
+    for kind, target, mult in mint_patterns:
+        if mult is None: critical_msgs.append(f"🚩 Owner mint pattern detected targeting {target} (multiplier unparsable)")
+        elif mult >= 10: critical_msgs.append(f"🚩 Owner mint: {target} x {mult}")
+        else: fee_tax_msgs.append(f"🚩 Small owner mint pattern found (multiplier {mult})")
+
+
+def _transfer_functions(f: SourceFacts) -> List[FunctionInfo]:
+    # Semua override transfer diperiksa (source flattened biasanya berisi ERC20 OpenZeppelin DAN versi token)
+    return [tf for tf in f.functions if tf.name.lower() in TRANSFER_FUNCTIONS and tf.body]
+
+
+@DETECTORS.register("punitive_transfer", description="amount dipotong berdasarkan balance di fungsi transfer")
+def _detect_punitive_transfer(f: SourceFacts, critical_msgs: List[str], fee_tax_msgs: List[str]):
+    for tf in _transfer_functions(f):
+        body_text = f.index.body_text(tf)[:REGEX_MAX_CHARS]
+        if any(r.search(body_text) for r in _PUNITIVE_RES): critical_msgs.append("🚩 Punitive transfer logic detected")
+
+
+@DETECTORS.register("mapping_transfer", description="Mapping address=>bool jadi kondisi perubahan amount/balance di transfer")
+def _detect_mapping_transfer(f: SourceFacts, critical_msgs: List[str], fee_tax_msgs: List[str]):
+    for tf in _transfer_functions(f): _check_transfer_mappings(f, tf, critical_msgs)
+
+
+def _statement_end(toks: List[Token], i: int, hi: int) -> int:
+    """i = awal statement/blok; return index setelah `}` pasangannya atau setelah `;`."""
+    if i < hi and toks[i].text == "{": return min(hi, _skip_group(toks, i, "{", "}"))
+    depth = 0
+    for k in range(i, hi):
+        t = toks[k].text
+        if t in ("(", "[", "{"): depth += 1
+        elif t in (")", "]", "}"): depth -= 1
+        elif t == ";" and depth <= 0: return k + 1
+    return hi
+
+
+def _controlled_range(toks: List[Token], j: int, lo: int, hi: int) -> Optional[Tuple[int, int]]:
+    """
+    Token j ada di kondisi `if (...)` -> range body if (+ else); di ruas kondisi ternary `x = cond ? a : b;`
+    -> range statement itu sendiri. Selain itu (require, assignment biasa) None.
+    """
+    depth, k = 0, j - 1
+    while k >= lo:
+        t = toks[k].text
+        if t == ")": depth += 1
+        elif t == "(":
+            if depth == 0 and _is(toks, k - 1, "if"):
+                body = _skip_group(toks, k, "(", ")")
+                end = _statement_end(toks, body, hi)
+                if _is(toks, end, "else"): end = _statement_end(toks, end + 1, hi)
+                return body, end
+            if depth > 0: depth -= 1
+        elif t in (";", "{", "}") and depth == 0: break
+        k -= 1
+    start, end = k + 1, _statement_end(toks, j, hi)
+    if any(toks[q].text == "?" for q in range(j, end)): return start, end
+    return None
+
+
+def _modifies_amount_or_balance(toks: List[Token], a: int, b: int) -> bool:
+    """Ada assignment ke `amount` atau tulis ke `*_balances[...]` di token [a, b)."""
+    for k in range(a, b):
+        low = toks[k].text.lower()
+        if low == "amount" and k + 1 < b and toks[k + 1].text in AMOUNT_ASSIGN_OPS: return True
+        if (low.endswith("_balance") or low.endswith("_balances")) and _is(toks, k + 1, "["):
+            m = _skip_group(toks, k + 1, "[", "]")
+            while _is(toks, m, "["): m = _skip_group(toks, m, "[", "]")
+            if m < b and toks[m].text in AMOUNT_ASSIGN_OPS: return True
+    return False
+
+
+def _check_transfer_mappings(f: SourceFacts, tf: FunctionInfo, critical_msgs: List[str]):
+    # Hanya kalau akses mapping benar-benar mengontrol perubahan amount/balance (kondisi if / ternary),
+    # bukan sekadar muncul di dekatnya; mapping pengecualian fee/limit dilewati
+    toks = f.tokens
+    lo, hi = tf.body
+    for mn in f.bool_mappings:
+        if _EXEMPTION_MAPPING_RE.search(mn): continue
+        for j in range(lo, hi):
+            if toks[j].text != mn or not _is(toks, j + 1, "["): continue
+            region = _controlled_range(toks, j, lo, hi)
+            if region and _modifies_amount_or_balance(toks, *region):
+                critical_msgs.append(f"🚩 Mapping '{mn}' used to conditionally modify amount/balances in transfer")
+                break
+
+
+@DETECTORS.register("kill_window", description="Var = block.timestamp + N lalu dibandingkan dengan block.timestamp")
+def _detect_kill_window(f: SourceFacts, critical_msgs: List[str], fee_tax_msgs: List[str]):
+    for var in f.timestamp_assigns:
+        if 3 <= len(var) <= 80 and var in f.timestamp_compared: critical_msgs.append("🚩 Kill window logic detected")
+
+
+@DETECTORS.register("fake_renounce", description="Fungsi renounce* selain renounceOwnership")
+def _detect_fake_renounce(f: SourceFacts, critical_msgs: List[str], fee_tax_msgs: List[str]):
+    for fn in f.functions:
+        fname_lower = fn.name.lower()
+        if "renounce" in fname_lower and "ownership" not in fname_lower and 3 <= len(fn.name) <= 80:
+            if SCAM_NAMES.best(fn.name, "fake_renounce"): critical_msgs.append(f"🚩 Fake renounce: {fn.name}")
+            else: fee_tax_msgs.append(f"🚩 Fake renounce function name (unusual): {fn.name}")
+
+
+def _owner_restricted(toks: List[Token], fn: FunctionInfo) -> bool:
+    """Modifier only* (onlyOwner, onlyAdmin, ...) atau body membandingkan msg.sender / _msgSender()."""
+    if any(m.lower().startswith("only") for m in fn.modifiers): return True
+    lo, hi = fn.body
+    for j in range(lo, hi):
+        end = _sender_end(toks, j)
+        if end != -1 and ((end < hi and toks[end].text in ("==", "!=")) or toks[j - 1].text in ("==", "!=")): return True
+    return False
+
+
+def _writes_balance_or_supply(toks: List[Token], a: int, b: int) -> bool:
+    """Ada assignment ke `*balances[...]` atau ke variabel total supply di token [a, b)."""
+    for k in range(a, b):
+        low = toks[k].text.lower()
+        if low.endswith("totalsupply") and k + 1 < b and toks[k + 1].text in AMOUNT_ASSIGN_OPS: return True
+        if low.endswith("balances") and _is(toks, k + 1, "["):
+            m = _skip_group(toks, k + 1, "[", "]")
+            if m < b and toks[m].text in AMOUNT_ASSIGN_OPS: return True
+    return False
+
+
+# Nama dari korpus scam_names.txt saja tidak cukup (DividendTracker.setBalance itu sah): function harus
+# owner-only dan body-nya sendiri menulis balance / total supply
+@DETECTORS.register("hidden_mint_name", description="Fungsi owner-only bernama mint tersembunyi (scam_names.txt) yang menulis balance/supply")
+def _detect_hidden_mint_names(f: SourceFacts, critical_msgs: List[str], fee_tax_msgs: List[str]):
+    for fn in f.functions:
+        if not fn.body: continue
+        m = SCAM_NAMES.best(fn.name, "hidden_mint")
+        if m and _owner_restricted(f.tokens, fn) and _writes_balance_or_supply(f.tokens, *fn.body):
+            critical_msgs.append(f"🚩 Hidden mint-like function: {fn.name} (matches `{m.pattern}`)")
+
+
+@DETECTORS.register("blacklist_mapping_name", description="Nama mapping address=>bool mirip blacklist (scam_names.txt)")
+def _detect_blacklist_mapping_names(f: SourceFacts, critical_msgs: List[str], fee_tax_msgs: List[str]):
+    for name in f.bool_mappings:
+        m = SCAM_NAMES.best(name, "blacklist_alias")
+        if m: critical_msgs.append(f"🚩 Blacklist-style mapping: {name} (matches `{m.pattern}`)")
+
+
+@DETECTORS.register("owner_only_supply", description="Fungsi onlyOwner menambah balance/supply dalam jumlah besar")
+def _detect_owner_only_supply(f: SourceFacts, critical_msgs: List[str], fee_tax_msgs: List[str]):
+    for fn in f.functions:
+        if not fn.body or not any(m.lower() == "onlyowner" for m in fn.modifiers): continue
+        body = f.index.body_tokens(fn)
+        hit = False
+        for j, t in enumerate(body):
+            if t.text.lower().endswith("_balances") and _is(body, j + 1, "["):
+                close = _skip_group(body, j + 1, "[", "]")
+                key = body[j + 2:close - 1]
+                key_ok = _sender_end(body, j + 2) == close - 1 or (len(key) == 1 and key[0].kind == "id")
+                if key_ok and _is(body, close, "+=", "totalSupply", "("): hit = True; break
+            if _is(body, j, "totalSupply", "(", ")", ";"):
+                limit = body[j + 3].start + TOTAL_SUPPLY_TAIL_WINDOW
+                if any(x.start <= limit and (x.kind == "num" or x.text in ("+", "*", "+=", "*=", "++")) for x in body[j + 4:]): hit = True; break
+        if hit: critical_msgs.append(f"🚩 Owner only function '{fn.name}' mints/assigns large supply to owner")
+
+
+def recolor_green_to_red(messages: List[str]) -> List[str]:
+    return [m.replace("🟢", "🔴", 1) if m.startswith("🟢") else m for m in messages]
+
+
+def _dedupe(messages: List[str]) -> List[str]:
+    return list(dict.fromkeys(messages))
+
+
+class FileFindings(NamedTuple):
+    """Hasil detector source untuk SATU file (picklable, digabung dengan hasil ABI di combine_findings)."""
+    admin_vars: Tuple[str, ...]
+    critical: Tuple[str, ...]
+    fee_tax: Tuple[str, ...]
+    skipped: Tuple[str, ...] = ()    # Detector yang tidak jalan karena budget waktu habis
+    stats: Tuple[Tuple[str, float, int], ...] = ()   # (detector, detik, hit) untuk DETECTORS.record di proses utama
+
+
+def _timed_out() -> FileFindings:
+    """Budget habis sebelum detector pertama: semua detector dianggap terlewat (tidak di-cache, ada catatan partial)."""
+    return FileFindings((), (), (), tuple(d.name for d in DETECTORS.enabled(KIND_SOURCE)))
+
+
+def scan_file(source_code: str, toks: Optional[List[Token]] = None, deadline: Optional[float] = None) -> FileFindings:
+    if deadline is None: deadline = time.perf_counter() + SCAN_BUDGET_SECONDS
+    try:
+        facts = collect_facts(source_code, toks, deadline)
+    except ScanDeadlineExceeded:
+        return _timed_out()
+    admin_vars = _admin_vars(facts)
+    critical_msgs: List[str] = []; fee_tax_msgs: List[str] = []; skipped: List[str] = []; stats = []
+    # Ada admin var -> output hanya memuat ABI + admin var, detector lain tidak perlu jalan
+    if not admin_vars:
+        for d in DETECTORS.enabled(KIND_SOURCE):
+            if time.perf_counter() > deadline: skipped.append(d.name); continue
+            secs, hit = DETECTORS.run(d, facts, critical_msgs, fee_tax_msgs)
+            stats.append((d.name, secs, hit))
+    return FileFindings(tuple(sorted(admin_vars)), tuple(critical_msgs), tuple(fee_tax_msgs), tuple(skipped), tuple(stats))
+
+
+def scan_file_cached(source_code: str) -> FileFindings:
+    """scan_file dengan memo per konten: file yang sama di token clone (beda nama/simbol saja) tidak di-scan ulang."""
+    deadline = time.perf_counter() + SCAN_BUDGET_SECONDS
+    try:
+        toks = tokenize(source_code, deadline)
+    except ScanDeadlineExceeded:
+        return _timed_out()
+    key = scan_cache_key(None, toks, salt=f"{SCANNER_VERSION}:{SCAN_MODE}:file:{DETECTORS.config_key()}")
+    cached = SCAN_CACHE.get(key)
+    if cached is not None: return FileFindings(*(tuple(x) for x in cached))
+    findings = scan_file(source_code, toks, deadline)
+    # Hasil yang terpotong budget tergantung beban mesin saat itu, jangan di-cache
+    if not findings.skipped: SCAN_CACHE.put(key, [list(x) for x in findings[:4]])
+    return findings
+
+
+def _budget_notes(findings: List[FileFindings]) -> List[str]:
+    skipped = list(dict.fromkeys(name for f in findings for name in f.skipped))
+    if not skipped: return []
+    return [f"⚠️ Partial analysis: scan time budget exceeded, skipped detectors: {', '.join(skipped)}"]
+
+
+def combine_findings(abi: Optional[List[Dict]], findings: List[FileFindings], notes: Optional[List[str]] = None) -> List[str]:
+    DETECTORS.record(s for f in findings for s in f.stats)
+    notes = list(notes or []) + _budget_notes(findings)
+    return _dedupe(_combine_messages(abi, findings) + notes)
+
+
+def _combine_messages(abi: Optional[List[Dict]], findings: List[FileFindings]) -> List[str]:
+    addr_perm_msgs, critical_msgs, fee_tax_msgs, setter_like_msgs, fee_tax_count, setter_count = _classify_abi(abi or [])
+    admin_vars = set().union(*(f.admin_vars for f in findings))
+    if admin_vars:
+        out = []; out.extend(addr_perm_msgs); out.extend(critical_msgs)
+        for v in sorted(admin_vars): out.append(f"🚩 Admin variable detected: `{v}` assigned to secondary owner")
+        out = recolor_green_to_red(out)
+        if SCAN_MODE != "strict":
+            if fee_tax_count: out.append(f"🟡 Fee/Limit/Tax functions detected: {fee_tax_count}")
+            if setter_count: out.append(f"🟡 Setter functions detected: {setter_count}")
+        return _dedupe(out)
+
+    for f in findings:
+        critical_msgs.extend(f.critical); fee_tax_msgs.extend(f.fee_tax)
+    combined = []; combined.extend(addr_perm_msgs); combined.extend(critical_msgs); combined.extend(fee_tax_msgs[:6]); combined.extend(setter_like_msgs[:8])
+    if not combined: return [] if any(f.skipped for f in findings) else ["🟢 No suspicious non-ERC20 functions found"]
+    return _dedupe(combined)
+
+
+def scan_source(abi: Optional[List[Dict]], source_code: Any = None) -> List[str]:
+    """
+    Sus scan lengkap; input cuma ABI (list dict) + source sehingga bisa dikirim (pickle) ke process pool.
+    Source multi-file (standard-JSON / Sourcify) di-scan per file, file library dikenal dilewati.
+    Ukuran dibatasi budget_files dan tiap file punya budget waktu SCAN_BUDGET_SECONDS.
+    """
+    files, notes = budget_files(project_files(source_code)[0])
+    return combine_findings(abi, [scan_file(f.content) for f in files], notes)
+
+
+def scan_suspicious_features_sync(contract, source_code: Any = None) -> List[str]:
+    return scan_source(getattr(contract, "abi", None), source_code)
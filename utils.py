@@ -2,15 +2,23 @@
 
 import os
 import logging
-import httpx
-import json
-import re
 import asyncio
-from web3 import Web3
-from web3.exceptions import ContractLogicError, BadFunctionCallOutput
+from web3 import Web3, AsyncWeb3
 from typing import Tuple, Any, Dict, Optional, List, Set
 from dotenv import load_dotenv
 from telegram.ext import ContextTypes 
+from rpc_pool import RpcPool, PooledHTTPProvider, PooledAsyncHTTPProvider
+from multicall import multicall_async, erc20_metadata_calls
+from rpc_batch import RpcAutoBatcher, BlockNumberTracker
+from http_clients import HttpClientRegistry
+from call_cache import CallCache
+from verify_store import VerificationStore
+from scan_pool import ScanProcessPool
+from scanner_config import SCAN_CACHE, DETECTORS  # noqa: F401 (singleton scanner, di-export lewat utils untuk handler/main)
+from price_cache import PriceCache
+from price_engine import OnchainPriceEngine, PULSEX_FACTORIES
+from pair_index import PairIndex
+from dexscreener import DexscreenerClient
 
 # Tambahkan ke bagian UTILS
 PULSEX_V1_GRAPHQL_URL = "https://graph.pulsechain.com/subgraphs/name/pulsechain/pulsex/graphql"
@@ -27,7 +35,7 @@ HONEY_V2_ADDRESS = os.getenv("HONEY_V2_ADDRESS")
 HONEY_V1_ADDRESS = os.getenv("HONEY_V1_ADDRESS")
 
 # --- 2. Inisialisasi Web3 dengan Auto-Switch RPC ---
-# List RPC prioritas. Bot akan mencoba satu per satu sampai berhasil.
+# List RPC prioritas. Urutan ini hanya tie-breaker; RpcPool memilih node berdasarkan health score.
 RPC_LIST = [
     ENV_RPC,                                # Prioritas 1: Dari .env
     "https://pulsechain.publicnode.com",    # Prioritas 2: Sering lolos blokir ISP
@@ -39,56 +47,68 @@ RPC_LIST = [
 # Hapus duplikat dan nilai None/Kosong
 RPC_LIST = list(dict.fromkeys([url for url in RPC_LIST if url]))
 
-w3 = None
-connected_rpc_url = None
-
-print(f"🔌 Connecting to PulseChain... Trying {len(RPC_LIST)} RPCs...")
-
-for url in RPC_LIST:
-    try:
-        provider = Web3.HTTPProvider(url, request_kwargs={'timeout': 10})
-        temp_w3 = Web3(provider)
-        if temp_w3.is_connected():
-            w3 = temp_w3
-            connected_rpc_url = url
-            print(f"✅ Success! Connected to: {url}")
-            break
-        else:
-            print(f"⚠️ Failed to connect to: {url}")
-    except Exception as e:
-        print(f"⚠️ Error connecting to {url}: {e}")
-
-if w3 is None:
-    logging.error("❌ FATAL: All RPC connections failed.")
-    print("❌ FATAL: Could not connect to any PulseChain RPC node. Check your internet connection or VPN.")
+# Semua request lewat RpcPool: node dipilih per-call berdasarkan health score,
+# failover otomatis, dan read call bisa di-hedge ke node kedua.
+RPC_HEDGE_ENABLED = os.getenv("RPC_HEDGE_ENABLED", "true").lower() in ("1", "true", "yes")
+RPC_POOL = RpcPool(RPC_LIST, hedge=RPC_HEDGE_ENABLED)
+
+# Tidak ada probe jaringan saat import: koneksi dibangun di background (RPC_POOL.warmup)
+# dari main.post_init, handler menunggu lewat wait_rpc_ready().
+RPC_READY_TIMEOUT = 15
+w3 = Web3(PooledHTTPProvider(RPC_POOL))
+
+# --- 2b. Client AsyncWeb3 (dipakai bersama oleh semua handler) ---
+# Satu AsyncWeb3 di atas RpcPool (satu httpx.AsyncClient yang di-reuse), jadi scan paralel
+# tidak menghabiskan thread pool default seperti asyncio.to_thread + HTTPProvider.
+aw3 = AsyncWeb3(PooledAsyncHTTPProvider(RPC_POOL))
+
+# --- 2c. JSON-RPC Batch ---
+# Call yang dipanggil di tick event loop yang sama (dari handler mana pun) digabung jadi satu POST.
+RPC_BATCHER = RpcAutoBatcher(RPC_POOL)
+BLOCK_TRACKER = BlockNumberTracker(RPC_BATCHER)
+
+# --- 2d. Cache eth_call per block bucket ---
+# Read view (metadata, owner, totalSupply, saldo burn/LP) dipakai ulang selama chain belum maju beberapa block.
+CALL_CACHE = CallCache(BLOCK_TRACKER)
+# Simulasi tax (checkHoneyMain, eth_call 5M gas) di-cache per (token, HONEY contract) dengan bucket lebih pendek
+TAX_SIM_CACHE_BLOCKS = int(os.getenv("TAX_SIM_CACHE_BLOCKS", "3"))
+TAX_SIM_BEST_LP_ONLY = os.getenv("TAX_SIM_BEST_LP_ONLY", "false").lower() in ("1", "true", "yes")
+TAX_SIM_CACHE = CallCache(BLOCK_TRACKER, blocks=TAX_SIM_CACHE_BLOCKS)
 
 # --- KONFIGURASI API LAINNYA ---
 PULSESCAN_API_BASE_URL = "https://api.scan.pulsechain.com/api"
 SOURCIFY_REPO = "https://repo.sourcify.dev/contracts"
 DEXSCREENER_API_URL = "https://api.dexscreener.com/latest/dex/tokens"
+COINGECKO_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price"
+
+# --- HTTP CLIENT BERSAMA ---
+# Satu AsyncClient (keep-alive, HTTP/2) per host upstream, dibuka/ditutup lewat lifecycle Application di main.py.
+HTTP_CLIENTS = HttpClientRegistry(warm_hosts=[
+    PULSEX_V2_GRAPHQL_URL, PULSESCAN_API_BASE_URL, SOURCIFY_REPO, DEXSCREENER_API_URL, COINGECKO_PRICE_URL,
+])
+
+# --- CACHE VERIFIKASI (persisten, SQLite) ---
+# ABI + source kontrak terverifikasi disimpan di disk, jadi scan ulang token lama tidak perlu ke PulseScan/Sourcify
+VERIFY_STORE = VerificationStore()
+SCAN_POOL = ScanProcessPool()     # Sus scan jalan di process terpisah, bukan thread (GIL)
+PRICE_CACHE = PriceCache()        # Harga token per alamat (TTL + stale-while-revalidate) di depan subgraph
+DEXSCREENER = DexscreenerClient(HTTP_CLIENTS.get)   # Rate limit (token bucket), batch /tokens/v1, cache respons singkat
 
 # --- ALAMAT KRITIS ---
 WPLS_ADDRESS = "0xA1077a294dDE1B09bB078844df40758a5D0f9a27"
 WPLS_CHECKSUM_LOWER = WPLS_ADDRESS.lower() 
+# Index lokal pair PulseX (log PairCreated factory V1/V2, SQLite), sync di background dari main.py
+PAIR_INDEX_ENABLED = os.getenv("PAIR_INDEX_ENABLED", "true").lower() in ("1", "true", "yes")
+PAIR_INDEX = PairIndex(list(PULSEX_FACTORIES), lambda params: RPC_BATCHER.call("eth_getLogs", [params]), BLOCK_TRACKER.get)
+# Harga dari reserve pair PulseX (multicall), tidak tergantung kesehatan subgraph
+PRICE_ENGINE = OnchainPriceEngine(aw3, WPLS_ADDRESS, cache=CALL_CACHE, pair_index=PAIR_INDEX)
+PRICE_SOURCE = os.getenv("PRICE_SOURCE", "subgraph").lower()   # "subgraph": on-chain hanya fallback; "onchain": on-chain dulu, subgraph fallback
 DEAD_ADDRESS = "0x000000000000000000000000000000000000dEaD"
 PULSE_BURN_ADDRESS = "0x0000000000000000000000000000000000000369"
 
-BURN_ADDRESSES_CHECKSUM = []
-WPLS_CHECKSUM = None
-if w3:
-    try:
-        BURN_ADDRESSES_CHECKSUM = [w3.to_checksum_address(a) for a in [DEAD_ADDRESS, "0x0000000000000000000000000000000000000000", PULSE_BURN_ADDRESS]]
-        WPLS_CHECKSUM = w3.to_checksum_address(WPLS_ADDRESS)
-    except Exception:
-        pass
-
-# --- KONFIGURASI SCANNER ---
-SCAN_MODE = "balanced"
-STANDARD_ERC20_FUNCTIONS = {
-    'totalSupply', 'balanceOf', 'transfer', 'transferFrom', 'approve', 'allowance', 'name', 'symbol', 'decimals', 'owner', 'increaseAllowance', 'decreaseAllowance', 'getTokenHolders', 'burn', 'burnFrom' 
-}
-IGNORED_ADMIN_VARS = {"owner", "_owner", "spender", "msgSender", "burnAddress", "recipient", "to", "from", "getFees"}
-SAFE_SETTER_EXCLUDES = {"transferownership", "_transferownership"}
+# Checksum murni komputasi lokal (keccak), tidak perlu koneksi RPC
+BURN_ADDRESSES_CHECKSUM = [Web3.to_checksum_address(a) for a in [DEAD_ADDRESS, "0x0000000000000000000000000000000000000000", PULSE_BURN_ADDRESS]]
+WPLS_CHECKSUM = Web3.to_checksum_address(WPLS_ADDRESS)
 
 # --- ABI MINIMAL ---
 TOKEN_MINIMAL_ABI = [
@@ -154,27 +174,27 @@ PT_TOKENS_LIST = [
 ]
 
 # --- FUNGSI UTILITAS SINKRON ---
-def _safe_rpc_call(func):
-    try: return func()
-    except (ContractLogicError, BadFunctionCallOutput, Exception): return None
-
 def safe_decimals(value, fallback=18):
     try:
         v = int(value)
         return v if 0 < v <= 30 else fallback
     except: return fallback
 
-def get_token_metadata_sync(ca):
+def _build_token_metadata(results, include_owner: bool = False):
+    meta = {"Name": "Unknown Token", "Ticker": "TOKEN", "Decimals": 18}
+    name, symbol, decimals = results[:3]
+    meta["Name"] = name.strip('\x00') if isinstance(name, str) else (name if name is not None else "Unknown Token")
+    meta["Ticker"] = symbol.strip('\x00') if isinstance(symbol, str) else (symbol if symbol is not None else "TOKEN")
+    meta["Decimals"] = decimals if decimals is not None else 18
+    if include_owner: meta["Owner"] = results[3]
+    return meta
+
+async def get_token_metadata_async(ca, include_owner: bool = False):
     meta = {"Name": "Unknown Token", "Ticker": "TOKEN", "Decimals": 18}
-    if not w3: return meta
+    if not aw3: return meta
     try:
-        token_contract = w3.eth.contract(address=w3.to_checksum_address(ca), abi=TOKEN_MINIMAL_ABI)
-        name = _safe_rpc_call(token_contract.functions.name().call)
-        symbol = _safe_rpc_call(token_contract.functions.symbol().call)
-        decimals = _safe_rpc_call(token_contract.functions.decimals().call)
-        meta["Name"] = name.strip('\x00') if isinstance(name, str) else (name if name is not None else "Unknown Token")
-        meta["Ticker"] = symbol.strip('\x00') if isinstance(symbol, str) else (symbol if symbol is not None else "TOKEN")
-        meta["Decimals"] = decimals if decimals is not None else 18
+        results = await multicall_async(aw3, erc20_metadata_calls(Web3.to_checksum_address(ca), include_owner=include_owner), cache=CALL_CACHE)
+        meta = _build_token_metadata(results, include_owner)
     except Exception: pass
     return meta
 
@@ -223,23 +243,50 @@ def levenshtein(a: str, b: str) -> int:
 # --- FUNGSI UTILITAS ASINKRON (Networking/Shared) ---
 REQUEST_TIMEOUT = 8
 
-async def _httpx_get(client, url, timeout=REQUEST_TIMEOUT):
-    try: return await client.get(url, timeout=timeout)
+async def _httpx_get(client, url, timeout=REQUEST_TIMEOUT, **kwargs):
+    try: return await client.get(url, timeout=timeout, **kwargs)
     except Exception as e:
         logging.debug(f"HTTPX GET error for {url}: {type(e).__name__}: {e}")
         return None
 
 async def query_graphql(url: str, query: str, variables: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
     try:
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            response = await client.post(url, json={"query": query, "variables": variables or {}})
-            response.raise_for_status()
-            data = response.json()
-            if data and data.get("data"): return data["data"]
+        response = await HTTP_CLIENTS.get(url).post(url, json={"query": query, "variables": variables or {}}, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        data = response.json()
+        if data and data.get("data"): return data["data"]
     except Exception as e:
         logging.error(f"GraphQL HTTPX request failed for {url}: {e}"); return None
     return None
 
+async def wait_rpc_ready(timeout: float = RPC_READY_TIMEOUT) -> bool:
+    return await RPC_POOL.wait_ready(timeout)
+
+def _hex_to_int(value) -> Optional[int]:
+    try: return int(value, 16) if isinstance(value, str) else int(value)
+    except (TypeError, ValueError): return None
+
+async def get_address_state(address: str, include_balance: bool = False) -> Dict[str, Any]:
+    """
+    eth_getCode (+ eth_getBalance) + header block terbaru (BLOCK_TRACKER) lewat RPC_BATCHER, jadi satu HTTP POST.
+    Error eth_getCode di-raise (handler yang memutuskan pesan error); balance/block boleh None.
+    """
+    checksum_addr = Web3.to_checksum_address(address)
+    calls = [RPC_BATCHER.call("eth_getCode", [checksum_addr, "latest"])]
+    if include_balance: calls.append(RPC_BATCHER.call("eth_getBalance", [checksum_addr, "latest"]))
+    calls.append(BLOCK_TRACKER.get())
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    code = results[0]
+    if isinstance(code, BaseException): raise code
+    balance = results[1] if include_balance else None
+    return {
+        "address": checksum_addr,
+        "is_contract": isinstance(code, str) and len(code) > 2 and int(code, 16) != 0,
+        "code": code if isinstance(code, str) else None,
+        "balance_wei": None if isinstance(balance, BaseException) else _hex_to_int(balance),
+        "block_number": BLOCK_TRACKER.number,
+    }
+
 async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
     logging.error("Exception while handling an update:", exc_info=context.error)
     print(f"\n\n🚨 TELEGRAM HANDLER CRASHED! 🚨\nError: {context.error}\n" + "-" * 50)
@@ -250,48 +297,64 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> N
 #  HARGA TOKEN VIA SUBGRAPH
 # ==========================
 
-async def fetch_prices_from_subgraph(url: str, address_list: List[str]) -> Dict[str, float]:
-    """
-    Ambil harga token (derivedUSD) dari subgraph PulseX.
-    - Hanya baca entitas 'tokens'.
-    - Return: {address_lower: price_usd}
-    """
-    prices: Dict[str, float] = {}
-
-    # Tidak ada alamat = tidak usah query
-    if not address_list:
+SUBGRAPH_CHUNK_SIZE = min(1000, int(os.getenv("SUBGRAPH_CHUNK_SIZE", "200")))   # Alamat per query id_in (subgraph membatasi first <= 1000)
+SUBGRAPH_CONCURRENCY = int(os.getenv("SUBGRAPH_CONCURRENCY", "4"))              # Query chunk paralel maksimum per subgraph
+SUBGRAPH_RETRIES = int(os.getenv("SUBGRAPH_RETRIES", "2"))                      # Ulangi chunk yang gagal sebanyak ini
+SUBGRAPH_PRICE_QUERY = """
+query GetTokenPrices($tokenAddresses: [ID!]!, $first: Int!) {
+  tokens(where: {id_in: $tokenAddresses}, first: $first) {
+    id
+    derivedUSD
+  }
+}
+"""
+_SUBGRAPH_SLOTS: Dict[str, asyncio.Semaphore] = {}
+
+
+async def _subgraph_chunk(url: str, chunk: List[str]) -> Optional[Dict[str, float]]:
+    """Satu query id_in; return None kalau subgraph tetap tidak menjawab setelah retry."""
+    slots = _SUBGRAPH_SLOTS.setdefault(url, asyncio.Semaphore(SUBGRAPH_CONCURRENCY))
+    for attempt in range(SUBGRAPH_RETRIES + 1):
+        if attempt: await asyncio.sleep(0.5 * attempt)
+        async with slots:
+            data = await query_graphql(url, SUBGRAPH_PRICE_QUERY, {"tokenAddresses": chunk, "first": len(chunk)})
+        if data is None: continue
+        prices: Dict[str, float] = {}
+        for token in data.get("tokens", []):
+            addr = (token.get("id") or "").lower()
+            try:
+                price = float(token.get("derivedUSD", 0) or 0)
+            except (TypeError, ValueError):
+                price = 0.0
+            if addr and price > 0:
+                prices[addr] = price
         return prices
+    return None
 
-    # Normalisasi ke lowercase
-    addr_lower = [a.lower() for a in address_list]
 
-    query = """
-    query GetTokenPrices($tokenAddresses: [ID!]!) {
-      tokens(where: {id_in: $tokenAddresses}, first: 1000) {
-        id
-        derivedUSD
-      }
-    }
+async def _subgraph_prices(url: str, address_list: List[str]) -> Tuple[Dict[str, float], Set[str]]:
     """
-    variables = {"tokenAddresses": addr_lower}
-
-    data = await query_graphql(url, query, variables)
-    if not data:
-        return prices
-
-    tokens = data.get("tokens", [])
-    for token in tokens:
-        addr = (token.get("id") or "").lower()
-        raw = token.get("derivedUSD", 0)
-        try:
-            price = float(raw or 0)
-        except (TypeError, ValueError):
-            price = 0.0
+    Ambil harga token (derivedUSD) dari subgraph PulseX, dipecah per SUBGRAPH_CHUNK_SIZE alamat dan di-query paralel.
+    - Hanya baca entitas 'tokens'.
+    - Return: ({address_lower: price_usd}, alamat yang chunk-nya dijawab subgraph). Alamat di chunk yang gagal
+      tidak ada di set kedua, jadi "tidak ada harga" bisa dibedakan dari "query gagal".
+    """
+    addr_lower = list(dict.fromkeys(a.lower() for a in address_list if a))
+    chunks = [addr_lower[i:i + SUBGRAPH_CHUNK_SIZE] for i in range(0, len(addr_lower), SUBGRAPH_CHUNK_SIZE)]
+    results = await asyncio.gather(*(_subgraph_chunk(url, c) for c in chunks))
+    prices: Dict[str, float] = {}
+    answered: Set[str] = set()
+    for chunk, result in zip(chunks, results):
+        if result is None:
+            logging.warning(f"Subgraph {url} failed for a chunk of {len(chunk)} token(s)")
+            continue
+        prices.update(result)
+        answered.update(chunk)
+    return prices, answered
 
-        if addr and price > 0:
-            prices[addr] = price
 
-    return prices
+async def fetch_prices_from_subgraph(url: str, address_list: List[str]) -> Dict[str, float]:
+    return (await _subgraph_prices(url, address_list))[0]
 
 
 async def fetch_wpls_price_fallback() -> float:
@@ -300,27 +363,90 @@ async def fetch_wpls_price_fallback() -> float:
     - Coba ambil harga PLS dari CoinGecko.
     - Kalau gagal, return 0.0 (jadi nilai PLS = 0 di report, tapi bot tidak crash).
     """
-    url = "https://api.coingecko.com/api/v3/simple/price?ids=pulsechain&vs_currencies=usd"
+    url = f"{COINGECKO_PRICE_URL}?ids=pulsechain&vs_currencies=usd"
     try:
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            data = resp.json()
-            price = float(data.get("pulsechain", {}).get("usd", 0) or 0)
-            if price <= 0:
-                logging.error("Fallback WPLS price from CoinGecko is 0.")
-            return price
+        resp = await HTTP_CLIENTS.get(url).get(url, timeout=REQUEST_TIMEOUT)
+        resp.raise_for_status()
+        data = resp.json()
+        price = float(data.get("pulsechain", {}).get("usd", 0) or 0)
+        if price <= 0:
+            logging.error("Fallback WPLS price from CoinGecko is 0.")
+        return price
     except Exception as e:
         logging.error(f"Failed to fetch WPLS price from fallback API: {e}")
         return 0.0
 
 
+async def _subgraph_token_prices(addresses: List[str]) -> Dict[str, float]:
+    """
+    PulseX V2 + V1 subgraph di-query paralel (harga V2 diutamakan, V1 untuk yang tidak ada di V2).
+    Alamat yang dijawab kedua subgraph tapi tanpa harga = 0.0; alamat yang gagal di-query tidak ada di hasil.
+    """
+    prices: Dict[str, float] = {}
+    logging.info(f"Fetching {len(addresses)} token price(s) from PulseX V2 + V1 subgraphs...")
+    results = await asyncio.gather(
+        _subgraph_prices(PULSEX_V2_GRAPHQL_URL, addresses),
+        _subgraph_prices(PULSEX_V1_GRAPHQL_URL, addresses),
+        return_exceptions=True,
+    )
+    (prices_v2, answered_v2), (prices_v1, answered_v1) = [
+        ({}, set()) if isinstance(r, BaseException) else r for r in results
+    ]
+    for label, r in zip(("V2", "V1"), results):
+        if isinstance(r, BaseException): logging.warning(f"Error fetching prices from {label}: {r}")
+
+    for addr in addresses:
+        price = prices_v2.get(addr) or prices_v1.get(addr)
+        if price: prices[addr] = price
+        elif addr in answered_v2 and addr in answered_v1: prices[addr] = 0.0
+    return prices
+
+
+async def fetch_token_prices(addresses: List[str]) -> Dict[str, float]:
+    """
+    Ambil harga token batch tanpa cache dari:
+      1) PulseX V2/V1 subgraph dan reserve pair on-chain (PRICE_ENGINE); urutan sesuai PRICE_SOURCE,
+         sumber kedua hanya untuk alamat yang belum dapat harga dari sumber pertama
+      2) Fallback WPLS dari API eksternal (CoinGecko)
+    Alamat yang dijawab tapi tetap tanpa harga diisi 0.0 (entry negatif untuk PRICE_CACHE);
+    alamat yang gagal di-query di semua sumber tidak ada di hasil.
+    """
+    final_prices: Dict[str, float] = {}
+    all_addrs: List[str] = list({a.lower() for a in addresses if a})
+    if not all_addrs:
+        return final_prices
+
+    sources = [("on-chain", PRICE_ENGINE.get_prices), ("subgraph", _subgraph_token_prices)]
+    if PRICE_SOURCE != "onchain": sources.reverse()
+    for label, source in sources:
+        todo = [a for a in all_addrs if final_prices.get(a, 0.0) <= 0]
+        if not todo: break
+        try:
+            result = await source(todo)
+        except Exception as e:
+            logging.warning(f"Error fetching {label} prices: {e}")
+            continue
+        for addr in todo:
+            if result.get(addr, 0.0) > 0 or (addr in result and addr not in final_prices): final_prices[addr] = result[addr]
+
+    # --- Fallback khusus WPLS ---
+    if WPLS_CHECKSUM_LOWER in all_addrs and final_prices.get(WPLS_CHECKSUM_LOWER, 0.0) <= 0:
+        logging.info("WPLS price not found in subgraphs or pair reserves. Using fallback API...")
+        wpls_price = await fetch_wpls_price_fallback()
+        if wpls_price > 0:
+            final_prices[WPLS_CHECKSUM_LOWER] = wpls_price
+        else:
+            # Jangan disimpan sebagai entry negatif: WPLS selalu punya harga, coba lagi di request berikutnya
+            final_prices.pop(WPLS_CHECKSUM_LOWER, None)
+            logging.error("Failed to resolve WPLS price from subgraphs, pair reserves and fallback API.")
+
+    return final_prices
+
+
 async def get_prices_graphql_batch(addresses: Set[str]) -> Dict[str, float]:
     """
-    Ambil harga token batch dari:
-      1) PulseX V2 subgraph
-      2) PulseX V1 subgraph (fallback)
-      3) Fallback WPLS dari API eksternal (CoinGecko)
+    Harga token batch lewat PRICE_CACHE: yang fresh/stale dijawab dari cache (stale di-refresh di background),
+    hanya alamat yang belum pernah/lama tidak di-cache yang di-fetch sekarang. WPLS selalu ada di hasil.
     """
     final_prices: Dict[str, float] = {}
 
@@ -332,40 +458,14 @@ async def get_prices_graphql_batch(addresses: Set[str]) -> Dict[str, float]:
     # Pastikan WPLS selalu ikut di-query
     all_addrs.add(WPLS_CHECKSUM_LOWER)
 
-    addr_list = list(all_addrs)
-
-    # --- Langkah 1: coba PulseX V2 dulu ---
-    logging.info("Fetching token prices from PulseX V2 subgraph...")
-    try:
-        prices_v2 = await fetch_prices_from_subgraph(PULSEX_V2_GRAPHQL_URL, addr_list)
-        final_prices.update(prices_v2)
-    except Exception as e:
-        logging.warning(f"Error fetching prices from V2: {e}")
-
-    # Cek alamat yang masih belum ada harga / 0
-    missing = [a for a in all_addrs if final_prices.get(a, 0.0) <= 0]
-
-    # --- Langkah 2: fallback ke PulseX V1 ---
-    if missing:
-        logging.info(f"Missing {len(missing)} prices from V2. Trying PulseX V1...")
-        try:
-            prices_v1 = await fetch_prices_from_subgraph(PULSEX_V1_GRAPHQL_URL, missing)
-            for addr, price in prices_v1.items():
-                if price > 0:
-                    final_prices[addr] = price
-        except Exception as e:
-            logging.warning(f"Error fetching prices from V1: {e}")
-
-    # --- Langkah 3: Fallback khusus WPLS ---
-    wpls_price = final_prices.get(WPLS_CHECKSUM_LOWER, 0.0)
-    if wpls_price <= 0:
-        logging.info("WPLS price not found in subgraphs. Using fallback API...")
-        wpls_price = await fetch_wpls_price_fallback()
-        if wpls_price > 0:
-            final_prices[WPLS_CHECKSUM_LOWER] = wpls_price
-        else:
-            # Kalau tetap gagal, set 0 tapi log error
-            final_prices[WPLS_CHECKSUM_LOWER] = 0.0
-            logging.error("Failed to resolve WPLS price from both subgraphs and fallback API.")
+    cached = PRICE_CACHE.lookup(all_addrs)
+    final_prices.update(cached.prices)
+    if cached.stale: PRICE_CACHE.refresh(cached.stale, fetch_token_prices)
+    if cached.missing:
+        fetched = await fetch_token_prices(cached.missing)
+        PRICE_CACHE.put(fetched)
+        final_prices.update({a: p for a, p in fetched.items() if p > 0})
 
+    # Kalau tetap gagal, WPLS = 0 (nilai PLS = 0 di report, tapi bot tidak crash)
+    final_prices.setdefault(WPLS_CHECKSUM_LOWER, 0.0)
     return final_prices
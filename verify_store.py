@@ -0,0 +1,96 @@
+# verify_store.py
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Optional, Tuple
+
+# --- KONFIGURASI CACHE VERIFIKASI ---
+VERIFY_CACHE_PATH = os.getenv("VERIFY_CACHE_PATH", "verify_cache.sqlite3")
+VERIFY_NEGATIVE_TTL = float(os.getenv("VERIFY_NEGATIVE_TTL", "600"))   # "Unverified" bisa berubah (kontrak baru diverifikasi), jadi cuma disimpan sebentar
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verified_contracts (
+    chain_id   INTEGER NOT NULL,
+    address    TEXT    NOT NULL,
+    verified   INTEGER NOT NULL,
+    status     TEXT    NOT NULL,
+    origin     TEXT,
+    abi        TEXT,
+    source     TEXT,
+    fetched_at REAL    NOT NULL,
+    PRIMARY KEY (chain_id, address)
+)
+"""
+
+
+class VerificationStore:
+    """
+    Cache persisten (SQLite) hasil get_verification_status per (chain_id, address).
+    Source terverifikasi untuk alamat yang sudah deploy tidak berubah, jadi hasil verified disimpan permanen;
+    hasil "unverified" hanya dipakai selama `negative_ttl` detik. Semua error SQLite diperlakukan sebagai miss.
+    """
+
+    def __init__(self, path: str = VERIFY_CACHE_PATH, negative_ttl: float = VERIFY_NEGATIVE_TTL):
+        self.path = path
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def get(self, chain_id: int, address: str) -> Optional[Tuple[str, Any, Any]]:
+        """Return (status, abi, source) seperti get_verification_status, atau None kalau miss/kedaluwarsa."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT verified, status, abi, source, fetched_at FROM verified_contracts WHERE chain_id = ? AND address = ?",
+                    (chain_id, address.lower()),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logging.warning(f"Verification cache read failed: {e}")
+            return None
+        if row is None or (not row[0] and time.time() - row[4] > self.negative_ttl):
+            self.misses += 1
+            return None
+        verified, status, abi, source, _ = row
+        try:
+            result = status, (json.loads(abi) if abi else None), (json.loads(source) if source else None)
+        except (TypeError, ValueError) as e:
+            # Row korup: perlakukan sebagai miss, nanti ditimpa oleh hasil fetch baru
+            logging.warning(f"Verification cache row for {address} is corrupt: {e}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, chain_id: int, address: str, status: str, abi: Any, source: Any, origin: Optional[str] = None):
+        verified = abi is not None
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO verified_contracts (chain_id, address, verified, status, origin, abi, source, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (chain_id, address.lower(), int(verified), status, origin,
+                     json.dumps(abi) if verified else None, json.dumps(source) if verified and source is not None else None, time.time()),
+                )
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logging.warning(f"Verification cache write failed: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None